@@ -54,6 +54,28 @@ def get_all_keywords() -> List[str]:
     return unique_keywords
 
 
+def get_keyword_categories() -> Dict[str, str]:
+    """
+    Get the category of each keyword in keywords.yaml
+    Returns lowercased keyword -> primary_keywords category or "port_operations"
+    (the first category wins for keywords listed twice)
+    """
+    config = load_yaml('keywords.yaml')
+    categories = {}
+    
+    for category, keyword_list in (config.get('primary_keywords', {}) or {}).items():
+        if isinstance(keyword_list, list):
+            for kw in keyword_list:
+                categories.setdefault(kw.lower(), category)
+    
+    port_ops = config.get('port_operations', [])
+    if isinstance(port_ops, list):
+        for kw in port_ops:
+            categories.setdefault(kw.lower(), 'port_operations')
+    
+    return categories
+
+
 def get_rss_feeds() -> List[str]:
     """
     Get all enabled RSS feed URLs from sources.yaml
@@ -98,6 +120,28 @@ def get_tech_news_config() -> Dict:
     }
 
 
+def get_relevance_keywords() -> List[str]:
+    """
+    Get the keywords entries are scored against
+    Returns all keywords from keywords.yaml plus every tech news search topic
+    """
+    keywords = get_all_keywords()
+    config = load_yaml('sources.yaml')
+    for source_config in (config.get('tech_news') or {}).values():
+        if isinstance(source_config, dict):
+            keywords.extend(source_config.get('search_topics', []))
+    return keywords
+
+
+def get_relevance_config() -> Dict:
+    """
+    Get keyword relevance settings from schedule.yaml
+    Returns min_score and title_weight
+    """
+    config = load_yaml('schedule.yaml')
+    return config.get('scraping', {}).get('relevance', {}) or {}
+
+
 def get_academic_config() -> Dict:
     """
     Get academic sources configuration
@@ -111,11 +155,121 @@ def get_academic_config() -> Dict:
     logger.info(f"Loaded academic config: {len(categories)} arXiv categories")
     return {
         'categories': categories,
+        'max_results': arxiv_config.get('max_results', 100),
+        'max_pages': arxiv_config.get('max_pages', 5),
         'arxiv_enabled': arxiv_config.get('enabled', True),
         'ieee_enabled': academic.get('ieee', {}).get('enabled', False)
     }
 
 
+def get_rate_limit_config() -> Dict[str, float]:
+    """
+    Get per-source rate limits from schedule.yaml
+    Values are seconds between requests to the same host
+    """
+    config = load_yaml('schedule.yaml')
+    return config.get('scraping', {}).get('rate_limit', {}) or {}
+
+
+def get_connection_pool_config() -> Dict:
+    """
+    Get HTTP connection pool sizing from schedule.yaml
+    Returns pool_connections, pool_maxsize and per-host pool_maxsize overrides
+    """
+    config = load_yaml('schedule.yaml')
+    return config.get('scraping', {}).get('connection_pool', {}) or {}
+
+
+def get_response_cache_config() -> Dict:
+    """
+    Get on-disk response cache settings from schedule.yaml
+    Returns max_size_mb and per-source ttl_hours
+    """
+    config = load_yaml('schedule.yaml')
+    return config.get('scraping', {}).get('response_cache', {}) or {}
+
+
+def get_host_concurrency_config() -> Dict:
+    """
+    Get adaptive per-host concurrency settings from schedule.yaml
+    Returns default and per-host initial/min/max limits and decrease_factor
+    """
+    config = load_yaml('schedule.yaml')
+    return config.get('scraping', {}).get('host_concurrency', {}) or {}
+
+
+def get_circuit_breaker_config() -> Dict:
+    """
+    Get per-host circuit breaker settings from schedule.yaml
+    Returns failure_threshold, cool-down bounds and report_after_runs
+    """
+    config = load_yaml('schedule.yaml')
+    return config.get('scraping', {}).get('circuit_breaker', {}) or {}
+
+
+def get_deadline_config() -> Dict:
+    """
+    Get scraping time budgets from schedule.yaml
+    Returns run_budget_seconds, reserve_seconds and per-scraper budgets
+    """
+    config = load_yaml('schedule.yaml')
+    return config.get('scraping', {}).get('deadline', {}) or {}
+
+
+def get_source_interval_config() -> Dict[str, float]:
+    """
+    Get per-source scrape intervals from schedule.yaml
+    Returns source -> minutes between runs (and a default)
+    """
+    config = load_yaml('schedule.yaml')
+    return config.get('scraping', {}).get('interval_minutes', {}) or {}
+
+
+def get_feed_polling_config() -> Dict:
+    """
+    Get adaptive RSS feed polling settings from schedule.yaml
+    Returns min_minutes, max_minutes, target_items, smoothing and empty_backoff
+    """
+    config = load_yaml('schedule.yaml')
+    return config.get('scraping', {}).get('feed_polling', {}) or {}
+
+
+def get_keyword_rotation_config() -> Dict:
+    """
+    Get keyword rotation settings from schedule.yaml
+    Returns cycle_hours, per-source batch_size and category_weights
+    """
+    config = load_yaml('schedule.yaml')
+    return config.get('scraping', {}).get('keyword_rotation', {}) or {}
+
+
+def get_dedup_config() -> Dict:
+    """
+    Get cross-run URL dedup settings from schedule.yaml
+    Returns ttl_days, bloom_capacity, bloom_error_rate and refresh_seconds
+    """
+    config = load_yaml('schedule.yaml')
+    return config.get('scraping', {}).get('dedup', {}) or {}
+
+
+def get_near_duplicate_config() -> Dict:
+    """
+    Get near-duplicate detection settings from schedule.yaml
+    Returns min_similarity, min_words, ttl_days and refresh_seconds
+    """
+    config = load_yaml('schedule.yaml')
+    return config.get('scraping', {}).get('near_duplicates', {}) or {}
+
+
+def get_body_limit_config() -> Dict[str, float]:
+    """
+    Get streamed body size caps from schedule.yaml
+    Returns content type -> max size in MB
+    """
+    config = load_yaml('schedule.yaml')
+    return config.get('scraping', {}).get('max_body_mb', {}) or {}
+
+
 def get_scraping_config() -> Dict:
     """
     Get complete scraping configuration
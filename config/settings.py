@@ -6,6 +6,9 @@ from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
+# Project root, used for local state defaults
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 class Settings(BaseSettings):
     """
@@ -13,7 +16,13 @@ class Settings(BaseSettings):
     """
     
     # Scraping Settings
-    SCRAPE_INTERVAL_MINUTES: int = Field(default=300, description="Scrape interval in minutes (5 hours)")
+    SCRAPE_INTERVAL_MINUTES: int = Field(default=300, description="Default per-source scrape interval in minutes (5 hours)")
+    ASYNC_SCRAPING: bool = Field(default=False, description="Run scrapers through their async (httpx) variants")
+    HTML_EXTRACTION_BACKEND: str = Field(default="lxml", description="HTML extraction backend: lxml or bs4")
+    INCREMENTAL_SCRAPING: bool = Field(default=True, description="Skip entries seen in earlier runs (per-source high-water marks)")
+    ADAPTIVE_POLLING: bool = Field(default=True, description="Poll each RSS / tech news feed on an interval learned from its publish rate")
+    PARSE_POOL_WORKERS: int = Field(default=0, description="Processes for CPU-bound HTML/XML parsing (0 = parse in the calling thread)")
+    LOCAL_CACHE_DIR: str = Field(default=os.path.join(PROJECT_ROOT, ".cache"), description="Local fallback/cache storage")
     
     # Redis Settings
     REDIS_HOST: str = Field(default="localhost")
@@ -13,6 +13,7 @@ def formatter_node(state: GraphState) -> GraphState:
             "source": doc["source"],
             "title": doc["title"],
             "text": doc["text"],
+            "alternate_urls": doc.get("alternate_urls", []),
             "scraping_date": now_iso8601(),
             "is_processed": False
         })
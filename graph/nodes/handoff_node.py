@@ -1,7 +1,12 @@
 from graph.state import GraphState
-from storage.redis_client import save_last_scrape_time
+from storage.redis_client import save_source_last_run_times
 from storage.rabbitmq_client import publish_batch
 from monitoring.metrics import record_batch_handoff
+from scrapers.utils.dedup_index import dedup_index
+from scrapers.utils.near_duplicates import near_duplicate_index
+from scrapers.utils.high_water_mark import high_water_marks
+from scrapers.utils.conditional_get import feed_validator_cache
+from scrapers.utils.feed_stats import feed_stats
 from datetime import datetime
 import uuid
 
@@ -9,16 +14,30 @@ import uuid
 def handoff_node(state: GraphState) -> GraphState:
     batch_id = f"batch_{uuid.uuid4().hex}"
 
-    save_last_scrape_time(datetime.utcnow())
+    # Signals published by an earlier run (or another scraper) are not sent again
+    signals = dedup_index.filter_new(state["signals"], stage="handoff")
 
-    publish_batch({
+    published = publish_batch({
         "batch_id": batch_id,
-        "signals_count": len(state["signals"]),
-        "signals": state["signals"]
+        "signals_count": len(signals),
+        "signals": signals
     })
+    if published:
+        # Sources that crashed or missed the deadline stay due for the next run
+        save_source_last_run_times(state.get("completed_sources", []), datetime.utcnow())
+        # Alternate URLs were covered by their representative's signal
+        dedup_index.add(url for signal in signals for url in [signal["url"], *signal.get("alternate_urls", [])])
+        near_duplicate_index.add(signals)
+        # Entries are only skipped by later runs once Graph 2 has them
+        for mark in state.get("pending_marks", []):
+            high_water_marks.advance(**mark)
+        for validators in state.get("pending_validators", []):
+            feed_validator_cache.save(**validators)
+        for poll in state.get("pending_polls", []):
+            feed_stats.record_poll(**poll)
 
     # Record metrics
-    record_batch_handoff(len(state["signals"]))
+    record_batch_handoff(len(signals))
 
     return {
         "batch_id": batch_id
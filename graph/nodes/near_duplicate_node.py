@@ -0,0 +1,10 @@
+from graph.state import GraphState
+from scrapers.utils.near_duplicates import near_duplicate_index
+
+
+def near_duplicate_node(state: GraphState) -> GraphState:
+    # One document per cluster of near-identical texts (syndicated copies),
+    # with the other copies' URLs in alternate_urls
+    return {
+        "valid_documents": near_duplicate_index.collapse(state["valid_documents"])
+    }
@@ -1,21 +1,52 @@
-from graph.state import GraphState
-from storage.redis_client import get_last_scrape_time
+from graph.state import GraphState, SCRAPER_SOURCES
+from storage.redis_client import get_last_scrape_time, get_source_last_run_times
+from config.loader import get_source_interval_config
 from config.settings import SCRAPE_INTERVAL_MINUTES
+from utils.logger import setup_logger
 from datetime import datetime, timedelta
+from typing import List
+
+logger = setup_logger(__name__)
+
+
+def get_due_sources(now: datetime) -> List[str]:
+    """
+    Sources whose scrape interval has elapsed since their last run
+
+    Sources without a run of their own are due now (they have never
+    completed, e.g. they missed the deadline). Only when no source has a run
+    of its own yet, right after the switch from the global schedule, the
+    global last scrape time stands in for all of them.
+    """
+    intervals = get_source_interval_config()
+    default_interval = intervals.get('default', SCRAPE_INTERVAL_MINUTES)
+    last_runs = get_source_last_run_times()
+    migrating = not last_runs
+    last_scrape = get_last_scrape_time() if migrating else None
+
+    due = []
+    for source in SCRAPER_SOURCES:
+        last_run = last_runs.get(source, last_scrape)
+        interval = timedelta(minutes=intervals.get(source, default_interval))
+        if last_run is None or now - last_run >= interval:
+            due.append(source)
+        else:
+            logger.info(f"[ORCHESTRATOR] {source} not due until {(last_run + interval).isoformat()}")
+    return due
 
 
 def orchestrator_node(state: GraphState) -> GraphState:
-    last_scrape = get_last_scrape_time()
+    due_sources = get_due_sources(datetime.utcnow())
 
-    if last_scrape:
-        delta = datetime.utcnow() - last_scrape
-        if delta < timedelta(minutes=SCRAPE_INTERVAL_MINUTES):
-            return {
-                "action": "skip"
-            }
+    if not due_sources:
+        return {
+            "action": "skip"
+        }
 
+    logger.info(f"[ORCHESTRATOR] Due sources: {', '.join(due_sources)}")
     return {
         "action": "proceed",
+        "due_sources": due_sources,
         "sources": state.get("sources", []),
         "keywords": state.get("keywords", [])
     }
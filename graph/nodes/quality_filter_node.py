@@ -1,9 +1,11 @@
 from graph.state import GraphState
 from utils.validators import is_valid_url
+from scrapers.utils.url_validator import canonical_url
 
 
 def quality_filter_node(state: GraphState) -> GraphState:
     valid_docs = []
+    seen_urls = set()
 
     for doc in state["raw_documents"]:
         if not doc.get("title"):
@@ -14,7 +16,12 @@ def quality_filter_node(state: GraphState) -> GraphState:
             continue
         if not doc.get("published_date"):
             continue
+        # The same document found by several scrapers / under several spellings
+        url = canonical_url(doc["url"])
+        if url in seen_urls:
+            continue
 
+        seen_urls.add(url)
         valid_docs.append(doc)
 
     return {
@@ -2,129 +2,264 @@
 Scraping node - executes all scrapers and collects raw documents
 Loads configuration dynamically from YAML files
 """
-from concurrent.futures import ThreadPoolExecutor
-from typing import List, Dict
-from graph.state import GraphState
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import List, Dict, Optional
+import asyncio
+from graph.state import GraphState, SCRAPER_SOURCES
 from scrapers.tools.patent_scraper import PatentScraperTool
 from scrapers.tools.lens_scraper import LensScraperTool
 from scrapers.tools.rss_scraper import RSSScraperTool
 from scrapers.tools.tech_news_scraper import TechNewsScraperTool
 from scrapers.tools.academic_scraper import AcademicScraperTool
-from config.loader import get_scraping_config
+from scrapers.tools.base_scraper import BaseScraperTool
+from config.loader import get_scraping_config, get_deadline_config
+from config.settings import settings
 from utils.logger import setup_logger
+from utils.deadline import Deadline
 from storage.s3_client import s3_client
-from monitoring.metrics import record_scraping_result
+from scrapers.utils.url_validator import canonical_url
+from scrapers.utils.session_registry import session_registry
+from scrapers.utils.response_cache import response_cache
+from scrapers.utils.circuit_breaker import circuit_breaker
+from scrapers.utils.keyword_rotation import keyword_rotation
+from scrapers.utils.single_flight import single_flight
+from monitoring.metrics import record_scraping_result, record_run_tls_handshakes, record_deadline_miss
 import uuid
 
 logger = setup_logger(__name__)
 
+# Scrapers must wrap up this long (at most 10% of the budget) before the node
+# stops waiting for them, so their partial results still make it into the run
+SCRAPER_GRACE_SECONDS = 30
+
+
+def _run_scraper(scraper: BaseScraperTool, deadline: Optional[Deadline] = None, **kwargs) -> List[Dict]:
+    """
+    Run a scraper in sync or async mode depending on settings.ASYNC_SCRAPING
+    Each scraping thread gets its own event loop in async mode
+    """
+    if settings.ASYNC_SCRAPING:
+        return asyncio.run(scraper.arun(deadline=deadline, **kwargs))
+    return scraper.run(deadline=deadline, **kwargs)
+
+
+def _scraping_deadline(state: GraphState) -> Deadline:
+    """
+    Deadline for the scraping phase
+    Derived from the run deadline in the state (set by the Celery task), minus
+    the time reserved for filtering, formatting and handoff
+    """
+    config = get_deadline_config()
+    if state.get("deadline_at"):
+        run_deadline = Deadline(state["deadline_at"])
+    else:
+        run_deadline = Deadline.after(config.get('run_budget_seconds', 3300))
+    return run_deadline.sub(reserve=config.get('reserve_seconds', 300))
+
+
 def scraping_node(state: GraphState) -> GraphState:
     """
-    Execute all scrapers in parallel and collect raw documents
+    Execute the due scrapers in parallel and collect raw documents
+    Runs the sources in state["due_sources"] (set by the orchestrator), all when absent
+    
+    Each job returns its documents and the scrapers it ran. Their
+    pending_marks, pending_validators and pending_polls are passed on to the
+    handoff, and completed_sources lists the sources that finished within
+    their deadline without failing; scrapers that missed the deadline are
+    dropped entirely
     """
     documents = []
+    pending_marks = []
+    pending_validators = []
+    pending_polls = []
+    completed_sources = []
+    tls_handshakes_before = session_registry.new_connection_count('https')
+    cache_stats_before = response_cache.stats()
+    duplicates_avoided_before = single_flight.stats()['duplicates_avoided']
     
     # Load configuration from YAML files
     config = get_scraping_config()
+    scraping_deadline = _scraping_deadline(state)
+    scraper_budgets = get_deadline_config().get('scrapers', {}) or {}
     
-    import random
     keywords = state.get("keywords") or config.get('keywords', [])
-    # Shuffle keywords to ensure we don't always pick the same ones for the [:15] limit
-    random_keywords = list(keywords)
-    random.shuffle(random_keywords)
     rss_feeds = state.get("sources") or config.get('rss_feeds', [])
     tech_config = config.get('tech_news', {})
     academic_config = config.get('academic', {})
+    due_sources = state.get("due_sources") or list(SCRAPER_SOURCES)
     
     logger.info("=" * 60)
     logger.info("SCRAPING NODE STARTED (PARALLEL MODE)")
+    logger.info(f"Sources: {', '.join(due_sources)}")
     logger.info(f"Keywords: {len(keywords)}")
     logger.info(f"RSS Feeds: {len(rss_feeds)}")
+    logger.info(f"Deadline: {scraping_deadline.remaining():.0f}s")
     logger.info("=" * 60)
     
-    def run_patent_scrapers():
+    def run_patent_scrapers(deadline: Deadline):
         try:
             results = []
+            searched = []
+            ran = []
+            # Each keyword gets its turn once per rotation cycle
+            patent_keywords = keyword_rotation.next_batch("patents", keywords)
             
             # 1. Google Patents
             try:
                 google_scraper = PatentScraperTool()
-                # Use a larger sample of keywords, prioritized by type
-                results.extend(google_scraper.run(keywords=random_keywords[:15], days_back=30))
+                results.extend(_run_scraper(google_scraper, deadline=deadline, keywords=patent_keywords, days_back=30))
+                searched.extend(google_scraper.searched_keywords)
+                ran.append(google_scraper)
             except Exception as e:
                 logger.error(f"Google Patent scraper failed: {e}")
             
             # 2. Lens.org fallback
-            if not results:
+            if not results and not deadline.expired():
                 logger.info("[SCRAPING] No results from Google Patents, trying Lens.org...")
                 try:
                     lens_scraper = LensScraperTool()
-                    results.extend(lens_scraper.run(keywords=random_keywords[:15], days_back=30))
+                    results.extend(_run_scraper(lens_scraper, deadline=deadline, keywords=patent_keywords, days_back=30))
+                    searched.extend(lens_scraper.searched_keywords)
+                    ran.append(lens_scraper)
                 except Exception as e:
                     logger.error(f"Lens.org scraper failed: {e}")
             
-            return results
+            keyword_rotation.mark_searched("patents", searched)
+            return results, ran
         except Exception as e:
             logger.error(f"All patent scrapers failed: {e}")
-            return []
+            return [], []
 
-    def run_rss_scraper():
+    def run_rss_scraper(deadline: Deadline):
         try:
             scraper = RSSScraperTool()
-            return scraper.run(feed_urls=rss_feeds, days_back=7)
+            docs = _run_scraper(scraper, deadline=deadline, feed_urls=rss_feeds, days_back=7)
+            return docs, [scraper]
         except Exception as e:
             logger.error(f"RSS scraper failed: {e}")
-            return []
+            return [], []
 
-    def run_tech_scraper():
+    def run_tech_scraper(deadline: Deadline):
         try:
             scraper = TechNewsScraperTool()
-            topics = tech_config.get('topics', random_keywords[:15])
             sources = tech_config.get('sources', ['techcrunch', 'venturebeat'])
-            return scraper.run(topics=topics, sources=sources, days_back=7)
+            if tech_config.get('topics'):
+                docs = _run_scraper(scraper, deadline=deadline, topics=tech_config['topics'],
+                                    sources=sources, days_back=7)
+                return docs, [scraper]
+            # No configured topics: filter on a rotating batch of the keywords
+            topics = keyword_rotation.next_batch("tech_news", keywords)
+            docs = _run_scraper(scraper, deadline=deadline, topics=topics, sources=sources, days_back=7)
+            # Topics of a failed or cut-short run keep their priority
+            if not scraper.failed and not deadline.expired():
+                keyword_rotation.mark_searched("tech_news", topics)
+            return docs, [scraper]
         except Exception as e:
             logger.error(f"Tech news scraper failed: {e}")
-            return []
+            return [], []
 
-    def run_academic_scraper():
+    def run_academic_scraper(deadline: Deadline):
         try:
             scraper = AcademicScraperTool()
             categories = academic_config.get('categories', ['cs.AI', 'cs.CY', 'cs.LG'])
-            return scraper.run(keywords=random_keywords[:15], categories=categories, days_back=30)
+            # Keywords are batched into a few combined queries, so arXiv gets all of them
+            docs = _run_scraper(scraper, deadline=deadline, keywords=keywords,
+                                categories=categories, days_back=30,
+                                max_results=academic_config.get('max_results'),
+                                max_pages=academic_config.get('max_pages'))
+            return docs, [scraper]
         except Exception as e:
             logger.error(f"Academic scraper failed: {e}")
-            return []
+            return [], []
 
-    # Run scrapers in parallel using ThreadPoolExecutor
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = {
-            executor.submit(run_patent_scrapers): "Patents",
-            executor.submit(run_rss_scraper): "RSS",
-            executor.submit(run_tech_scraper): "Tech News",
-            executor.submit(run_academic_scraper): "Academic"
-        }
-        
-        for future in futures:
-            name = futures[future]
+    # Run scrapers in parallel, each with its own sub-deadline
+    scraper_jobs = {
+        "Patents": ("patents", run_patent_scrapers),
+        "RSS": ("rss", run_rss_scraper),
+        "Tech News": ("tech_news", run_tech_scraper),
+        "Academic": ("academic", run_academic_scraper)
+    }
+    # Not a `with` block: leaving it would wait for scrapers that overran
+    executor = ThreadPoolExecutor(max_workers=4)
+    futures = {}
+    grace = min(SCRAPER_GRACE_SECONDS, scraping_deadline.remaining() * 0.1)
+    for name, (key, job) in scraper_jobs.items():
+        if key not in due_sources:
+            continue
+        deadline = scraping_deadline.sub(scraper_budgets.get(key), reserve=grace)
+        futures[executor.submit(job, deadline)] = (name, key, deadline)
+    
+    try:
+        # Consume results as scrapers finish, not in submission order
+        for future in as_completed(futures, timeout=scraping_deadline.remaining()):
+            name, key, deadline = futures[future]
             try:
-                docs = future.result()
+                docs, scrapers = future.result()
                 documents.extend(docs)
+                for scraper in scrapers:
+                    pending_marks.extend(scraper.pending_marks)
+                    pending_validators.extend(scraper.pending_validators)
+                    pending_polls.extend(scraper.pending_polls)
                 logger.info(f"{name} scraper: {len(docs)} documents")
                 
                 # Record metrics
                 record_scraping_result(name, len(docs))
+                if deadline.expired():
+                    logger.warning(f"{name} scraper hit its deadline, results are partial")
+                    record_deadline_miss(name)
+                elif any(not scraper.failed for scraper in scrapers):
+                    completed_sources.append(key)
                 
-                # Persist raw documents to S3
+                # Persist raw documents to S3 (one object per document and day)
                 for doc in docs:
-                    doc_id = str(uuid.uuid4())
+                    doc_id = str(uuid.uuid5(uuid.NAMESPACE_URL, canonical_url(doc['url'])))
                     s3_client.upload_document(doc_id, doc)
             except Exception as e:
                 logger.error(f"{name} scraper thread failed: {e}")
+    except FuturesTimeoutError:
+        for future, (name, _, _) in futures.items():
+            if not future.done():
+                logger.error(f"{name} scraper missed the scraping deadline, continuing without it")
+                record_deadline_miss(name)
+    finally:
+        # Stragglers stop at their own deadlines; don't block the graph on them
+        executor.shutdown(wait=False, cancel_futures=True)
 
+    # New TLS handshakes this run (pooled connections reused from earlier runs are free)
+    tls_handshakes = session_registry.new_connection_count('https') - tls_handshakes_before
+    record_run_tls_handshakes(tls_handshakes)
+    
+    cache_stats = {k: v - cache_stats_before[k] for k, v in response_cache.stats().items()}
+    cache_lookups = cache_stats['hits'] + cache_stats['misses']
+    cache_hit_ratio = cache_stats['hits'] / cache_lookups if cache_lookups else 0.0
+    duplicates_avoided = single_flight.stats()['duplicates_avoided'] - duplicates_avoided_before
+    
     logger.info("=" * 60)
     logger.info(f"TOTAL RAW DOCUMENTS COLLECTED: {len(documents)}")
+    logger.info(f"New TLS handshakes this run: {tls_handshakes}")
+    logger.info(
+        f"Response cache: hit ratio {cache_hit_ratio:.0%} ({cache_stats['hits']}/{cache_lookups}), "
+        f"{cache_stats['bytes_saved']} bytes saved, {cache_stats['evictions']} evictions"
+    )
+    logger.info(f"Duplicate fetches avoided (single-flight): {duplicates_avoided}")
     logger.info("=" * 60)
     
+    # Sources with no successful request for several runs in a row
+    try:
+        failing_sources = circuit_breaker.end_run()
+    except Exception as e:
+        logger.error(f"Could not update source health: {e}")
+        failing_sources = []
+    for source in failing_sources:
+        logger.warning(
+            f"Source {source['source']} failing for {source['failed_runs']} consecutive runs "
+            f"(circuit {source['state']}): {source['last_error']}"
+        )
+    
     return {
-        "raw_documents": documents
+        "raw_documents": documents,
+        "pending_marks": pending_marks,
+        "pending_validators": pending_validators,
+        "pending_polls": pending_polls,
+        "completed_sources": completed_sources
     }
@@ -1,4 +1,7 @@
-from typing import TypedDict, List, Optional, Dict, Any
+from typing import TypedDict, List, Optional, Dict, Any, NotRequired
+
+# Scraper groups run by the scraping node, scheduled independently
+SCRAPER_SOURCES = ("patents", "rss", "tech_news", "academic")
 
 
 class RawDocument(TypedDict):
@@ -7,6 +10,7 @@ class RawDocument(TypedDict):
     title: str
     text: str
     published_date: str
+    alternate_urls: NotRequired[List[str]]   # Near-duplicate copies elsewhere
 
 
 class Signal(TypedDict):
@@ -15,6 +19,7 @@ class Signal(TypedDict):
     source: str
     title: str
     text: str
+    alternate_urls: List[str]
     scraping_date: str
     is_processed: bool
 
@@ -22,11 +27,16 @@ class Signal(TypedDict):
 class GraphState(TypedDict, total=False):
     # Orchestrator output
     action: str                     # "proceed" | "skip"
+    due_sources: List[str]          # SCRAPER_SOURCES whose interval elapsed
     sources: List[str]
     keywords: List[str]
 
     # Scraping
     raw_documents: List[RawDocument]
+    completed_sources: List[str]    # Due sources whose scrapers finished in time, recorded as run once published
+    pending_marks: List[Dict[str, Any]]   # High-water mark advances, applied once the batch is published
+    pending_validators: List[Dict[str, Any]]   # Feed ETag / Last-Modified, saved with them
+    pending_polls: List[Dict[str, Any]]   # Feed polls for adaptive polling, recorded with them
 
     # Filtering
     valid_documents: List[RawDocument]
@@ -36,3 +46,4 @@ class GraphState(TypedDict, total=False):
 
     # Metadata
     batch_id: str
+    deadline_at: float              # Epoch seconds by which the run must finish
@@ -3,6 +3,7 @@ from graph.state import GraphState
 from graph.nodes.orchestrator_node import orchestrator_node
 from graph.nodes.scraping_node import scraping_node
 from graph.nodes.quality_filter_node import quality_filter_node
+from graph.nodes.near_duplicate_node import near_duplicate_node
 from graph.nodes.formatter_node import formatter_node
 from graph.nodes.handoff_node import handoff_node
 from graph.router import route_on_action
@@ -14,7 +15,7 @@ def build_scraping_graph():
     
     Flow:
     START → Orchestrator → [Scraping | END]
-    Scraping → Quality Filter → Formatter → Handoff → END
+    Scraping → Quality Filter → Near-Duplicates → Formatter → Handoff → END
     """
 
     graph = StateGraph(GraphState)
@@ -22,6 +23,7 @@ def build_scraping_graph():
     graph.add_node("orchestrator", orchestrator_node)
     graph.add_node("scraping", scraping_node)
     graph.add_node("quality_filter", quality_filter_node)
+    graph.add_node("near_duplicate", near_duplicate_node)
     graph.add_node("formatter", formatter_node)
     graph.add_node("handoff", handoff_node)
 
@@ -37,7 +39,8 @@ def build_scraping_graph():
     )
 
     graph.add_edge("scraping", "quality_filter")
-    graph.add_edge("quality_filter", "formatter")
+    graph.add_edge("quality_filter", "near_duplicate")
+    graph.add_edge("near_duplicate", "formatter")
     graph.add_edge("formatter", "handoff")
     graph.add_edge("handoff", END)
 
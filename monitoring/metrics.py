@@ -1,6 +1,7 @@
 """
 Prometheus metrics for scraping engine
 """
+from typing import Optional
 from prometheus_client import Counter, Gauge, Summary, start_http_server
 from utils.logger import setup_logger
 
@@ -29,6 +30,144 @@ SIGNAL_BATCH_SIZE = Summary(
     'Number of signals in a handoff batch'
 )
 
+CONDITIONAL_GET_REQUESTS = Counter(
+    'scraper_conditional_get_total',
+    'Feed fetches by conditional GET outcome (hit = 304 Not Modified)',
+    ['source', 'result']
+)
+
+HTTP_NEW_CONNECTIONS = Counter(
+    'scraper_http_new_connections_total',
+    'New (non-reused) HTTP connections opened by the pooled sessions',
+    ['scheme']
+)
+
+TLS_HANDSHAKES_LAST_RUN = Gauge(
+    'scraper_tls_handshakes_last_run',
+    'New TLS connections opened during the last scraping run'
+)
+
+RESPONSE_CACHE_LOOKUPS = Counter(
+    'scraper_response_cache_total',
+    'Full-text response cache lookups',
+    ['result']
+)
+
+RESPONSE_CACHE_BYTES_SAVED = Counter(
+    'scraper_response_cache_bytes_saved_total',
+    'Response bytes served from the on-disk cache instead of the network'
+)
+
+RESPONSE_CACHE_EVICTIONS = Counter(
+    'scraper_response_cache_evictions_total',
+    'Entries evicted from the on-disk response cache (LRU)'
+)
+
+HOST_CONCURRENCY_LIMIT = Gauge(
+    'scraper_host_concurrency_limit',
+    'Current adaptive (AIMD) concurrency limit per host',
+    ['host']
+)
+
+CIRCUIT_STATE = Gauge(
+    'scraper_circuit_state',
+    'Circuit breaker state per host (0=closed, 1=half-open, 2=open)',
+    ['host']
+)
+
+CIRCUIT_SKIPS = Counter(
+    'scraper_circuit_skipped_total',
+    'Requests refused because the host circuit was open',
+    ['host']
+)
+
+SOURCE_FAILED_RUNS = Gauge(
+    'scraper_source_consecutive_failed_runs',
+    'Consecutive scraping runs without a successful request to the source host',
+    ['source']
+)
+
+SCRAPER_DEADLINE_MISSES = Counter(
+    'scraper_deadline_misses_total',
+    'Scrapers that hit their deadline (partial results) or were abandoned at the scraping deadline',
+    ['scraper']
+)
+
+HTTP_DUPLICATE_FETCHES_AVOIDED = Counter(
+    'scraper_http_duplicate_fetches_avoided_total',
+    'Fetches that joined an identical in-flight request instead of hitting the network'
+)
+
+HTTP_BODY_LIMIT_EVENTS = Counter(
+    'scraper_http_body_limit_total',
+    'Streamed responses cut at the byte cap (truncated) or refused by content type (rejected)',
+    ['result', 'content_type']
+)
+
+PARSE_TASKS = Counter(
+    'scraper_parse_tasks_total',
+    'HTML/XML parsing tasks by where they ran (process pool or calling thread)',
+    ['mode']
+)
+
+DEDUP_CHECKS = Counter(
+    'scraper_dedup_checks_total',
+    'Documents checked against the cross-run URL dedup index',
+    ['source', 'stage', 'result']
+)
+
+DEDUP_BLOOM_BYTES = Gauge(
+    'scraper_dedup_bloom_bytes',
+    'Memory held by the dedup Bloom filter bit array'
+)
+
+DEDUP_BLOOM_ITEMS = Gauge(
+    'scraper_dedup_bloom_items',
+    'URLs added to the dedup Bloom filter'
+)
+
+RELEVANCE_CHECKS = Counter(
+    'scraper_relevance_checks_total',
+    'Feed entries scored against the keyword list',
+    ['source', 'result']
+)
+
+FEED_POLLS = Counter(
+    'scraper_feed_polls_total',
+    'RSS feed polls (polled) and feeds skipped because their next poll was not due (skipped)',
+    ['result']
+)
+
+FEED_POLL_ITEMS = Counter(
+    'scraper_feed_poll_items_total',
+    'New entries per feed predicted from its publish rate (expected) and found (actual)',
+    ['feed', 'kind']
+)
+
+FEED_POLL_INTERVAL = Gauge(
+    'scraper_feed_poll_interval_seconds',
+    'Time until the next poll of a feed, from its publish rate and empty polls',
+    ['feed']
+)
+
+KEYWORDS_OVERDUE = Gauge(
+    'scraper_keywords_overdue',
+    'Keywords not searched within the rotation cycle, per searching source',
+    ['source']
+)
+
+KEYWORD_OLDEST_SEARCH_AGE = Gauge(
+    'scraper_keyword_oldest_search_age_seconds',
+    'Time since the least recently searched keyword was searched, per searching source',
+    ['source']
+)
+
+NEAR_DUPLICATES = Counter(
+    'scraper_near_duplicates_total',
+    'Documents collapsed into a near-identical document',
+    ['source', 'match']
+)
+
 
 def start_metrics_server(port: int = 8000):
     """
@@ -55,3 +194,164 @@ def record_batch_handoff(size: int):
     """
     SIGNAL_BATCH_SIZE.observe(size)
     LAST_SCRAPE_TIMESTAMP.set_to_current_time()
+
+
+def record_conditional_get(source: str, not_modified: bool):
+    """
+    Record a conditional feed fetch (hit when the server answered 304)
+    """
+    result = "hit" if not_modified else "miss"
+    CONDITIONAL_GET_REQUESTS.labels(source=source, result=result).inc()
+
+
+def record_new_connection(scheme: str):
+    """
+    Record a newly opened pooled connection
+    """
+    HTTP_NEW_CONNECTIONS.labels(scheme=scheme).inc()
+
+
+def record_run_tls_handshakes(count: int):
+    """
+    Record how many TLS handshakes a scraping run needed
+    """
+    TLS_HANDSHAKES_LAST_RUN.set(count)
+
+
+def record_response_cache_lookup(hit: bool, size: int = 0):
+    """
+    Record a response cache lookup and the bytes it saved
+    """
+    RESPONSE_CACHE_LOOKUPS.labels(result="hit" if hit else "miss").inc()
+    if hit:
+        RESPONSE_CACHE_BYTES_SAVED.inc(size)
+
+
+def record_response_cache_evictions(count: int):
+    """
+    Record LRU evictions from the response cache
+    """
+    RESPONSE_CACHE_EVICTIONS.inc(count)
+
+
+def record_host_concurrency_limit(host: str, limit: float):
+    """
+    Record a host's current adaptive concurrency limit
+    """
+    HOST_CONCURRENCY_LIMIT.labels(host=host).set(limit)
+
+
+def record_circuit_state(host: str, state: str):
+    """
+    Record a host's circuit breaker state
+    """
+    CIRCUIT_STATE.labels(host=host).set({"closed": 0, "half_open": 1, "open": 2}.get(state, 0))
+
+
+def record_circuit_skip(host: str):
+    """
+    Record a request skipped because of an open circuit
+    """
+    CIRCUIT_SKIPS.labels(host=host).inc()
+
+
+def record_source_failed_runs(source: str, failed_runs: int):
+    """
+    Record how many runs in a row a source has failed
+    """
+    SOURCE_FAILED_RUNS.labels(source=source).set(failed_runs)
+
+
+def record_deadline_miss(scraper: str):
+    """
+    Record a scraper missing its deadline
+    """
+    SCRAPER_DEADLINE_MISSES.labels(scraper=scraper).inc()
+
+
+def record_duplicate_fetch_avoided():
+    """
+    Record a fetch coalesced into an in-flight request for the same URL
+    """
+    HTTP_DUPLICATE_FETCHES_AVOIDED.inc()
+
+
+def record_body_limit(result: str, content_type: str):
+    """
+    Record a streamed response that was truncated or rejected
+    """
+    HTTP_BODY_LIMIT_EVENTS.labels(result=result, content_type=content_type or "unknown").inc()
+
+
+def record_parse_task(mode: str):
+    """
+    Record a parsing task run in the process pool ("process") or inline ("inline")
+    """
+    PARSE_TASKS.labels(mode=mode).inc()
+
+
+def record_dedup_check(source: str, stage: str, new: int, duplicates: int):
+    """
+    Record a dedup index check (stage: "scrape" or "handoff")
+    The dedup rate of a source is duplicate / (new + duplicate)
+    """
+    if new:
+        DEDUP_CHECKS.labels(source=source, stage=stage, result="new").inc(new)
+    if duplicates:
+        DEDUP_CHECKS.labels(source=source, stage=stage, result="duplicate").inc(duplicates)
+
+
+def record_dedup_bloom(size_bytes: int, items: int):
+    """
+    Record the dedup Bloom filter's memory footprint and fill
+    """
+    DEDUP_BLOOM_BYTES.set(size_bytes)
+    DEDUP_BLOOM_ITEMS.set(items)
+
+
+def record_relevance_check(source: str, relevant: int, low: int):
+    """
+    Record keyword relevance scoring of feed entries
+    low entries were below the threshold (no full-text fetch)
+    """
+    if relevant:
+        RELEVANCE_CHECKS.labels(source=source, result="relevant").inc(relevant)
+    if low:
+        RELEVANCE_CHECKS.labels(source=source, result="low").inc(low)
+
+
+def record_near_duplicates(source: str, match: str, count: int = 1):
+    """
+    Record documents dropped as near-duplicates (match: "batch" for copies
+    within the run, "published" for copies of an earlier run's signal)
+    """
+    NEAR_DUPLICATES.labels(source=source, match=match).inc(count)
+
+
+def record_feed_poll(feed: str, expected: Optional[float], actual: int, interval: float):
+    """
+    Record an RSS feed poll and its next poll interval
+    expected is None until the feed's publish rate is known; the yield
+    ratio sums only polls where it was
+    """
+    FEED_POLLS.labels(result="polled").inc()
+    if expected is not None:
+        FEED_POLL_ITEMS.labels(feed=feed, kind="expected").inc(expected)
+        FEED_POLL_ITEMS.labels(feed=feed, kind="actual").inc(actual)
+    FEED_POLL_INTERVAL.labels(feed=feed).set(interval)
+
+
+def record_feed_polls_skipped(count: int):
+    """
+    Record feeds not polled this run because they were not due
+    """
+    FEED_POLLS.labels(result="skipped").inc(count)
+
+
+def record_keyword_rotation(source: str, overdue: int, oldest_age: float):
+    """
+    Record keyword coverage when a source's batch is picked
+    overdue counts keywords never searched or not within the cycle
+    """
+    KEYWORDS_OVERDUE.labels(source=source).set(overdue)
+    KEYWORD_OLDEST_SEARCH_AGE.labels(source=source).set(oldest_age)
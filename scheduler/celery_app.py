@@ -1,9 +1,11 @@
 """
 Celery application configuration
-Schedules scraping to run every 5 hours
+Schedules the scraping workflow every hour; each run scrapes only the
+sources whose interval has elapsed (config/schedule.yaml interval_minutes)
 """
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_shutdown, worker_shutdown
 from config.settings import settings
 
 # Create Celery app
@@ -26,11 +28,11 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,
 )
 
-# Schedule scraping every 5 hours
+# Run the workflow every hour; the orchestrator picks the due sources
 celery_app.conf.beat_schedule = {
-    'run-scraping-every-5-hours': {
+    'run-scraping-every-hour': {
         'task': 'scheduler.tasks.run_scraping_workflow',
-        'schedule': 5 * 60 * 60,  # 5 hours in seconds (18000 seconds)
+        'schedule': 60 * 60,  # 1 hour in seconds, the shortest source interval
         'options': {'queue': 'scraping'}
     },
 }
@@ -44,3 +46,23 @@ celery_app.conf.beat_schedule_alternative = {
         'options': {'queue': 'scraping'}
     },
 }
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def close_http_sessions(**kwargs):
+    """
+    Close pooled keep-alive HTTP connections when a worker (process) exits
+    """
+    from scrapers.utils.session_registry import session_registry
+    session_registry.close_all()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def stop_parse_pool(**kwargs):
+    """
+    Stop parse pool processes when a worker (process) exits
+    """
+    from scrapers.utils.parse_pool import parse_pool
+    parse_pool.shutdown()
@@ -3,7 +3,8 @@ Celery tasks for the scraping workflow
 """
 from scheduler.celery_app import celery_app
 from graph.workflow import build_scraping_graph
-from config.loader import get_scraping_config
+from config.loader import get_scraping_config, get_deadline_config
+from utils.deadline import Deadline
 from utils.logger import setup_logger
 from utils.timestamp import now_iso8601
 
@@ -14,7 +15,7 @@ logger = setup_logger(__name__)
 def run_scraping_workflow(self):
     """
     Main task to run the complete scraping workflow
-    This is scheduled to run every 5 hours
+    Scheduled every hour; runs the sources that are due
     """
     logger.info("=" * 60)
     logger.info("SCHEDULED SCRAPING WORKFLOW STARTED")
@@ -28,10 +29,15 @@ def run_scraping_workflow(self):
         # Build and run the graph
         app = build_scraping_graph()
         
+        # Run budget stays under task_time_limit so collected documents are
+        # handed off before Celery kills the task
+        run_budget = get_deadline_config().get('run_budget_seconds', 3300)
+        
         # Initial state with config
         initial_state = {
             "sources": config.get('rss_feeds', []),
-            "keywords": config.get('keywords', [])
+            "keywords": config.get('keywords', []),
+            "deadline_at": Deadline.after(run_budget).at
         }
         
         # Run the workflow
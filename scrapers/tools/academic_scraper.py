@@ -2,15 +2,76 @@
 Academic paper scraper - REAL scraping from arXiv API
 arXiv provides a free, public API that returns real paper data
 """
-from typing import List, Dict
-from datetime import datetime, timedelta
+from typing import AbstractSet, List, Dict, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import asyncio
+import re
+import httpx
 import requests
-from bs4 import BeautifulSoup
 from .base_scraper import BaseScraperTool
+from scrapers.utils.atom_parser import iter_atom_entries, parse_atom_date
+from scrapers.utils.url_validator import canonical_url
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# arXiv has no documented query-length limit, but long search_query values
+# are rejected or time out; this keeps requests well clear of that
+MAX_QUERY_LENGTH = 1000
+
+
+@dataclass
+class ArxivQuery:
+    """One combined arXiv search: keywords OR-ed together"""
+    keywords: List[str]
+    search_query: str
+    
+    @property
+    def label(self) -> str:
+        """Short description for logs"""
+        if len(self.keywords) == 1:
+            return self.keywords[0]
+        return f"{self.keywords[0]} +{len(self.keywords) - 1} keywords"
+
+
+def plan_arxiv_queries(keywords: List[str], categories: List[str] = None,
+                       max_query_length: int = MAX_QUERY_LENGTH) -> List[ArxivQuery]:
+    """
+    Pack keywords into as few `all:"a" OR all:"b"` queries as fit
+    max_query_length (category filter included)
+    
+    Keywords keep their order and duplicates are dropped (case-insensitive).
+    A keyword too long to share a query is sent on its own.
+    """
+    cat_filter = ' OR '.join(f'cat:{cat}' for cat in categories or [])
+    
+    def build(terms: List[str]) -> str:
+        query = ' OR '.join(terms)
+        if cat_filter:
+            query = f'({query}) AND ({cat_filter})'
+        return query
+    
+    queries = []
+    group, terms = [], []
+    seen = set()
+    for keyword in keywords:
+        keyword = ' '.join(keyword.replace('"', ' ').split())
+        if not keyword or keyword.lower() in seen:
+            continue
+        seen.add(keyword.lower())
+        
+        term = f'all:"{keyword}"'
+        if terms and len(build(terms + [term])) > max_query_length:
+            queries.append(ArxivQuery(group, build(terms)))
+            group, terms = [], []
+        group.append(keyword)
+        terms.append(term)
+    
+    if terms:
+        queries.append(ArxivQuery(group, build(terms)))
+    return queries
+
 
 class AcademicScraperTool(BaseScraperTool):
     """
@@ -23,147 +84,237 @@ class AcademicScraperTool(BaseScraperTool):
     
     ARXIV_API_URL = "http://export.arxiv.org/api/query"
     
-    def scrape(self, keywords: List[str], categories: List[str] = None, days_back: int = 30) -> List[Dict]:
+    source_key = "academic"
+    
+    # arXiv asks API clients to keep a single connection open
+    async_max_per_host = 1
+    
+    # Defaults for sources.yaml academic.arxiv max_results / max_pages
+    DEFAULT_PAGE_SIZE = 100
+    DEFAULT_MAX_PAGES = 5
+    
+    def scrape(self, keywords: List[str], categories: List[str] = None, days_back: int = 30,
+               max_results: int = None, max_pages: int = None) -> List[Dict]:
         """
         Scrape REAL papers from arXiv
         
+        Keywords are packed into combined OR queries (see plan_arxiv_queries)
+        and each query is paged until results fall past days_back, or past
+        the query's high-water mark; papers delivered by earlier runs are
+        skipped.
+        
         Args:
             keywords: Search keywords
             categories: arXiv categories (e.g., ["cs.AI", "cs.CY"])
             days_back: Papers from last N days
+            max_results: Page size of each API request
+            max_pages: Max pages fetched per query
         
         Returns:
-            List of REAL paper documents from arXiv
+            List of REAL paper documents from arXiv, with matched_keywords
         """
         results = []
         
         if categories is None:
             categories = ["cs.AI", "cs.CY", "cs.LG"]
+        page_size = max_results or self.DEFAULT_PAGE_SIZE
+        max_pages = max_pages or self.DEFAULT_MAX_PAGES
         
-        logger.info(f"[ACADEMIC SCRAPER] Starting with {len(keywords)} keywords")
-        
-        for keyword in keywords[:5]:  # Limit keywords to avoid rate limits
-            try:
-                self._respect_rate_limit()
-                
-                # Build arXiv query
-                # Search in title and abstract
-                query = f'all:"{keyword}"'
-                
-                # Add category filter if specified
-                if categories:
-                    cat_query = ' OR '.join([f'cat:{cat}' for cat in categories])
-                    query = f'({query}) AND ({cat_query})'
-                
-                params = {
-                    'search_query': query,
-                    'start': 0,
-                    'max_results': 20,
-                    'sortBy': 'submittedDate',
-                    'sortOrder': 'descending'
-                }
-                
-                logger.info(f"[ARXIV] Searching for: {keyword}")
-                
-                response = requests.get(
-                    self.ARXIV_API_URL,
-                    params=params,
-                    timeout=30
-                )
-                response.raise_for_status()
-                
-                # Parse XML response
-                soup = BeautifulSoup(response.text, 'xml')
-                entries = soup.find_all('entry')
-                
-                logger.info(f"[ARXIV] Found {len(entries)} papers for: {keyword}")
-                
-                for entry in entries:
-                    paper = self._parse_arxiv_entry(entry, days_back)
-                    if paper:
-                        results.append(paper)
-                
-            except requests.RequestException as e:
-                logger.error(f"[ARXIV] HTTP error for '{keyword}': {str(e)}")
-            except Exception as e:
-                logger.error(f"[ARXIV] Error for '{keyword}': {str(e)}")
-        
-        # Validate and deduplicate by URL
-        seen_urls = set()
+        queries = plan_arxiv_queries(keywords, categories)
+        logger.info(f"[ACADEMIC SCRAPER] Starting with {len(keywords)} keywords in {len(queries)} queries")
+        
+        out_of_time = False
+        for query in queries:
+            mark = self.high_water_marks.load(self._mark_source(query))
+            cutoff = mark.cutoff(datetime.now(timezone.utc) - timedelta(days=days_back))
+            papers = []
+            for page in range(max_pages):
+                out_of_time = self._deadline_reached()
+                if out_of_time:
+                    break
+                try:
+                    self._respect_rate_limit(self.ARXIV_API_URL)
+                    
+                    logger.info(f"[ARXIV] Searching for: {query.label} (page {page + 1})")
+                    
+                    response = self.http_client.get(
+                        self.ARXIV_API_URL,
+                        params=self._build_params(query, page * page_size, page_size)
+                    )
+                    
+                    batch, read = self.parse_pool.run(self._parse_response, query, response.content,
+                                                      cutoff, mark.seen, deadline=self.deadline)
+                    papers.extend(batch)
+                    if read < page_size:
+                        break  # Last page, or the rest is older than the cutoff
+                    
+                except requests.RequestException as e:
+                    logger.error(f"[ARXIV] HTTP error for '{query.label}': {str(e)}")
+                    break
+                except Exception as e:
+                    logger.error(f"[ARXIV] Error for '{query.label}': {str(e)}")
+                    break
+            self._queue_query_mark(query, papers)
+            results.extend(papers)
+            if out_of_time:
+                break
+        
+        return self._dedupe_and_validate(results)
+    
+    async def ascrape(self, keywords: List[str], categories: List[str] = None, days_back: int = 30,
+                      max_results: int = None, max_pages: int = None) -> List[Dict]:
+        """
+        Async variant of scrape()
+        Queries are issued concurrently (pages of one query in order); the
+        client's per-host cap and min interval keep the load on arXiv at the
+        sync rate
+        """
+        if categories is None:
+            categories = ["cs.AI", "cs.CY", "cs.LG"]
+        page_size = max_results or self.DEFAULT_PAGE_SIZE
+        max_pages = max_pages or self.DEFAULT_MAX_PAGES
+        
+        queries = plan_arxiv_queries(keywords, categories)
+        logger.info(f"[ACADEMIC SCRAPER] Starting async with {len(keywords)} keywords in {len(queries)} queries")
+        
+        async def search(query: ArxivQuery) -> List[Dict]:
+            mark = await asyncio.to_thread(self.high_water_marks.load, self._mark_source(query))
+            cutoff = mark.cutoff(datetime.now(timezone.utc) - timedelta(days=days_back))
+            papers = []
+            for page in range(max_pages):
+                try:
+                    logger.info(f"[ARXIV] Searching for: {query.label} (page {page + 1})")
+                    response = await self.async_http_client.get(
+                        self.ARXIV_API_URL,
+                        params=self._build_params(query, page * page_size, page_size)
+                    )
+                    batch, read = await asyncio.to_thread(
+                        self.parse_pool.run, self._parse_response, query, response.content, cutoff, mark.seen,
+                        deadline=self.deadline
+                    )
+                except httpx.HTTPError as e:
+                    logger.error(f"[ARXIV] HTTP error for '{query.label}': {str(e)}")
+                    break
+                except Exception as e:
+                    logger.error(f"[ARXIV] Error for '{query.label}': {str(e)}")
+                    break
+                papers.extend(batch)
+                if read < page_size:
+                    break
+            self._queue_query_mark(query, papers)
+            return papers
+        
+        batches = await asyncio.gather(*(search(query) for query in queries))
+        return self._dedupe_and_validate([doc for batch in batches for doc in batch])
+    
+    def _build_params(self, query: ArxivQuery, start: int, page_size: int) -> Dict:
+        """Build arXiv API query parameters for one page of a query"""
+        return {
+            'search_query': query.search_query,
+            'start': start,
+            'max_results': page_size,
+            'sortBy': 'submittedDate',
+            'sortOrder': 'descending'
+        }
+    
+    @classmethod
+    def _parse_response(cls, query: ArxivQuery, xml_content: bytes, cutoff: datetime,
+                        seen_ids: AbstractSet[str] = frozenset()) -> Tuple[List[Dict], int]:
+        """
+        Parse an arXiv API response into paper documents
+        Entries are streamed and parsing stops at the first one older than
+        cutoff (results are sorted by submittedDate, newest first). Papers
+        whose id is in seen_ids are left out.
+        
+        Returns:
+            (papers, number of entries read including the skipped ones)
+        """
+        papers = []
+        read = 0
+        for entry in iter_atom_entries(xml_content, cutoff=cutoff):
+            read += 1
+            if entry['id'] in seen_ids:
+                continue
+            paper = cls._parse_arxiv_entry(entry)
+            if paper:
+                paper['matched_keywords'] = cls._match_keywords(entry, query.keywords)
+                papers.append(paper)
+        
+        logger.info(f"[ARXIV] Found {len(papers)} new papers ({read - len(papers)} seen) for: {query.label}")
+        
+        return papers, read
+    
+    @staticmethod
+    def _mark_source(query: ArxivQuery) -> str:
+        """High-water mark key of a query (a changed keyword batch starts fresh)"""
+        return f"arxiv:{query.search_query}"
+    
+    def _queue_query_mark(self, query: ArxivQuery, papers: List[Dict]):
+        """Queue a query's papers to be recorded as delivered"""
+        self._queue_high_water_mark(self._mark_source(query), [
+            {'id': paper['url'], 'published': parse_atom_date(paper['published_date'])}
+            for paper in papers
+        ])
+    
+    @staticmethod
+    def _match_keywords(entry: Dict, keywords: List[str]) -> List[str]:
+        """
+        Keywords of a combined query that a paper matched
+        arXiv does not say which OR term hit, so keywords are looked up in the
+        title and abstract; when none is found there (arXiv also matches
+        stems, comments, ...) the paper is credited to every keyword of the query
+        """
+        text = f"{entry['title']} {entry['summary']}".lower()
+        matched = [kw for kw in keywords if re.search(rf'\b{re.escape(kw.lower())}\b', text)]
+        return matched or list(keywords)
+    
+    def _dedupe_and_validate(self, results: List[Dict]) -> List[Dict]:
+        """Validate and deduplicate by URL, merging matched keywords"""
+        seen_urls = {}
         valid_results = []
         for doc in results:
-            if doc['url'] not in seen_urls and self._validate_document(doc):
-                seen_urls.add(doc['url'])
+            url = canonical_url(doc['url'])
+            kept = seen_urls.get(url)
+            if kept is not None:
+                kept['matched_keywords'].extend(
+                    kw for kw in doc.get('matched_keywords', []) if kw not in kept['matched_keywords']
+                )
+            elif self._validate_document(doc):
+                doc.setdefault('matched_keywords', [])
+                seen_urls[url] = doc
                 valid_results.append(doc)
         
         logger.info(f"[ACADEMIC SCRAPER] Complete: {len(valid_results)} valid papers")
         return valid_results
     
-    def _parse_arxiv_entry(self, entry, days_back: int) -> Dict:
-        """Parse arXiv XML entry into document"""
-        try:
-            # Extract ID (used as URL)
-            id_elem = entry.find('id')
-            arxiv_url = id_elem.get_text(strip=True) if id_elem else None
-            if not arxiv_url:
-                return None
-            
-            # Extract title
-            title_elem = entry.find('title')
-            title = title_elem.get_text(strip=True) if title_elem else "Unknown Title"
-            # Clean up title (remove newlines)
-            title = ' '.join(title.split())
-            
-            # Extract abstract
-            abstract_elem = entry.find('summary')
-            abstract = abstract_elem.get_text(strip=True) if abstract_elem else ""
-            abstract = ' '.join(abstract.split())  # Clean whitespace
-            
-            # Extract publication date
-            published_elem = entry.find('published')
-            published_str = published_elem.get_text(strip=True) if published_elem else ""
-            
-            # Check date is within range
-            try:
-                pub_date = datetime.fromisoformat(published_str.replace('Z', '+00:00'))
-                cutoff = datetime.now(pub_date.tzinfo) - timedelta(days=days_back)
-                if pub_date < cutoff:
-                    return None  # Skip old papers
-            except:
-                pass  # Keep paper if we can't parse date
-            
-            # Extract authors
-            authors = []
-            for author in entry.find_all('author'):
-                name_elem = author.find('name')
-                if name_elem:
-                    authors.append(name_elem.get_text(strip=True))
-            authors_str = ', '.join(authors[:5])  # Limit to 5 authors
-            if len(authors) > 5:
-                authors_str += f" et al. ({len(authors)} authors)"
-            
-            # Extract categories
-            categories = []
-            for cat in entry.find_all('category'):
-                term = cat.get('term')
-                if term:
-                    categories.append(term)
-            categories_str = ', '.join(categories[:3])
-            
-            # Build full text
-            text = f"TITLE: {title}\n\n"
-            text += f"AUTHORS: {authors_str}\n\n"
-            text += f"CATEGORIES: {categories_str}\n\n"
-            text += f"ABSTRACT:\n{abstract}"
-            
-            return {
-                'url': arxiv_url,
-                'source': 'arXiv',
-                'title': title,
-                'text': text,
-                'published_date': published_str
-            }
-            
-        except Exception as e:
-            logger.error(f"[ARXIV] Error parsing entry: {str(e)}")
-            return None
\ No newline at end of file
+    @staticmethod
+    def _parse_arxiv_entry(entry: Dict) -> Dict:
+        """Build a document from a parsed arXiv Atom entry"""
+        arxiv_url = entry['id']
+        if not arxiv_url:
+            return None
+        
+        title = entry['title'] or "Unknown Title"
+        abstract = entry['summary']
+        published_str = entry['published']
+        
+        authors = entry['authors']
+        authors_str = ', '.join(authors[:5])  # Limit to 5 authors
+        if len(authors) > 5:
+            authors_str += f" et al. ({len(authors)} authors)"
+        
+        categories_str = ', '.join(entry['categories'][:3])
+        
+        # Build full text
+        text = f"TITLE: {title}\n\n"
+        text += f"AUTHORS: {authors_str}\n\n"
+        text += f"CATEGORIES: {categories_str}\n\n"
+        text += f"ABSTRACT:\n{abstract}"
+        
+        return {
+            'url': arxiv_url,
+            'source': 'arXiv',
+            'title': title,
+            'text': text,
+            'published_date': published_str
+        }
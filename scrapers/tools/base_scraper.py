@@ -4,12 +4,27 @@ All scrapers inherit from this
 NOTE: Using custom base class instead of LangChain BaseTool to avoid Pydantic issues
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import time
 from datetime import datetime
-from bs4 import BeautifulSoup
 from utils.logger import setup_logger
-from scrapers.utils.http_client import HTTPClient
+from utils.deadline import Deadline, DeadlineExceeded
+from scrapers.utils.http_client import HTTPClient, UnsupportedContentTypeError
+from scrapers.utils.async_http_client import AsyncHTTPClient
+from scrapers.utils.rate_limiter import rate_limiter
+from scrapers.utils.host_controller import host_controller
+from scrapers.utils.circuit_breaker import circuit_breaker
+from scrapers.utils.response_cache import response_cache
+from scrapers.utils.parse_pool import parse_pool
+from scrapers.utils.high_water_mark import high_water_marks
+from scrapers.utils.conditional_get import FeedValidatorCache
+from scrapers.utils.dedup_index import dedup_index
+from scrapers.utils.content_extractor import get_extraction_backend
+from scrapers.utils.keyword_matcher import KeywordMatcher, keyword_matcher
+from config.loader import get_rate_limit_config, get_relevance_config, get_relevance_keywords
 
 logger = setup_logger(__name__)
 
@@ -24,10 +39,42 @@ class BaseScraperTool(ABC):
     name: str = "base_scraper"
     description: str = "Base scraper tool"
     
+    # Key of this scraper in the per-source sections of config/schedule.yaml
+    source_key: str = "default"
+    
+    # Max in-flight requests per host when running in async mode
+    async_max_per_host: int = 4
+    
+    # Max full-text page fetches in flight per enrichment batch (per-host
+    # limits of the host controller still apply within it)
+    full_text_concurrency: int = 4
+    
     def __init__(self):
         self.http_client = HTTPClient(timeout=30, max_retries=3)
-        self.rate_limit_delay = 1  # seconds between requests
-        self.headers = self.http_client.session.headers  # Reference HTTPClient headers
+        self.async_http_client = None  # Only set while arun() is executing
+        self.deadline: Optional[Deadline] = None  # Only set while run()/arun() is executing
+        self.searched_keywords: List[str] = []  # Per-keyword scrapers: searches that went through
+        self.failed = False  # Last run()/arun() raised and returned nothing
+        # High-water mark advances (HighWaterMarkStore.advance kwargs) of the last
+        # run, applied by the handoff once its documents are published
+        self.pending_marks: List[Dict] = []
+        # Feed ETag / Last-Modified (FeedValidatorCache.save kwargs), applied with them
+        self.pending_validators: List[Dict] = []
+        # Feed polls (FeedStatsStore.record_poll kwargs), applied with them
+        self.pending_polls: List[Dict] = []
+        rate_limits = get_rate_limit_config()
+        # seconds between requests to the same host
+        self.rate_limit_delay = rate_limits.get(self.source_key, rate_limits.get('default', 1))
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.parse_pool = parse_pool  # CPU-bound parsing runs off the scraper thread
+        self.high_water_marks = high_water_marks  # Per-source record of entries already delivered
+        self.dedup_index = dedup_index  # URLs already published to Graph 2 (any source, any run)
+        relevance = get_relevance_config()
+        self.min_relevance = relevance.get('min_score', 1)
+        self.title_weight = relevance.get('title_weight', 2)
+        self._relevance_keywords: Optional[tuple] = None  # Loaded on first use
+        self.headers = self.http_client.headers  # Reference HTTPClient headers
     
     @abstractmethod
     def scrape(self, **kwargs) -> List[Dict]:
@@ -46,10 +93,17 @@ class BaseScraperTool(ABC):
         """
         pass
     
-    def run(self, **kwargs) -> List[Dict]:
+    def run(self, deadline: Optional[Deadline] = None, **kwargs) -> List[Dict]:
         """
         Main entry point - wraps scrape() with error handling
+        
+        Args:
+            deadline: Optional time budget; HTTP timeouts are capped by it and
+                scrapers stop early, returning what they collected so far
         """
+        self._set_deadline(deadline)
+        self._clear_pending()
+        self.failed = False
         try:
             logger.info(f"Starting {self.name} with params: {kwargs}")
             results = self.scrape(**kwargs)
@@ -58,45 +112,193 @@ class BaseScraperTool(ABC):
             
         except Exception as e:
             logger.error(f"{self.name} failed: {str(e)}")
+            self._clear_pending()  # Nothing was delivered
+            self.failed = True
             return []
+        finally:
+            self._set_deadline(None)
+    
+    async def ascrape(self, **kwargs) -> List[Dict]:
+        """
+        Async variant of scrape()
+        
+        Default runs the blocking scrape() in a worker thread. Scrapers whose
+        requests are independent override this to fetch them concurrently
+        through self.async_http_client.
+        """
+        return await asyncio.to_thread(self.scrape, **kwargs)
     
-    def _respect_rate_limit(self):
-        """Sleep to respect rate limits"""
-        time.sleep(self.rate_limit_delay)
+    async def arun(self, deadline: Optional[Deadline] = None, **kwargs) -> List[Dict]:
+        """
+        Async entry point - wraps ascrape() with error handling
+        Opens an AsyncHTTPClient for the duration of the run
+        """
+        self._set_deadline(deadline)
+        self._clear_pending()
+        self.failed = False
+        try:
+            logger.info(f"Starting {self.name} (async) with params: {kwargs}")
+            async with AsyncHTTPClient(
+                timeout=30,
+                max_retries=3,
+                max_per_host=self.async_max_per_host,
+                min_interval=self.rate_limit_delay,
+                rate_limiter=self.rate_limiter,
+                host_controller=host_controller,
+                circuit_breaker=circuit_breaker,
+                deadline=deadline,
+                headers=dict(self.headers)
+            ) as client:
+                self.async_http_client = client
+                results = await self.ascrape(**kwargs)
+            logger.info(f"{self.name} completed: {len(results)} documents found")
+            return results
+            
+        except Exception as e:
+            logger.error(f"{self.name} failed: {str(e)}")
+            self._clear_pending()  # Nothing was delivered
+            self.failed = True
+            return []
+        finally:
+            self.async_http_client = None
+            self._set_deadline(None)
+    
+    def _set_deadline(self, deadline: Optional[Deadline]):
+        """Apply a run's deadline to this scraper and its HTTP client"""
+        self.deadline = deadline
+        self.http_client.deadline = deadline
+    
+    def _deadline_reached(self) -> bool:
+        """True once the current run's deadline has passed"""
+        if self.deadline is not None and self.deadline.expired():
+            logger.warning(f"{self.name} reached its deadline, returning partial results")
+            return True
+        return False
+    
+    def _respect_rate_limit(self, url: Optional[str] = None):
+        """
+        Wait for a token from the target host's bucket
+        Only sleeps when the host was hit within the last rate_limit_delay seconds,
+        by this or any other worker
+        
+        Raises:
+            DeadlineExceeded: If the wait would run past the run's deadline
+        """
+        if self.rate_limit_delay <= 0:
+            return
+        host = urlparse(url).netloc if url else self.name
+        if self.deadline is None:
+            wait = self.rate_limiter.reserve(host, 1 / self.rate_limit_delay)
+        else:
+            # A request that cannot happen before the deadline must not use up the host's budget
+            remaining = self.deadline.remaining()
+            if remaining <= 0:
+                raise DeadlineExceeded(f"Deadline passed before the request to {host}")
+            wait = self.rate_limiter.reserve(host, 1 / self.rate_limit_delay, max_wait=remaining)
+            if wait >= remaining:
+                raise DeadlineExceeded(f"Rate limit wait for {host} would pass the deadline")
+        if wait > 0:
+            time.sleep(wait)
     
     def _fetch_full_text(self, url: str) -> str:
         """
         Fetch full text from a URL by scraping the HTML
+        Pages come from the on-disk response cache while fresh and are parsed
+        from bytes by the configured extraction backend in the parse pool
         """
+        if self.deadline is not None and self.deadline.expired():
+            return ""
         try:
-            response = self.http_client.get(url)
-            if response.status_code != 200:
-                return ""
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+            content = self.response_cache.get(url)
+            if content is None:
+                response = self.http_client.get_limited(url)
+                if response.status_code != 200:
+                    return ""
+                content = response.content
+                self.response_cache.put(url, content, response.headers, ttl=self.response_cache.ttl_for(self.source_key))
             
-            # Find main content (heuristic: look for article, main, or long paragraphs)
-            article = soup.find('article') or soup.find('main')
-            
-            if article:
-                text = article.get_text(separator=' ', strip=True)
-            else:
-                # Fallback: get all text from paragraphs
-                paragraphs = soup.find_all('p')
-                text = ' '.join([p.get_text(strip=True) for p in paragraphs])
-            
-            # Clean up text
-            text = ' '.join(text.split())
+            text = self.parse_pool.run(get_extraction_backend().extract_page_text, content, deadline=self.deadline)
             return text[:10000]  # Limit total length
                 
+        except UnsupportedContentTypeError as e:
+            logger.warning(str(e))
+            return ""
         except Exception as e:
             logger.error(f"Error fetching full text from {url}: {e}")
             return ""
 
+    def _fetch_full_texts(self, urls: List[str]) -> List[str]:
+        """
+        _fetch_full_text for several URLs at once, results in the order of urls
+        At most full_text_concurrency fetches run at a time; HTTPClient holds
+        each one to its host's concurrency limit
+        """
+        if len(urls) <= 1 or self.full_text_concurrency <= 1:
+            return [self._fetch_full_text(url) for url in urls]
+        workers = min(self.full_text_concurrency, len(urls))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{self.name}-fulltext") as executor:
+            return list(executor.map(self._fetch_full_text, urls))
+    
+    def _keyword_matcher(self, extra_keywords: Iterable[str] = ()) -> KeywordMatcher:
+        """Automaton over the configured relevance keywords plus extra_keywords"""
+        if self._relevance_keywords is None:
+            self._relevance_keywords = tuple(get_relevance_keywords())
+        return keyword_matcher(self._relevance_keywords + tuple(extra_keywords))
+    
+    def _score_relevance(self, article: Dict, matcher: KeywordMatcher) -> bool:
+        """
+        Attach the keywords found in an article's title and feed text
+        (matched_keywords); whether it reaches min_relevance
+        """
+        score, article['matched_keywords'] = matcher.score(article['title'], article['text'], self.title_weight)
+        return score >= self.min_relevance
+    
+    def _enrich_full_text(self, articles: List[Dict], min_length: int = 300, max_length: int = 5000,
+                          fetch: Optional[List[Dict]] = None):
+        """
+        Replace snippets shorter than min_length with the full page text
+        Pages are fetched concurrently (see _fetch_full_texts); articles whose
+        fetch fails keep their snippet. Every text is cut to max_length.
+        Only the articles in fetch (default: all) are fetched.
+        """
+        candidates = articles if fetch is None else fetch
+        short = [article for article in candidates if len(article['text']) < min_length]
+        if short:
+            logger.info(f"{self.name}: {len(short)} snippets too short, fetching full text...")
+            for article, full_text in zip(short, self._fetch_full_texts([a['url'] for a in short])):
+                if full_text:
+                    article['text'] = full_text
+        for article in articles:
+            article['text'] = article['text'][:max_length]
+    
+    def _queue_high_water_mark(self, source: str, entries: List[Dict]):
+        """
+        Queue parsed entries (dicts with id and published) to be recorded as
+        delivered for source; see pending_marks
+        """
+        if not entries:
+            return
+        dates = [entry['published'] for entry in entries if entry.get('published')]
+        self.pending_marks.append({
+            'source': source,
+            'entry_ids': [entry['id'] for entry in entries],
+            'newest': max(dates, default=None)
+        })
+    
+    def _clear_pending(self):
+        """Drop the run state queued for the handoff"""
+        self.pending_marks, self.pending_validators, self.pending_polls = [], [], []
+    
+    def _queue_feed_poll(self, feed_url: str, published: List[Optional[datetime]]):
+        """Queue a successful poll of a feed (entry dates, empty for a 304); see pending_polls"""
+        self.pending_polls.append({'url': feed_url, 'published': published, 'polled_at': time.time()})
+    
+    def _queue_feed_validators(self, feed_url: str, response_headers):
+        """Queue the validators of a processed feed response; see pending_validators"""
+        validators = FeedValidatorCache.validators(response_headers)
+        if validators:
+            self.pending_validators.append({'url': feed_url, 'validators': validators})
+    
     def _validate_document(self, doc: Dict) -> bool:
         """
         Validate document has required fields
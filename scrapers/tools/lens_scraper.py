@@ -3,11 +3,13 @@ Lens.org scraper - Alternative patent source
 Uses public search interface for scraping patents
 """
 from typing import List, Dict
+import asyncio
 import requests
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
 import re
 from .base_scraper import BaseScraperTool
+from scrapers.utils.soup_helper import SoupHelper
+from scrapers.utils.url_validator import canonical_url
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -24,64 +26,104 @@ class LensScraperTool(BaseScraperTool):
     
     BASE_URL = "https://www.lens.org/lens/search/patent/list"
     
-    def __init__(self):
-        super().__init__()
-        self.rate_limit_delay = 3
+    source_key = "lens"
+    async_max_per_host = 1
     
     def scrape(self, keywords: List[str], days_back: int = 30) -> List[Dict]:
         """
         Scrape patents from Lens.org
+        searched_keywords lists the keywords whose search went through
         """
         results = []
+        self.searched_keywords = []
         
         logger.info(f"[LENS SCRAPER] Starting with {len(keywords)} keywords")
         
         for keyword in keywords[:5]:
+            if self._deadline_reached():
+                break
             try:
-                self._respect_rate_limit()
-                
-                # Build search URL
-                params = {
-                    "q": keyword,
-                    "preview": "true",
-                    "sortField": "p_pub_date",
-                    "sortDescending": "true"
-                }
+                self._respect_rate_limit(self.BASE_URL)
                 
                 # Fetch
-                response = self.http_client.get(self.BASE_URL, params=params)
+                response = self.http_client.get(self.BASE_URL, params=self._build_params(keyword))
                 if response.status_code != 200:
                     logger.warning(f"[LENS] Failed to fetch for '{keyword}': {response.status_code}")
                     continue
+                self.searched_keywords.append(keyword)
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Parse results
-                # Lens.org uses 'patent-record' class or similar
-                items = soup.select('.patent-record') or soup.select('.search-result') or soup.select('article')
-                
-                logger.info(f"[LENS] Found {len(items)} potential items for: {keyword}")
-                
-                for item in items[:10]:
-                    patent = self._extract_patent(item, keyword)
-                    if patent:
-                        results.append(patent)
+                results.extend(self.parse_pool.run(self._parse_results, response.content, keyword))
                         
             except Exception as e:
                 logger.error(f"[LENS] Error for '{keyword}': {str(e)}")
         
-        # Deduplicate
+        return self._dedupe_and_validate(results)
+    
+    async def ascrape(self, keywords: List[str], days_back: int = 30) -> List[Dict]:
+        """
+        Async variant of scrape() - keyword searches are issued concurrently
+        """
+        logger.info(f"[LENS SCRAPER] Starting async with {len(keywords)} keywords")
+        self.searched_keywords = []
+        
+        async def search(keyword: str) -> List[Dict]:
+            try:
+                response = await self.async_http_client.get(self.BASE_URL, params=self._build_params(keyword))
+                self.searched_keywords.append(keyword)
+                return await asyncio.to_thread(self.parse_pool.run, self._parse_results, response.content, keyword)
+            except Exception as e:
+                logger.error(f"[LENS] Error for '{keyword}': {str(e)}")
+            return []
+        
+        batches = await asyncio.gather(*(search(keyword) for keyword in keywords[:5]))
+        return self._dedupe_and_validate([doc for batch in batches for doc in batch])
+    
+    def _build_params(self, keyword: str) -> Dict:
+        """Build search URL parameters"""
+        return {
+            "q": keyword,
+            "preview": "true",
+            "sortField": "p_pub_date",
+            "sortDescending": "true"
+        }
+    
+    @classmethod
+    def _parse_results(cls, html: bytes, keyword: str) -> List[Dict]:
+        """
+        Parse a Lens.org result page into patent documents
+        A classmethod so it can be shipped to the parse pool
+        """
+        results = []
+        soup = SoupHelper.create_soup(html)
+        
+        # Parse results
+        # Lens.org uses 'patent-record' class or similar
+        items = soup.select('.patent-record') or soup.select('.search-result') or soup.select('article')
+        
+        logger.info(f"[LENS] Found {len(items)} potential items for: {keyword}")
+        
+        for item in items[:10]:
+            patent = cls._extract_patent(item, keyword)
+            if patent:
+                results.append(patent)
+        
+        return results
+    
+    def _dedupe_and_validate(self, results: List[Dict]) -> List[Dict]:
+        """Deduplicate and validate"""
         seen_urls = set()
         valid_results = []
         for doc in results:
-            if doc['url'] not in seen_urls and self._validate_document(doc):
-                seen_urls.add(doc['url'])
+            url = canonical_url(doc['url'])
+            if url not in seen_urls and self._validate_document(doc):
+                seen_urls.add(url)
                 valid_results.append(doc)
                 
         logger.info(f"[LENS SCRAPER] Complete: {len(valid_results)} valid patents")
         return valid_results
     
-    def _extract_patent(self, item, keyword: str) -> Dict:
+    @classmethod
+    def _extract_patent(cls, item, keyword: str) -> Dict:
         """Extract patent data from item"""
         try:
             link = item.find('a', href=re.compile(r'/lens/patent/'))
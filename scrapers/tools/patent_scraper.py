@@ -3,11 +3,16 @@ Patent scraper - REAL scraping from Google Patents using web scraping
 Note: Google Patents doesn't have a public API, so we use web scraping
 """
 from typing import List, Dict
+import asyncio
+import httpx
 import requests
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 import re
 from .base_scraper import BaseScraperTool
+from scrapers.utils.soup_helper import SoupHelper
+from scrapers.utils.host_controller import HostBackoffError
+from scrapers.utils.url_validator import canonical_url
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -24,67 +29,121 @@ class PatentScraperTool(BaseScraperTool):
     
     BASE_URL = "https://patents.google.com"
     
-    def __init__(self):
-        super().__init__()
-        self.rate_limit_delay = 5  # Higher delay for Google to avoid bot detection
+    # Higher delay for Google to avoid bot detection (see config/schedule.yaml)
+    source_key = "patents"
+    
+    # One search at a time against Google to avoid bot detection
+    async_max_per_host = 1
     
     def scrape(self, keywords: List[str], days_back: int = 30) -> List[Dict]:
         """
         Scrape REAL patents from Google Patents
         
         Args:
-            keywords: Search keywords
+            keywords: Search keywords (the first 5 are searched)
             days_back: Patents from last N days
         
         Returns:
-            List of REAL patent documents
+            List of REAL patent documents; searched_keywords lists the
+            keywords whose search went through
         """
         results = []
+        self.searched_keywords = []
         
         logger.info(f"[PATENT SCRAPER] Starting with {len(keywords)} keywords")
         
         for keyword in keywords[:5]:  # Limit to avoid rate limits
+            if self._deadline_reached():
+                break
             try:
-                self._respect_rate_limit()
-                
                 # Build search URL - simpler query often works better for bot protection
                 search_url = f"{self.BASE_URL}/?q={requests.utils.quote(keyword)}"
                 
-                # Fetch using centralized HTTPClient
-                response = self.http_client.get(search_url)
+                self._respect_rate_limit(search_url)
                 
-                if response.status_code == 429:
-                    logger.warning("[PATENTS] Rate limited, skipping...")
-                    continue
-                
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
+                # Fetch using centralized HTTPClient (waits out Retry-After on 429/503)
+                response = self.http_client.get(search_url)
+                self.searched_keywords.append(keyword)
                 
-                # Find patent search results
-                # Google Patents uses different structures, try multiple selectors
-                patents = self._parse_search_results(soup, keyword)
+                # Find patent search results (parsed in the parse pool)
+                patents = self.parse_pool.run(self._parse_search_page, response.content, keyword)
                 results.extend(patents)
                 
                 logger.info(f"[PATENTS] Found {len(patents)} patents for: {keyword}")
                 
+            except HostBackoffError as e:
+                # Google Patents wants a long pause; further searches would only be refused
+                logger.warning(f"[PATENTS] {e}, skipping remaining keywords")
+                break
             except requests.RequestException as e:
                 logger.error(f"[PATENTS] HTTP error for '{keyword}': {str(e)}")
             except Exception as e:
                 logger.error(f"[PATENTS] Error for '{keyword}': {str(e)}")
         
-        # Validate and deduplicate
+        return self._dedupe_and_validate(results)
+    
+    async def ascrape(self, keywords: List[str], days_back: int = 30) -> List[Dict]:
+        """
+        Async variant of scrape()
+        Keyword searches are issued concurrently; the client's per-host cap and
+        min interval keep Google Patents at the sync request rate
+        """
+        logger.info(f"[PATENT SCRAPER] Starting async with {len(keywords)} keywords")
+        self.searched_keywords = []
+        
+        async def search(keyword: str) -> List[Dict]:
+            try:
+                search_url = f"{self.BASE_URL}/?q={requests.utils.quote(keyword)}"
+                response = await self.async_http_client.get(search_url)
+                self.searched_keywords.append(keyword)
+                
+                patents = await asyncio.to_thread(
+                    self.parse_pool.run, self._parse_search_page, response.content, keyword
+                )
+                
+                logger.info(f"[PATENTS] Found {len(patents)} patents for: {keyword}")
+                return patents
+            except HostBackoffError as e:
+                logger.warning(f"[PATENTS] {e}, skipping '{keyword}'")
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 429:
+                    logger.warning("[PATENTS] Rate limited, skipping...")
+                else:
+                    logger.error(f"[PATENTS] HTTP error for '{keyword}': {str(e)}")
+            except httpx.HTTPError as e:
+                logger.error(f"[PATENTS] HTTP error for '{keyword}': {str(e)}")
+            except Exception as e:
+                logger.error(f"[PATENTS] Error for '{keyword}': {str(e)}")
+            return []
+        
+        batches = await asyncio.gather(*(search(keyword) for keyword in keywords[:5]))
+        return self._dedupe_and_validate([doc for batch in batches for doc in batch])
+    
+    def _dedupe_and_validate(self, results: List[Dict]) -> List[Dict]:
+        """Validate and deduplicate by URL"""
         seen_urls = set()
         valid_results = []
         for doc in results:
-            if doc['url'] not in seen_urls and self._validate_document(doc):
-                seen_urls.add(doc['url'])
+            url = canonical_url(doc['url'])
+            if url not in seen_urls and self._validate_document(doc):
+                seen_urls.add(url)
                 valid_results.append(doc)
         
         logger.info(f"[PATENT SCRAPER] Complete: {len(valid_results)} valid patents")
         return valid_results
     
-    def _parse_search_results(self, soup: BeautifulSoup, keyword: str) -> List[Dict]:
+    @classmethod
+    def _parse_search_page(cls, html: bytes, keyword: str) -> List[Dict]:
+        """
+        Parse a search result page into patent documents
+        A classmethod so it can be shipped to the parse pool
+        """
+        soup = SoupHelper.create_soup(html)
+        # Google Patents uses different structures, try multiple selectors
+        return cls._parse_search_results(soup, keyword)
+    
+    @classmethod
+    def _parse_search_results(cls, soup: BeautifulSoup, keyword: str) -> List[Dict]:
         """Parse patent search results from HTML"""
         results = []
         
@@ -109,7 +168,7 @@ class PatentScraperTool(BaseScraperTool):
         
         for item in result_items[:10]:  # Limit per keyword
             try:
-                patent = self._extract_patent_from_item(item, keyword)
+                patent = cls._extract_patent_from_item(item, keyword)
                 if patent:
                     results.append(patent)
             except Exception as e:
@@ -118,11 +177,12 @@ class PatentScraperTool(BaseScraperTool):
         
         # If no structured results, try to extract from page text
         if not results:
-            results = self._extract_from_page_text(soup, keyword)
+            results = cls._extract_from_page_text(soup, keyword)
         
         return results
     
-    def _extract_patent_from_item(self, item, keyword: str) -> Dict:
+    @classmethod
+    def _extract_patent_from_item(cls, item, keyword: str) -> Dict:
         """Extract patent data from search result item"""
         try:
             # Find link
@@ -140,7 +200,7 @@ class PatentScraperTool(BaseScraperTool):
             if not href:
                 return None
             
-            patent_url = f"{self.BASE_URL}{href}" if href.startswith('/') else href
+            patent_url = f"{cls.BASE_URL}{href}" if href.startswith('/') else href
             
             # Extract patent ID from URL
             patent_id_match = re.search(r'/patent/([A-Z0-9]+)', href)
@@ -184,7 +244,8 @@ class PatentScraperTool(BaseScraperTool):
             logger.error(f"[PATENTS] Error extracting patent: {str(e)}")
             return None
     
-    def _extract_from_page_text(self, soup: BeautifulSoup, keyword: str) -> List[Dict]:
+    @classmethod
+    def _extract_from_page_text(cls, soup: BeautifulSoup, keyword: str) -> List[Dict]:
         """Fallback: extract any patent references from page"""
         results = []
         
@@ -193,7 +254,7 @@ class PatentScraperTool(BaseScraperTool):
         
         for link in patent_links[:5]:
             href = link.get('href', '')
-            patent_url = f"{self.BASE_URL}{href}" if href.startswith('/') else href
+            patent_url = f"{cls.BASE_URL}{href}" if href.startswith('/') else href
             
             patent_id_match = re.search(r'/patent/([A-Z0-9]+)', href)
             patent_id = patent_id_match.group(1) if patent_id_match else "Unknown"
@@ -1,13 +1,17 @@
 """
 RSS feed scraper - REAL scraping from live RSS feeds
-Uses feedparser for RSS parsing and requests for fetching
+Uses a lazy lxml feed parser (feedparser fallback) and requests for fetching
 """
 from typing import List, Dict
-import feedparser
+import asyncio
+import httpx
 import requests
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
 from .base_scraper import BaseScraperTool
+from scrapers.utils.conditional_get import feed_validator_cache
+from scrapers.utils.feed_stats import feed_stats
+from scrapers.utils.feed_parser import parse_feed_text
+from monitoring.metrics import record_conditional_get, record_relevance_check
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -20,9 +24,14 @@ class RSSScraperTool(BaseScraperTool):
     
     name = "scrape_rss_feeds"
     description = "Scrape RSS feeds from maritime and port technology sites"
+    source_key = "rss"
+    
+    MAX_ENTRIES_PER_FEED = 20
     
     def __init__(self):
         super().__init__()
+        self.feed_validators = feed_validator_cache
+        self.feed_stats = feed_stats  # Per-feed publish rate, decides which feeds are polled
         # Specializing headers for RSS feeds
         self.headers.update({
             'Accept': 'application/rss+xml,application/xml;q=0.9,text/xml;q=0.8,*/*;q=0.7'
@@ -33,7 +42,7 @@ class RSSScraperTool(BaseScraperTool):
         Scrape REAL RSS feeds
         
         Args:
-            feed_urls: List of RSS feed URLs to scrape
+            feed_urls: List of RSS feed URLs to scrape (those not due yet are skipped)
             days_back: Only include articles from last N days
         
         Returns:
@@ -43,30 +52,25 @@ class RSSScraperTool(BaseScraperTool):
         cutoff_date = datetime.now() - timedelta(days=days_back)
         
         logger.info(f"[RSS SCRAPER] Starting with {len(feed_urls)} feeds")
+        feed_urls = self.feed_stats.due(feed_urls)
         
         for feed_url in feed_urls:
+            if self._deadline_reached():
+                break
             try:
-                # Fetch RSS feed using centralized HTTPClient
-                response = self.http_client.get(feed_url)
-                
-                # Parse RSS feed
-                feed = feedparser.parse(response.content)
-                
-                if feed.bozo and not feed.entries:
-                    logger.warning(f"[RSS] Feed has errors or empty (bozo: {feed.bozo}): {feed_url}")
-                    continue
+                self._respect_rate_limit(feed_url)
                 
-                # Get source name
-                source_name = feed.feed.get('title', 'Unknown Source')
-                logger.info(f"[RSS] Source: {source_name} - Found {len(feed.entries)} entries")
+                # Fetch RSS feed using centralized HTTPClient (conditional GET)
+                response = self.http_client.get(feed_url, headers=self.feed_validators.request_headers(feed_url))
                 
-                # Process entries
-                for entry in feed.entries[:20]:  # Limit to 20 per feed
-                    article = self._extract_article(entry, source_name, cutoff_date)
-                    if article:
-                        results.append(article)
-                
-                self._respect_rate_limit()
+                if response.status_code == 304:
+                    logger.info(f"[RSS] Not modified since last run: {feed_url}")
+                    record_conditional_get("RSS", not_modified=True)
+                    self._queue_feed_poll(feed_url, [])
+                else:
+                    record_conditional_get("RSS", not_modified=False)
+                    results.extend(self._process_feed(feed_url, response.content, cutoff_date))
+                    self._queue_feed_validators(feed_url, response.headers)
                 
             except requests.RequestException as e:
                 logger.error(f"[RSS] HTTP error for {feed_url}: {str(e)}")
@@ -79,45 +83,109 @@ class RSSScraperTool(BaseScraperTool):
         logger.info(f"[RSS SCRAPER] Complete: {len(valid_results)} valid articles from {len(feed_urls)} feeds")
         return valid_results
     
-    def _extract_article(self, entry, source_name: str, cutoff_date: datetime) -> Dict:
-        """Extract article from RSS entry"""
+    async def ascrape(self, feed_urls: List[str], days_back: int = 7) -> List[Dict]:
+        """
+        Async variant of scrape() - fetches all feeds concurrently
+        Parsing and full-text enrichment run in worker threads
+        """
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+        
+        logger.info(f"[RSS SCRAPER] Starting async with {len(feed_urls)} feeds")
+        feed_urls = await asyncio.to_thread(self.feed_stats.due, feed_urls)
+        
+        async def scrape_feed(feed_url: str) -> List[Dict]:
+            try:
+                headers = await asyncio.to_thread(self.feed_validators.request_headers, feed_url)
+                response = await self.async_http_client.get(feed_url, headers=headers)
+                
+                if response.status_code == 304:
+                    logger.info(f"[RSS] Not modified since last run: {feed_url}")
+                    record_conditional_get("RSS", not_modified=True)
+                    self._queue_feed_poll(feed_url, [])
+                    return []
+                
+                record_conditional_get("RSS", not_modified=False)
+                articles = await asyncio.to_thread(self._process_feed, feed_url, response.content, cutoff_date)
+                self._queue_feed_validators(feed_url, response.headers)
+                return articles
+            except httpx.HTTPError as e:
+                logger.error(f"[RSS] HTTP error for {feed_url}: {str(e)}")
+            except Exception as e:
+                logger.error(f"[RSS] Error for {feed_url}: {str(e)}")
+            return []
+        
+        batches = await asyncio.gather(*(scrape_feed(url) for url in feed_urls))
+        results = [doc for batch in batches for doc in batch]
+        
+        valid_results = [doc for doc in results if self._validate_document(doc)]
+        
+        logger.info(f"[RSS SCRAPER] Complete: {len(valid_results)} valid articles from {len(feed_urls)} feeds")
+        return valid_results
+    
+    def _process_feed(self, feed_url: str, content: bytes, cutoff_date: datetime) -> List[Dict]:
+        """
+        Parse a fetched feed and extract its new articles
+        Entries seen in earlier runs are dropped while parsing (see high_water_marks);
+        entries matching too few keywords are kept but get no full-text fetch.
+        The new entries' dates are queued for the feed's publish rate (see feed_stats)
+        """
+        articles = []
+        
+        # Parsing stops at the per-feed limit or the first entry past the cutoff
+        mark = self.high_water_marks.load(feed_url)
+        feed = self.parse_pool.run(
+            parse_feed_text, content, self.MAX_ENTRIES_PER_FEED, mark.cutoff(cutoff_date), mark.seen,
+            deadline=self.deadline
+        )
+        
+        if not feed.entries and feed.title is None:
+            logger.warning(f"[RSS] Feed has errors or empty: {feed_url}")
+            return articles
+        
+        # Get source name
+        source_name = feed.title or 'Unknown Source'
+        logger.info(f"[RSS] Source: {source_name} - Found {len(feed.entries)} new entries "
+                    f"({feed.skipped} already seen)")
+        
+        # Process entries, then fetch full text for the short snippets together
+        matcher = self._keyword_matcher()
+        relevant = []
+        for entry in feed.entries:
+            article = self._extract_article(entry, source_name)
+            if article:
+                articles.append(article)
+                if self._score_relevance(article, matcher):
+                    relevant.append(article)
+        record_relevance_check("RSS", len(relevant), len(articles) - len(relevant))
+        
+        # Articles published by earlier runs are dropped before any page fetch
+        articles = self.dedup_index.filter_new(articles, stage="scrape")
+        self._enrich_full_text(articles, fetch=[article for article in relevant if article in articles])
+        for article in articles:
+            if not article['text']:
+                article['text'] = article['title']  # Fallback to title if both fail
+        
+        self._queue_high_water_mark(feed_url, feed.entries)
+        self._queue_feed_poll(feed_url, [entry['published'] for entry in feed.entries])
+        return articles
+    
+    def _extract_article(self, entry: Dict, source_name: str) -> Dict:
+        """
+        Extract article from a parsed feed entry (see parse_feed_text)
+        text is the feed's own content; short ones are enriched by _process_feed
+        """
         try:
-            # Get publication date
-            pub_date = self._parse_date(entry)
-            if pub_date and pub_date < cutoff_date:
-                return None  # Skip old articles
+            pub_date = entry['published']
             
             # Get basic info
-            title = entry.get('title', '').strip()
-            url = entry.get('link', '').strip()
+            title = entry['title']
+            url = entry['link']
             
             if not title or not url:
                 return None
             
-            # Get content - try multiple fields
-            content = ''
-            
-            # Try content:encoded first (usually full content)
-            if hasattr(entry, 'content') and entry.content:
-                content = entry.content[0].get('value', '')
-            
-            # Fallback to summary/description
-            if not content:
-                content = entry.get('summary', '') or entry.get('description', '')
-            
-            # Clean HTML from content
-            if content:
-                soup = BeautifulSoup(content, 'html.parser')
-                content = soup.get_text(separator=' ', strip=True)
-            
-            # If content is too short, try to fetch the full page content
-            if not content or len(content) < 300:
-                logger.info(f"[RSS] Snippet too short for {url}, fetching full text...")
-                full_text = self._fetch_full_text(url)
-                if full_text:
-                    content = full_text
-                elif not content:
-                    content = title  # Fallback to title if both fail
+            # content:encoded (usually full content), else summary, HTML already stripped
+            content = entry['text']
             
             pub_date_str = pub_date.isoformat() if pub_date else datetime.now().isoformat()
             
@@ -125,21 +193,10 @@ class RSSScraperTool(BaseScraperTool):
                 'url': url,
                 'source': source_name,
                 'title': title,
-                'text': content[:5000],  # Limit text length
+                'text': content,
                 'published_date': pub_date_str
             }
             
         except Exception as e:
             logger.error(f"[RSS] Error extracting entry: {str(e)}")
             return None
-    
-    def _parse_date(self, entry) -> datetime:
-        """Parse date from RSS entry"""
-        try:
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                return datetime(*entry.published_parsed[:6])
-            if hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                return datetime(*entry.updated_parsed[:6])
-        except:
-            pass
-        return datetime.now()
\ No newline at end of file
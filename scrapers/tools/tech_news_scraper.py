@@ -3,11 +3,15 @@ Tech news scraper - REAL scraping from tech news RSS feeds
 Uses RSS feeds instead of HTML scraping (more reliable)
 """
 from typing import List, Dict
-import feedparser
+import asyncio
+import httpx
 import requests
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
 from .base_scraper import BaseScraperTool
+from scrapers.utils.conditional_get import feed_validator_cache
+from scrapers.utils.feed_stats import feed_stats
+from scrapers.utils.feed_parser import parse_feed_text
+from monitoring.metrics import record_conditional_get, record_relevance_check
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -20,6 +24,9 @@ class TechNewsScraperTool(BaseScraperTool):
     
     name = "scrape_tech_news"
     description = "Scrape tech news from TechCrunch, VentureBeat, etc."
+    source_key = "tech_news"
+    
+    MAX_ENTRIES_PER_SOURCE = 15
     
     # RSS feeds for tech news (these are real, working feeds)
     TECH_FEEDS = {
@@ -32,6 +39,8 @@ class TechNewsScraperTool(BaseScraperTool):
     
     def __init__(self):
         super().__init__()
+        self.feed_validators = feed_validator_cache
+        self.feed_stats = feed_stats  # Per-feed publish rate, decides which feeds are polled
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
@@ -41,7 +50,8 @@ class TechNewsScraperTool(BaseScraperTool):
         Scrape REAL tech news from RSS feeds
         
         Args:
-            topics: Topics to filter by (optional)
+            topics: Topics to filter by (optional); entries must reach the
+                relevance threshold on the configured keywords plus these
             sources: Source names from TECH_FEEDS (default: all)
             days_back: Only articles from last N days
         
@@ -55,8 +65,11 @@ class TechNewsScraperTool(BaseScraperTool):
             sources = ['techcrunch', 'venturebeat']  # Default sources
         
         logger.info(f"[TECH NEWS SCRAPER] Starting with {len(sources)} sources")
+        sources = self._due_sources(sources)
         
         for source in sources:
+            if self._deadline_reached():
+                break
             source_lower = source.lower()
             feed_url = self.TECH_FEEDS.get(source_lower)
             
@@ -66,28 +79,19 @@ class TechNewsScraperTool(BaseScraperTool):
             
             try:
                 logger.info(f"[TECH NEWS] Fetching: {source} ({feed_url})")
+                self._respect_rate_limit(feed_url)
                 
-                response = requests.get(feed_url, headers=self.headers, timeout=30)
-                response.raise_for_status()
-                
-                feed = feedparser.parse(response.content)
-                
-                if not feed.entries:
-                    logger.warning(f"[TECH NEWS] No entries in {source}")
-                    continue
-                
-                source_name = feed.feed.get('title', source.title())
-                logger.info(f"[TECH NEWS] {source_name}: {len(feed.entries)} entries")
+                headers = {**self.headers, **self.feed_validators.request_headers(feed_url)}
+                response = self.http_client.get(feed_url, headers=headers)
                 
-                articles_added = 0
-                for entry in feed.entries[:15]:  # Limit per source
-                    article = self._extract_article(entry, source_name, cutoff_date, topics)
-                    if article:
-                        results.append(article)
-                        articles_added += 1
-                
-                logger.info(f"[TECH NEWS] Added {articles_added} articles from {source}")
-                self._respect_rate_limit()
+                if response.status_code == 304:
+                    logger.info(f"[TECH NEWS] Not modified since last run: {source}")
+                    record_conditional_get("Tech News", not_modified=True)
+                    self._queue_feed_poll(feed_url, [])
+                else:
+                    record_conditional_get("Tech News", not_modified=False)
+                    results.extend(self._process_feed(source, response.content, cutoff_date, topics))
+                    self._queue_feed_validators(feed_url, response.headers)
                 
             except requests.RequestException as e:
                 logger.error(f"[TECH NEWS] HTTP error for {source}: {str(e)}")
@@ -100,48 +104,143 @@ class TechNewsScraperTool(BaseScraperTool):
         logger.info(f"[TECH NEWS SCRAPER] Complete: {len(valid_results)} valid articles")
         return valid_results
     
-    def _extract_article(self, entry, source_name: str, cutoff_date: datetime, topics: List[str] = None) -> Dict:
-        """Extract article from RSS entry"""
+    async def ascrape(self, topics: List[str] = None, sources: List[str] = None, days_back: int = 7) -> List[Dict]:
+        """
+        Async variant of scrape() - fetches all source feeds concurrently
+        Parsing and full-text enrichment run in worker threads
+        """
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+        
+        if sources is None:
+            sources = ['techcrunch', 'venturebeat']  # Default sources
+        
+        logger.info(f"[TECH NEWS SCRAPER] Starting async with {len(sources)} sources")
+        sources = await asyncio.to_thread(self._due_sources, sources)
+        
+        async def scrape_source(source: str) -> List[Dict]:
+            feed_url = self.TECH_FEEDS.get(source.lower())
+            if not feed_url:
+                logger.warning(f"[TECH NEWS] Unknown source: {source}")
+                return []
+            
+            try:
+                logger.info(f"[TECH NEWS] Fetching: {source} ({feed_url})")
+                headers = await asyncio.to_thread(self.feed_validators.request_headers, feed_url)
+                response = await self.async_http_client.get(feed_url, headers=headers)
+                
+                if response.status_code == 304:
+                    logger.info(f"[TECH NEWS] Not modified since last run: {source}")
+                    record_conditional_get("Tech News", not_modified=True)
+                    self._queue_feed_poll(feed_url, [])
+                    return []
+                
+                record_conditional_get("Tech News", not_modified=False)
+                articles = await asyncio.to_thread(self._process_feed, source, response.content, cutoff_date, topics)
+                self._queue_feed_validators(feed_url, response.headers)
+                return articles
+            except httpx.HTTPError as e:
+                logger.error(f"[TECH NEWS] HTTP error for {source}: {str(e)}")
+            except Exception as e:
+                logger.error(f"[TECH NEWS] Error for {source}: {str(e)}")
+            return []
+        
+        batches = await asyncio.gather(*(scrape_source(source) for source in sources))
+        results = [doc for batch in batches for doc in batch]
+        
+        valid_results = [doc for doc in results if self._validate_document(doc)]
+        
+        logger.info(f"[TECH NEWS SCRAPER] Complete: {len(valid_results)} valid articles")
+        return valid_results
+    
+    @staticmethod
+    def _mark_source(feed_url: str) -> str:
+        """High-water mark key of a feed (apart from the RSS scraper's mark of the same URL)"""
+        return f"tech_news:{feed_url}"
+    
+    def _process_feed(self, source: str, content: bytes, cutoff_date: datetime, topics: List[str] = None) -> List[Dict]:
+        """
+        Parse a fetched source feed and extract new matching articles
+        Entries delivered in earlier runs are dropped while parsing (see
+        high_water_marks). Entries that missed the topics are not recorded,
+        but they are not considered again either: the mark's cutoff moves
+        past them once later entries are delivered, and an unchanged feed
+        answers 304. Without topics, entries matching too few keywords are
+        kept but get no full-text fetch
+        """
+        articles = []
+        delivered = []
+        feed_url = self.TECH_FEEDS[source.lower()]
+        
+        # Parsing stops at the per-source limit or the first entry past the cutoff
+        mark = self.high_water_marks.load(self._mark_source(feed_url))
+        feed = self.parse_pool.run(
+            parse_feed_text, content, self.MAX_ENTRIES_PER_SOURCE, mark.cutoff(cutoff_date), mark.seen,
+            deadline=self.deadline
+        )
+        
+        if not feed.entries and feed.title is None:
+            logger.warning(f"[TECH NEWS] Feed has errors or empty: {source}")
+            return articles
+        
+        # Every new entry counts towards the feed's publish rate, topic match or not
+        self._queue_feed_poll(feed_url, [entry['published'] for entry in feed.entries])
+        if not feed.entries:
+            logger.warning(f"[TECH NEWS] No new entries in {source} ({feed.skipped} already seen)")
+            return articles
+        
+        source_name = feed.title or source.title()
+        logger.info(f"[TECH NEWS] {source_name}: {len(feed.entries)} new entries ({feed.skipped} already seen)")
+        
+        matcher = self._keyword_matcher(topics or ())
+        relevant = []
+        low = 0
+        for entry in feed.entries:
+            article = self._extract_article(entry, source_name)
+            if not article:
+                continue
+            if self._score_relevance(article, matcher):
+                relevant.append(article)
+            else:
+                low += 1
+                if topics:
+                    continue  # No topic match
+            articles.append(article)
+            delivered.append(entry)
+        record_relevance_check("Tech News", len(relevant), low)
+        
+        # Short snippets of relevant articles not published before get the
+        # full article text, fetched together
+        articles = self.dedup_index.filter_new(articles, stage="scrape")
+        self._enrich_full_text(articles, fetch=[article for article in relevant if article in articles])
+        self._queue_high_water_mark(self._mark_source(feed_url), delivered)
+        
+        logger.info(f"[TECH NEWS] Added {len(articles)} articles from {source}")
+        return articles
+    
+    def _due_sources(self, sources: List[str]) -> List[str]:
+        """Sources whose feed is due for a poll (see feed_stats); unknown names are kept"""
+        feed_urls = [self.TECH_FEEDS[source.lower()] for source in sources if source.lower() in self.TECH_FEEDS]
+        due = set(self.feed_stats.due(feed_urls))
+        return [source for source in sources
+                if source.lower() not in self.TECH_FEEDS or self.TECH_FEEDS[source.lower()] in due]
+    
+    def _extract_article(self, entry: Dict, source_name: str) -> Dict:
+        """
+        Extract article from a parsed feed entry (see parse_feed_text)
+        text is the feed's own content; short ones are enriched by _process_feed
+        """
         try:
-            # Parse date
-            pub_date = self._parse_date(entry)
-            if pub_date and pub_date < cutoff_date:
-                return None  # Skip old articles
+            pub_date = entry['published']
             
             # Get basic info
-            title = entry.get('title', '').strip()
-            url = entry.get('link', '').strip()
+            title = entry['title']
+            url = entry['link']
             
             if not title or not url:
                 return None
             
-            # Filter by topics if specified
-            if topics:
-                title_lower = title.lower()
-                content_lower = entry.get('summary', '').lower()
-                matches = any(topic.lower() in title_lower or topic.lower() in content_lower 
-                             for topic in topics)
-                if not matches:
-                    return None  # Skip if no topic match
-            
-            # Get content
-            content = ''
-            if hasattr(entry, 'content') and entry.content:
-                content = entry.content[0].get('value', '')
-            if not content:
-                content = entry.get('summary', '') or entry.get('description', '')
-            
-            # Clean HTML
-            if content:
-                soup = BeautifulSoup(content, 'html.parser')
-                content = soup.get_text(separator=' ', strip=True)
-            
-            # If content is too short, fetch the full article content
-            if not content or len(content) < 300:
-                logger.info(f"[TECH NEWS] Snippet too short for {url}, fetching full text...")
-                full_text = self._fetch_full_text(url)
-                if full_text:
-                    content = full_text
+            # Get content (HTML already stripped by parse_feed_text)
+            content = entry['text']
             
             pub_date_str = pub_date.isoformat() if pub_date else datetime.now().isoformat()
             
@@ -149,21 +248,10 @@ class TechNewsScraperTool(BaseScraperTool):
                 'url': url,
                 'source': source_name,
                 'title': title,
-                'text': content[:5000],
+                'text': content,
                 'published_date': pub_date_str
             }
             
         except Exception as e:
             logger.error(f"[TECH NEWS] Error extracting entry: {str(e)}")
             return None
-    
-    def _parse_date(self, entry) -> datetime:
-        """Parse date from entry"""
-        try:
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                return datetime(*entry.published_parsed[:6])
-            if hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                return datetime(*entry.updated_parsed[:6])
-        except:
-            pass
-        return datetime.now()
\ No newline at end of file
@@ -0,0 +1,227 @@
+"""
+Async HTTP client built on httpx
+Async counterpart of HTTPClient with per-host concurrency caps, so
+independent feeds and keywords can be fetched at the same time while
+each host still sees bounded load
+"""
+import asyncio
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import httpx
+from utils.deadline import Deadline, DeadlineExceeded
+from utils.logger import setup_logger
+from scrapers.utils.http_client import DEFAULT_HEADERS
+from scrapers.utils.rate_limiter import TokenBucketRateLimiter
+from scrapers.utils.host_controller import HostConcurrencyController, THROTTLE_STATUS_CODES, parse_retry_after
+from scrapers.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+logger = setup_logger(__name__)
+
+# Same status codes the sync client retries through urllib3
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class AsyncHTTPClient:
+    """
+    Async HTTP client with retries, timeout and per-host concurrency limits
+
+    Must be used from a single event loop, ideally as an async context manager:
+
+        async with AsyncHTTPClient(max_per_host=2) as client:
+            response = await client.get(url)
+    """
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 3,
+        max_per_host: int = 4,
+        host_limits: Optional[Dict[str, int]] = None,
+        min_interval: float = 0,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        host_controller: Optional[HostConcurrencyController] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        deadline: Optional[Deadline] = None,
+        headers: Optional[dict] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            timeout: Request timeout in seconds
+            max_retries: Retries on connection errors and retryable status codes
+            max_per_host: Default cap on in-flight requests per host
+            host_limits: Per-host overrides of max_per_host
+            min_interval: Minimum seconds between two requests to the same host
+            rate_limiter: Shared token-bucket limiter enforcing min_interval across
+                workers (defaults to spacing requests within this client only)
+            host_controller: Adaptive per-host concurrency limits applied inside
+                the max_per_host cap; also blocks hosts for their Retry-After
+            circuit_breaker: Per-host circuit breaker; requests to open circuits
+                raise CircuitOpenError, final outcomes are recorded
+            deadline: Caps every request timeout; requests after it raise DeadlineExceeded
+            headers: Request headers (defaults to the browser-like DEFAULT_HEADERS)
+            transport: Optional httpx transport (used by tests)
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_per_host = max_per_host
+        self.host_limits = host_limits or {}
+        self.min_interval = min_interval
+        self.rate_limiter = rate_limiter
+        self.host_controller = host_controller
+        self.circuit_breaker = circuit_breaker
+        self.deadline = deadline
+        self.headers = dict(headers) if headers is not None else dict(DEFAULT_HEADERS)
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._interval_locks: Dict[str, asyncio.Lock] = {}
+        self._last_request: Dict[str, float] = {}
+
+    async def __aenter__(self) -> "AsyncHTTPClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Create the underlying httpx client on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.timeout,
+                follow_redirects=True,
+                transport=self._transport
+            )
+        return self._client
+
+    def _semaphore_for(self, host: str) -> asyncio.Semaphore:
+        """Get (or create) the concurrency semaphore for a host"""
+        if host not in self._semaphores:
+            limit = self.host_limits.get(host, self.max_per_host)
+            self._semaphores[host] = asyncio.Semaphore(max(1, limit))
+        return self._semaphores[host]
+
+    async def _wait_for_interval(self, host: str):
+        """Space out requests to the same host by min_interval seconds"""
+        if self.min_interval <= 0:
+            return
+
+        if self.rate_limiter is not None:
+            # Reservation happens off-loop since it may be a Redis round-trip
+            max_wait = self.deadline.cap(None) if self.deadline else None
+            wait = await asyncio.to_thread(self.rate_limiter.reserve, host, 1 / self.min_interval, max_wait)
+            if max_wait is not None and wait >= max_wait:
+                raise DeadlineExceeded(f"Rate limit wait for {host} would pass the deadline")
+            if wait > 0:
+                await asyncio.sleep(wait)
+            return
+
+        lock = self._interval_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            last = self._last_request.get(host)
+            if last is not None:
+                wait = last + self.min_interval - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._last_request[host] = time.monotonic()
+
+    async def _send(self, client: httpx.AsyncClient, host: str, url: str, params: Optional[dict],
+                    timeout: int, headers: Optional[dict]) -> httpx.Response:
+        """Single request, reported to the host controller if there is one"""
+        if self.host_controller is None:
+            return await client.get(url, params=params, timeout=timeout, headers=headers)
+
+        self.host_controller.check_backoff(host)
+        await self.host_controller.acquire_async(host, self.deadline)
+        started = time.monotonic()
+        try:
+            response = await client.get(url, params=params, timeout=timeout, headers=headers)
+        except BaseException:
+            # Any exit without a response (transport errors, cancellation, bad
+            # URLs) must return the slot, or the host stays at its limit
+            self.host_controller.release(host, None)
+            raise
+        self.host_controller.release(
+            host,
+            response.status_code,
+            latency=time.monotonic() - started,
+            retry_after=response.headers.get('Retry-After')
+        )
+        return response
+
+    async def _record_outcome(self, host: str, response: Optional[httpx.Response] = None,
+                              error: Optional[Exception] = None):
+        """Report the final outcome of a request (after retries) to the circuit breaker"""
+        if self.circuit_breaker is None:
+            return
+        # Breaker state may live in Redis, so keep the round-trip off the loop
+        if response is None:
+            await asyncio.to_thread(self.circuit_breaker.record_failure, host, str(error))
+        else:
+            await asyncio.to_thread(
+                self.circuit_breaker.record_response, host, response.status_code,
+                response.headers.get('Retry-After')
+            )
+
+    def _retry_delay(self, host: str, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying; throttled hosts get their Retry-After"""
+        if response.status_code in THROTTLE_STATUS_CODES:
+            if self.host_controller is not None:
+                # acquire_async() waits out the block (or check_backoff() gives up)
+                return 0.0
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return retry_after
+        return 2 ** attempt  # Wait 1s, 2s, 4s between retries
+
+    async def get(self, url: str, params: Optional[dict] = None, timeout: Optional[int] = None,
+                  headers: Optional[dict] = None) -> httpx.Response:
+        """
+        GET request with retries, bounded by the per-host concurrency cap
+        """
+        host = urlparse(url).netloc
+        timeout = timeout or self.timeout
+        client = self._get_client()
+
+        if self.circuit_breaker is not None and not await asyncio.to_thread(self.circuit_breaker.allow, host):
+            logger.warning(f"Circuit open for {host}, skipping {url}")
+            raise CircuitOpenError(f"Circuit open for {host}, skipping {url}")
+
+        async with self._semaphore_for(host):
+            for attempt in range(self.max_retries + 1):
+                await self._wait_for_interval(host)
+                attempt_timeout = self.deadline.cap(timeout) if self.deadline else timeout
+                try:
+                    logger.info(f"GET request to: {url}")
+                    response = await self._send(client, host, url, params, attempt_timeout, headers)
+
+                    if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                        logger.warning(f"Retryable status {response.status_code} for {url}")
+                        await asyncio.sleep(self._retry_delay(host, response, attempt))
+                        continue
+
+                    await self._record_outcome(host, response=response)
+                    # 304 answers a conditional GET, it is not an error
+                    if response.status_code != 304:
+                        response.raise_for_status()
+                    logger.info(f"Success: {url} - Status {response.status_code}")
+                    return response
+
+                except httpx.TransportError as e:
+                    if attempt < self.max_retries:
+                        await asyncio.sleep(2 ** attempt)
+                        continue
+                    await self._record_outcome(host, error=e)
+                    logger.error(f"Request error for {url}: {str(e)}")
+                    raise
+                except httpx.HTTPStatusError as e:
+                    logger.error(f"Request error for {url}: {str(e)}")
+                    raise
+
+    async def close(self):
+        """Close the underlying client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
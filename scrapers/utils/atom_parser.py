@@ -0,0 +1,105 @@
+"""
+Streaming Atom parser
+Walks an Atom feed (e.g. an arXiv API response) with lxml iterparse, one
+<entry> at a time, clearing finished elements so memory stays flat however
+many entries the response holds.
+"""
+from typing import Dict, Iterator, Optional, Union
+from datetime import datetime, timezone
+import io
+from lxml import etree
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+
+_ENTRY = f"{{{ATOM_NS}}}entry"
+_ID = f"{{{ATOM_NS}}}id"
+_TITLE = f"{{{ATOM_NS}}}title"
+_SUMMARY = f"{{{ATOM_NS}}}summary"
+_PUBLISHED = f"{{{ATOM_NS}}}published"
+_AUTHOR_NAME = f"{{{ATOM_NS}}}author/{{{ATOM_NS}}}name"
+_CATEGORY = f"{{{ATOM_NS}}}category"
+
+
+def _text(element, path: str) -> str:
+    """Whitespace-normalized text of the first match of path ('' if missing)"""
+    found = element.find(path)
+    if found is None:
+        return ""
+    return ' '.join(''.join(found.itertext()).split())
+
+
+def parse_atom_date(value: str) -> Optional[datetime]:
+    """Parse an Atom timestamp (naive values are taken as UTC)"""
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def iter_atom_entries(xml_content: Union[bytes, str],
+                      cutoff: Optional[datetime] = None) -> Iterator[Dict]:
+    """
+    Yield the entries of an Atom feed as plain dicts
+
+    Args:
+        xml_content: Raw response body
+        cutoff: Stop at the first entry published before this (timezone-aware)
+            time. Only valid for feeds sorted newest first, as arXiv results
+            sorted by submittedDate descending are. Entries with an
+            unparseable date are kept.
+
+    Yields:
+        {'id', 'title', 'summary', 'published', 'authors', 'categories'}
+    """
+    if not xml_content:
+        return
+    if isinstance(xml_content, str):
+        xml_content = xml_content.encode('utf-8')
+
+    context = etree.iterparse(
+        io.BytesIO(xml_content),
+        events=('end',),
+        tag=_ENTRY,
+        resolve_entities=False,
+        no_network=True
+    )
+    try:
+        for _, entry in context:
+            published = _text(entry, _PUBLISHED)
+            item = {
+                'id': _text(entry, _ID),
+                'title': _text(entry, _TITLE),
+                'summary': _text(entry, _SUMMARY),
+                'published': published,
+                'authors': [
+                    ' '.join((name.text or '').split())
+                    for name in entry.iterfind(_AUTHOR_NAME)
+                    if name.text and name.text.strip()
+                ],
+                'categories': [
+                    cat.get('term') for cat in entry.iterfind(_CATEGORY) if cat.get('term')
+                ]
+            }
+
+            # Drop the finished entry and any siblings already handled
+            entry.clear()
+            parent = entry.getparent()
+            while entry.getprevious() is not None:
+                del parent[0]
+
+            if cutoff is not None:
+                pub_date = parse_atom_date(published)
+                if pub_date is not None and pub_date < cutoff:
+                    return  # Everything after this is older still
+
+            yield item
+    except etree.XMLSyntaxError as e:
+        logger.error(f"Malformed Atom feed: {e}")
+    finally:
+        del context
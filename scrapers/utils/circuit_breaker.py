@@ -0,0 +1,244 @@
+"""
+Per-host circuit breaker and source health registry
+Circuit state lives in Redis so a dead feed or site is skipped across runs
+and workers instead of costing a full timeout-and-retry cycle every time.
+Falls back to in-process state when Redis is unavailable.
+"""
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+import redis
+import requests
+
+from config.loader import get_circuit_breaker_config
+from monitoring.metrics import record_circuit_state, record_circuit_skip, record_source_failed_runs
+from storage.redis_client import get_shared_redis_client, report_redis_failure
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Redis key prefixes: one hash per host, plus a probe lock and the set of known hosts
+CIRCUIT_KEY = "circuit:"
+CIRCUIT_PROBE_KEY = "circuit:probe:"
+CIRCUIT_SOURCES_KEY = "circuit:sources"
+
+# Circuit state of hosts that are no longer scraped expires after 30 days
+CIRCUIT_TTL_SECONDS = 86400 * 30
+
+# Responses that count as the host being down; a 503 with Retry-After is
+# throttling and is left to the host concurrency controller
+FAILURE_STATUS_CODES = {500, 502, 503, 504}
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit per host
+
+    closed:    requests go out; failure_threshold consecutive failures open it
+    open:      requests are refused until the cool-down has passed
+    half_open: one probe request is let through; success closes the circuit,
+               failure re-opens it with the cool-down doubled (up to max)
+
+    Also counts, per host, how many consecutive runs had no successful
+    request, so persistently dead sources can be reported.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, clock: Callable[[], float] = time.time):
+        config = config if config is not None else get_circuit_breaker_config()
+        self.failure_threshold = int(config.get('failure_threshold', 2))
+        self.cooldown_seconds = float(config.get('cooldown_seconds', 3600))
+        self.max_cooldown_seconds = float(config.get('max_cooldown_seconds', 172800))
+        self.probe_timeout_seconds = int(config.get('probe_timeout_seconds', 120))
+        self.report_after_runs = int(config.get('report_after_runs', 3))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._local: Dict[str, Dict] = {}  # host -> circuit fields (Redis fallback)
+        self._local_probes: Dict[str, float] = {}  # host -> probe expiry (Redis fallback)
+        self._run_outcomes: Dict[str, bool] = {}  # host -> had a success this run
+
+    def allow(self, host: str) -> bool:
+        """
+        Check whether a request to the host may be sent
+
+        An open circuit whose cool-down has passed turns half-open and lets
+        exactly one caller through as a probe.
+        """
+        circuit = self._load(host)
+        state = circuit.get('state', CLOSED)
+        if state == CLOSED:
+            return True
+
+        now = self._clock()
+        if now >= float(circuit.get('opened_at', 0)) + float(circuit.get('cooldown', 0)):
+            if self._claim_probe(host):
+                if state != HALF_OPEN:
+                    self._save(host, {'state': HALF_OPEN})
+                    record_circuit_state(host, HALF_OPEN)
+                logger.info(f"Circuit for {host} half-open, sending probe request")
+                return True
+
+        with self._lock:
+            self._run_outcomes.setdefault(host, False)
+        record_circuit_skip(host)
+        return False
+
+    def record_response(self, host: str, status_code: int, retry_after: Optional[str] = None):
+        """Record a request outcome from its response status"""
+        if status_code in FAILURE_STATUS_CODES and not (status_code == 503 and retry_after):
+            self.record_failure(host, f"HTTP {status_code}")
+        else:
+            self.record_success(host)
+
+    def record_success(self, host: str):
+        """A request to the host got a (non-5xx) response"""
+        with self._lock:
+            self._run_outcomes[host] = True
+        circuit = self._load(host)
+        if circuit.get('state', CLOSED) == CLOSED and int(circuit.get('failures', 0)) == 0:
+            return
+        self._save(host, {'state': CLOSED, 'failures': 0, 'cooldown': 0, 'last_error': ''})
+        self._release_probe(host)
+        record_circuit_state(host, CLOSED)
+        if circuit.get('state', CLOSED) != CLOSED:
+            logger.info(f"Circuit for {host} closed")
+
+    def record_failure(self, host: str, error: str = ""):
+        """A request to the host timed out, failed to connect or got a 5xx"""
+        with self._lock:
+            self._run_outcomes.setdefault(host, False)
+        circuit = self._load(host)
+        state = circuit.get('state', CLOSED)
+        failures = int(circuit.get('failures', 0)) + 1
+        fields = {'failures': failures, 'last_error': error[:200]}
+
+        if state == HALF_OPEN or (state == CLOSED and failures >= self.failure_threshold):
+            previous = float(circuit.get('cooldown', 0))
+            cooldown = min(previous * 2, self.max_cooldown_seconds) if previous else self.cooldown_seconds
+            fields.update({'state': OPEN, 'opened_at': self._clock(), 'cooldown': cooldown})
+            logger.warning(f"Circuit for {host} opened for {cooldown:.0f}s after {failures} failures: {error}")
+            record_circuit_state(host, OPEN)
+
+        self._save(host, fields)
+        self._release_probe(host)
+
+    def state(self, host: str) -> str:
+        """Current state of a host's circuit"""
+        return self._load(host).get('state', CLOSED)
+
+    def end_run(self) -> List[Dict]:
+        """
+        Close the books on a scraping run
+
+        Hosts with no successful request this run (including hosts skipped
+        because their circuit was open) get their failed-run streak extended;
+        the others are reset.
+
+        Returns:
+            Sources failing for at least report_after_runs consecutive runs
+        """
+        with self._lock:
+            outcomes, self._run_outcomes = self._run_outcomes, {}
+
+        for host, succeeded in outcomes.items():
+            circuit = self._load(host)
+            failed_runs = 0 if succeeded else int(circuit.get('failed_runs', 0)) + 1
+            if failed_runs != int(circuit.get('failed_runs', 0)):
+                self._save(host, {'failed_runs': failed_runs})
+            record_source_failed_runs(host, failed_runs)
+
+        return self.failing_sources()
+
+    def failing_sources(self, min_runs: Optional[int] = None) -> List[Dict]:
+        """
+        Hosts that have failed for at least min_runs consecutive runs
+
+        Returns:
+            List of {source, failed_runs, state, last_error}, worst first
+        """
+        min_runs = self.report_after_runs if min_runs is None else min_runs
+        report = []
+        for host in self._known_hosts():
+            circuit = self._load(host)
+            failed_runs = int(circuit.get('failed_runs', 0))
+            if failed_runs >= min_runs:
+                report.append({
+                    'source': host,
+                    'failed_runs': failed_runs,
+                    'state': circuit.get('state', CLOSED),
+                    'last_error': circuit.get('last_error', '')
+                })
+        return sorted(report, key=lambda item: item['failed_runs'], reverse=True)
+
+    def _load(self, host: str) -> Dict:
+        client = get_shared_redis_client()
+        if client is not None:
+            try:
+                return client.hgetall(f"{CIRCUIT_KEY}{host}") or {}
+            except redis.RedisError as e:
+                report_redis_failure(e)
+        with self._lock:
+            return dict(self._local.get(host, {}))
+
+    def _save(self, host: str, fields: Dict):
+        client = get_shared_redis_client()
+        if client is not None:
+            try:
+                key = f"{CIRCUIT_KEY}{host}"
+                pipe = client.pipeline()
+                pipe.hset(key, mapping=fields)
+                pipe.expire(key, CIRCUIT_TTL_SECONDS)
+                pipe.sadd(CIRCUIT_SOURCES_KEY, host)
+                pipe.execute()
+                return
+            except redis.RedisError as e:
+                report_redis_failure(e)
+        with self._lock:
+            self._local.setdefault(host, {}).update(fields)
+
+    def _known_hosts(self) -> List[str]:
+        client = get_shared_redis_client()
+        if client is not None:
+            try:
+                return sorted(client.smembers(CIRCUIT_SOURCES_KEY))
+            except redis.RedisError as e:
+                report_redis_failure(e)
+        with self._lock:
+            return sorted(self._local)
+
+    def _claim_probe(self, host: str) -> bool:
+        """Let one caller (across workers) probe a half-open circuit"""
+        client = get_shared_redis_client()
+        if client is not None:
+            try:
+                return bool(client.set(f"{CIRCUIT_PROBE_KEY}{host}", 1, nx=True, ex=self.probe_timeout_seconds))
+            except redis.RedisError as e:
+                report_redis_failure(e)
+        with self._lock:
+            now = self._clock()
+            if self._local_probes.get(host, 0) > now:
+                return False
+            self._local_probes[host] = now + self.probe_timeout_seconds
+            return True
+
+    def _release_probe(self, host: str):
+        client = get_shared_redis_client()
+        if client is not None:
+            try:
+                client.delete(f"{CIRCUIT_PROBE_KEY}{host}")
+                return
+            except redis.RedisError as e:
+                report_redis_failure(e)
+        with self._lock:
+            self._local_probes.pop(host, None)
+
+
+# Singleton instance shared by the sync and async HTTP clients
+circuit_breaker = CircuitBreaker()
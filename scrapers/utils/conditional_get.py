@@ -0,0 +1,100 @@
+"""
+Conditional GET support for feed fetches
+Persists each feed's ETag / Last-Modified validators so unchanged feeds
+can be answered with 304 Not Modified instead of a full download
+"""
+import os
+from typing import Dict, Optional
+import redis
+
+from config.settings import settings
+from scrapers.utils.json_fallback_store import JsonFallbackStore
+from storage.redis_client import get_shared_redis_client, report_redis_failure
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Redis key prefix, one hash per feed URL
+FEED_VALIDATORS_KEY = "feed:validators:"
+
+# Validators of feeds that stop being polled expire after 30 days
+VALIDATORS_TTL_SECONDS = 86400 * 30
+
+
+class FeedValidatorCache:
+    """
+    Stores ETag / Last-Modified validators per feed URL
+    Redis is the primary store; a local JSON file is used when Redis is unavailable
+    """
+
+    def __init__(self, local_path: Optional[str] = None):
+        self.local = JsonFallbackStore(
+            local_path or os.path.join(settings.LOCAL_CACHE_DIR, "feed_validators.json"), "feed validators")
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """
+        Build conditional request headers for a feed
+
+        Returns:
+            Dict with If-None-Match / If-Modified-Since (empty if feed never seen)
+        """
+        validators = self.get(url)
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def get(self, url: str) -> Dict[str, str]:
+        """Get stored validators for a feed URL"""
+        client = get_shared_redis_client()
+        if client is not None:
+            try:
+                return client.hgetall(f"{FEED_VALIDATORS_KEY}{url}") or {}
+            except redis.RedisError as e:
+                report_redis_failure(e)
+        return self.local.get(url)
+
+    @staticmethod
+    def validators(response_headers) -> Dict[str, str]:
+        """ETag / Last-Modified of a 200 response (empty if it sent neither)"""
+        validators = {}
+        if response_headers.get('ETag'):
+            validators['etag'] = response_headers['ETag']
+        if response_headers.get('Last-Modified'):
+            validators['last_modified'] = response_headers['Last-Modified']
+        return validators
+
+    def update(self, url: str, response_headers) -> bool:
+        """Save validators from a 200 response"""
+        return self.save(url, self.validators(response_headers))
+
+    def save(self, url: str, validators: Dict[str, str]) -> bool:
+        """
+        Save a feed's validators (see validators())
+
+        Call this only once the feed's entries were published (the handoff
+        applies the scrapers' pending_validators), so a failed run does not
+        turn the next one into a 304 that skips the entries.
+        """
+        if not validators:
+            return False
+
+        client = get_shared_redis_client()
+        if client is not None:
+            try:
+                key = f"{FEED_VALIDATORS_KEY}{url}"
+                pipe = client.pipeline()
+                pipe.delete(key)
+                pipe.hset(key, mapping=validators)
+                pipe.expire(key, VALIDATORS_TTL_SECONDS)
+                pipe.execute()
+                return True
+            except redis.RedisError as e:
+                report_redis_failure(e)
+        return self.local.set(url, validators)
+
+
+# Singleton instance
+feed_validator_cache = FeedValidatorCache()
@@ -2,31 +2,45 @@
 Advanced content extraction utilities
 Extracts clean article text from various HTML structures
 """
-from bs4 import BeautifulSoup
-from typing import Optional
+from typing import Optional, Type, Union
 import re
+from config.settings import settings
 from .soup_helper import SoupHelper
+from .lxml_extractor import LxmlExtractor
+from .page_scanner import scan_page
+
+# HTML_EXTRACTION_BACKEND values -> helper implementing the extraction heuristics
+EXTRACTION_BACKENDS = {
+    'bs4': SoupHelper,
+    'lxml': LxmlExtractor,
+}
+
+
+def get_extraction_backend() -> Union[Type[SoupHelper], Type[LxmlExtractor]]:
+    """
+    Helper class selected by settings.HTML_EXTRACTION_BACKEND (default lxml)
+    """
+    return EXTRACTION_BACKENDS.get(settings.HTML_EXTRACTION_BACKEND, LxmlExtractor)
+
 
 class ContentExtractor:
     """
     Extracts main article content from web pages
+    Parsing goes through the configured backend (see get_extraction_backend)
     """
     
     @staticmethod
     def extract_full_article(html_content: str) -> Optional[str]:
         """
         Extract full article text from HTML
+        Ads/widgets are skipped and the densest content block is kept
+        (see scan_page)
         
         Returns:
             Clean article text or None
         """
-        soup = SoupHelper.create_soup(html_content)
-        
-        # Remove ads and widgets
-        soup = SoupHelper.remove_ads_and_widgets(soup)
-        
-        # Try to find article content
-        article_text = SoupHelper.find_article_content(soup)
+        page = scan_page(get_extraction_backend().create_soup(html_content))
+        article_text = page['content'] if page else None
         
         if article_text and len(article_text) > 100:
             return ContentExtractor._clean_text(article_text)
@@ -36,7 +50,7 @@ class ContentExtractor:
     @staticmethod
     def extract_with_metadata(html_content: str) -> dict:
         """
-        Extract article with metadata
+        Extract article with metadata in a single walk over the page
         
         Returns:
             {
@@ -46,48 +60,17 @@ class ContentExtractor:
                 'author': '...'
             }
         """
-        soup = SoupHelper.create_soup(html_content)
+        page = scan_page(get_extraction_backend().create_soup(html_content))
+        if page is None:
+            return {'title': None, 'description': None, 'content': None, 'author': None}
         
         return {
-            'title': ContentExtractor._extract_title(soup),
-            'description': SoupHelper.find_meta_content(soup, 'description'),
-            'content': SoupHelper.find_article_content(soup),
-            'author': ContentExtractor._extract_author(soup)
+            'title': page['title'],
+            'description': page['description'],
+            'content': page['content'],
+            'author': page['author']
         }
     
-    @staticmethod
-    def _extract_title(soup: BeautifulSoup) -> Optional[str]:
-        """Extract article title"""
-        # Try <title> tag
-        title_tag = soup.find('title')
-        if title_tag:
-            title = title_tag.get_text(strip=True)
-            # Remove site name (usually after | or -)
-            title = re.split(r'\s+[-|]\s+', title)[0]
-            return title
-        
-        # Try h1
-        h1 = soup.find('h1')
-        if h1:
-            return h1.get_text(strip=True)
-        
-        return None
-    
-    @staticmethod
-    def _extract_author(soup: BeautifulSoup) -> Optional[str]:
-        """Extract author name"""
-        # Try meta tag
-        author = SoupHelper.find_meta_content(soup, 'author')
-        if author:
-            return author
-        
-        # Try common author class
-        author_element = soup.find(class_=lambda x: x and 'author' in x.lower())
-        if author_element:
-            return author_element.get_text(strip=True)
-        
-        return None
-    
     @staticmethod
     def _clean_text(text: str) -> str:
         """
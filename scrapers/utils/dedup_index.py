@@ -0,0 +1,184 @@
+"""
+Cross-run URL dedup index
+Remembers which documents were already published to Graph 2 so later runs
+drop them instead of publishing them again while they stay inside the
+lookback window.
+
+Redis holds the exact set (a sorted set of URL hashes scored by expiry
+time). An in-process Bloom filter loaded from it answers "never published"
+- the common case - without a Redis round trip; only filter hits are
+confirmed against Redis. When Redis is unavailable every document counts
+as new, as before the index existed.
+"""
+import hashlib
+import math
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional
+import redis
+
+from config.loader import get_dedup_config
+from monitoring.metrics import record_dedup_bloom, record_dedup_check
+from scrapers.utils.url_validator import canonical_url
+from storage.redis_client import get_shared_redis_client, report_redis_failure
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Redis sorted set: member = URL hash, score = expiry (epoch seconds)
+DEDUP_KEY = "dedup:published_urls"
+
+DEFAULT_TTL_DAYS = 35
+DEFAULT_BLOOM_CAPACITY = 200000
+DEFAULT_BLOOM_ERROR_RATE = 0.001
+DEFAULT_REFRESH_SECONDS = 600
+
+
+def url_key(url: str) -> str:
+    """Hash of a URL's canonical form (see url_validator.canonical_url)"""
+    return hashlib.blake2b(canonical_url(url).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over hex digests
+    Sized for capacity items at error_rate false positives; no false negatives
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, digest: str):
+        # Double hashing over the two halves of the (already uniform) digest
+        value = int(digest, 16)
+        h1, h2 = value >> 64, (value & 0xFFFFFFFFFFFFFFFF) | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, digest: str):
+        for position in self._positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, digest: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.bits)
+
+
+class DedupIndex:
+    """
+    Published-URL index shared by the scrapers (before full-text fetches)
+    and the handoff node (before publishing)
+    """
+
+    def __init__(self, config: Optional[Dict] = None, clock: Callable[[], float] = time.time):
+        config = config if config is not None else get_dedup_config()
+        self.ttl_seconds = config.get('ttl_days', DEFAULT_TTL_DAYS) * 86400
+        self.capacity = config.get('bloom_capacity', DEFAULT_BLOOM_CAPACITY)
+        self.error_rate = config.get('bloom_error_rate', DEFAULT_BLOOM_ERROR_RATE)
+        self.refresh_seconds = config.get('refresh_seconds', DEFAULT_REFRESH_SECONDS)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(self.capacity, self.error_rate)
+        self._loaded_at: Optional[float] = None
+
+    def _ensure_loaded(self, client: redis.Redis):
+        """
+        (Re)build the Bloom filter from Redis, dropping expired entries
+        Reloading every refresh_seconds picks up URLs published by other workers
+        """
+        now = self._clock()
+        with self._lock:
+            if self._loaded_at is not None and now - self._loaded_at < self.refresh_seconds:
+                return
+            pipe = client.pipeline()
+            pipe.zremrangebyscore(DEDUP_KEY, '-inf', now)
+            pipe.zrange(DEDUP_KEY, 0, -1)
+            _, digests = pipe.execute()
+            bloom = BloomFilter(max(self.capacity, len(digests)), self.error_rate)
+            for digest in digests:
+                bloom.add(digest)
+            self._bloom = bloom
+            self._loaded_at = now
+        record_dedup_bloom(bloom.memory_bytes, bloom.count)
+
+    def published(self, urls: List[str]) -> List[bool]:
+        """Whether each URL was published within ttl_days (False when Redis is down)"""
+        client = get_shared_redis_client()
+        if client is None or not urls:
+            return [False] * len(urls)
+        try:
+            self._ensure_loaded(client)
+            digests = [url_key(url) for url in urls]
+            candidates = [i for i, digest in enumerate(digests) if digest in self._bloom]
+            result = [False] * len(urls)
+            if candidates:
+                pipe = client.pipeline()
+                for i in candidates:
+                    pipe.zscore(DEDUP_KEY, digests[i])
+                now = self._clock()
+                for i, expires in zip(candidates, pipe.execute()):
+                    result[i] = expires is not None and expires > now
+            return result
+        except redis.RedisError as e:
+            report_redis_failure(e)
+            return [False] * len(urls)
+
+    def filter_new(self, documents: List[Dict], stage: str) -> List[Dict]:
+        """
+        Drop documents (dicts with url and source) that were already published
+
+        Args:
+            documents: Documents or signals, in order
+            stage: Where the check runs ("scrape", "handoff"), for the metrics
+
+        Returns:
+            The documents never published, in their original order
+        """
+        if not documents:
+            return documents
+        flags = self.published([doc['url'] for doc in documents])
+        new = [doc for doc, seen in zip(documents, flags) if not seen]
+
+        totals, duplicates = Counter(), Counter()
+        for doc, seen in zip(documents, flags):
+            totals[doc['source']] += 1
+            duplicates[doc['source']] += seen
+        for source, total in totals.items():
+            record_dedup_check(source, stage, total - duplicates[source], duplicates[source])
+            if duplicates[source]:
+                logger.info(f"[DEDUP] {stage}: {duplicates[source]}/{total} already published "
+                            f"from {source} ({duplicates[source] / total:.0%})")
+        return new
+
+    def add(self, urls: Iterable[str]) -> bool:
+        """Record URLs as published (call only once the publish succeeded)"""
+        digests = [url_key(url) for url in urls]
+        if not digests:
+            return False
+        client = get_shared_redis_client()
+        if client is None:
+            return False
+        try:
+            expires = self._clock() + self.ttl_seconds
+            client.zadd(DEDUP_KEY, {digest: expires for digest in digests})
+        except redis.RedisError as e:
+            report_redis_failure(e)
+            return False
+        with self._lock:
+            for digest in digests:
+                self._bloom.add(digest)
+        record_dedup_bloom(self._bloom.memory_bytes, self._bloom.count)
+        return True
+
+
+# Singleton instance
+dedup_index = DedupIndex()
@@ -0,0 +1,226 @@
+"""
+Lazy RSS/Atom feed parser
+Reads RSS 2.0, RSS 1.0 (RDF) and Atom feeds with lxml iterparse, yielding
+only the fields the feed scrapers use and stopping at the per-feed limit or
+at the first entry older than the cutoff. Feeds lxml cannot parse (bad
+entities, HTML error pages, ...) go through feedparser instead.
+"""
+from typing import AbstractSet, Dict, Iterator, List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import io
+import feedparser
+from bs4 import BeautifulSoup
+from dateutil import parser as date_parser
+from lxml import etree
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+RSS1_NS = "http://purl.org/rss/1.0/"
+CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+DC_NS = "http://purl.org/dc/elements/1.1/"
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+
+_ENTRY_TAGS = ('item', f'{{{RSS1_NS}}}item', f'{{{ATOM_NS}}}entry')
+_TITLE_TAGS = ('title', f'{{{RSS1_NS}}}title', f'{{{ATOM_NS}}}title')
+_FEED_TAGS = ('channel', f'{{{RSS1_NS}}}channel', f'{{{ATOM_NS}}}feed')
+
+# Child elements per field, in order of preference
+_TITLE = ('title', f'{{{RSS1_NS}}}title', f'{{{ATOM_NS}}}title')
+_LINK = ('link', f'{{{RSS1_NS}}}link')
+_CONTENT = (f'{{{CONTENT_NS}}}encoded', f'{{{ATOM_NS}}}content')
+_SUMMARY = ('description', f'{{{RSS1_NS}}}description', f'{{{ATOM_NS}}}summary')
+_DATES = ('pubDate', f'{{{DC_NS}}}date', f'{{{ATOM_NS}}}published', f'{{{ATOM_NS}}}updated')
+_ID = ('guid', f'{{{ATOM_NS}}}id')
+_ATOM_LINK = f'{{{ATOM_NS}}}link'
+_RDF_ABOUT = f'{{{RDF_NS}}}about'
+
+
+@dataclass
+class ParsedFeed:
+    """Feed title plus the entries kept by parse_feed"""
+    title: Optional[str]
+    entries: List[Dict] = field(default_factory=list)
+    fallback: bool = False  # Parsed by feedparser
+    skipped: int = 0  # Entries left out by skip_ids
+
+
+class _NotAFeed(Exception):
+    """The document parsed as XML but holds no RSS/Atom feed"""
+
+
+def parse_feed_date(value: str) -> Optional[datetime]:
+    """
+    Parse an RFC 822 (RSS) or ISO 8601 (Atom, Dublin Core) date
+    Returned as naive UTC, like feedparser's *_parsed fields
+    """
+    if not value:
+        return None
+    parsed = None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            try:
+                parsed = date_parser.parse(value)
+            except (ValueError, OverflowError):
+                return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _child_text(element, tags) -> str:
+    """Text of the first present child among tags ('' if none)"""
+    for tag in tags:
+        child = element.find(tag)
+        if child is not None:
+            if len(child):  # Inline XHTML content
+                return ' '.join(child.itertext()).strip()
+            return (child.text or '').strip()
+    return ''
+
+
+def _atom_link(element) -> str:
+    for link in element.iterfind(_ATOM_LINK):
+        if link.get('rel', 'alternate') == 'alternate' and link.get('href'):
+            return link.get('href').strip()
+    return ''
+
+
+def _entry_from_element(element) -> Dict:
+    link = _child_text(element, _LINK) or _atom_link(element)
+    return {
+        'id': _child_text(element, _ID) or element.get(_RDF_ABOUT) or link,
+        'title': ' '.join(_child_text(element, _TITLE).split()),
+        'link': link,
+        'content': _child_text(element, _CONTENT),
+        'summary': _child_text(element, _SUMMARY),
+        'published': parse_feed_date(_child_text(element, _DATES))
+    }
+
+
+def _entry_from_feedparser(entry) -> Dict:
+    published = entry.get('published_parsed') or entry.get('updated_parsed')
+    content = entry.content[0].get('value', '') if entry.get('content') else ''
+    return {
+        'id': entry.get('id') or entry.get('link', '').strip(),
+        'title': entry.get('title', '').strip(),
+        'link': entry.get('link', '').strip(),
+        'content': content,
+        'summary': entry.get('summary', '') or entry.get('description', ''),
+        'published': datetime(*published[:6]) if published else None
+    }
+
+
+def _iter_lxml(content: bytes, feed: ParsedFeed) -> Iterator[Dict]:
+    """Yield entries as their closing tags are read, recording the feed title"""
+    context = etree.iterparse(
+        io.BytesIO(content),
+        events=('end',),
+        tag=_ENTRY_TAGS + _TITLE_TAGS,
+        resolve_entities=False,
+        no_network=True
+    )
+    seen_any = False
+    try:
+        for _, element in context:
+            if element.tag in _TITLE_TAGS:
+                parent = element.getparent()
+                if feed.title is None and parent is not None and parent.tag in _FEED_TAGS:
+                    feed.title = ' '.join((element.text or '').split()) or None
+                    seen_any = True
+                continue
+
+            seen_any = True
+            entry = _entry_from_element(element)
+            # Drop the finished entry and any siblings already handled
+            element.clear()
+            parent = element.getparent()
+            while element.getprevious() is not None:
+                del parent[0]
+            yield entry
+    finally:
+        del context
+    if not seen_any:
+        raise _NotAFeed()
+
+
+def _iter_feedparser(content: bytes, feed: ParsedFeed) -> Iterator[Dict]:
+    parsed = feedparser.parse(content)
+    if parsed.bozo and not parsed.entries:
+        logger.warning(f"Feed has errors or is empty (bozo: {parsed.bozo_exception})")
+    feed.title = parsed.feed.get('title') or None
+    for entry in parsed.entries:
+        yield _entry_from_feedparser(entry)
+
+
+def _collect(entries: Iterator[Dict], feed: ParsedFeed, limit: Optional[int],
+             cutoff: Optional[datetime], skip_ids: Optional[AbstractSet[str]]) -> None:
+    for entry in entries:
+        if cutoff is not None and entry['published'] and entry['published'] < cutoff:
+            break  # Feeds list newest first; the rest is older still
+        if skip_ids and entry['id'] in skip_ids:
+            feed.skipped += 1
+            continue
+        feed.entries.append(entry)
+        if limit is not None and len(feed.entries) >= limit:
+            break
+
+
+def parse_feed(content: bytes, limit: Optional[int] = None, cutoff: Optional[datetime] = None,
+               skip_ids: Optional[AbstractSet[str]] = None) -> ParsedFeed:
+    """
+    Parse a feed, stopping at limit entries or the first entry older than cutoff
+
+    Args:
+        content: Raw feed bytes
+        limit: Max entries to keep
+        cutoff: Naive UTC datetime; parsing stops at the first dated entry
+            before it (undated entries are kept)
+        skip_ids: IDs of entries to leave out (already seen); they do not
+            count towards limit
+
+    Returns:
+        ParsedFeed whose entries are dicts with id (guid / Atom id /
+        rdf:about, else the link), title, link, content (full HTML body,
+        if any), summary and published (naive UTC datetime or None)
+    """
+    feed = ParsedFeed(title=None)
+    if not content:
+        return feed
+
+    try:
+        _collect(_iter_lxml(content, feed), feed, limit, cutoff, skip_ids)
+        return feed
+    except (etree.XMLSyntaxError, _NotAFeed) as e:
+        logger.info(f"Falling back to feedparser: {e or 'no RSS/Atom elements'}")
+
+    feed = ParsedFeed(title=None, fallback=True)
+    _collect(_iter_feedparser(content, feed), feed, limit, cutoff, skip_ids)
+    return feed
+
+
+def html_to_text(html: str) -> str:
+    """Plain text of an HTML fragment (entry content or summary)"""
+    if not html:
+        return ''
+    return BeautifulSoup(html, 'html.parser').get_text(separator=' ', strip=True)
+
+
+def parse_feed_text(content: bytes, limit: Optional[int] = None, cutoff: Optional[datetime] = None,
+                    skip_ids: Optional[AbstractSet[str]] = None) -> ParsedFeed:
+    """
+    parse_feed plus a 'text' field per entry: the content (else summary)
+    with HTML stripped
+    All the CPU work of a feed in one call, suitable for the parse pool
+    """
+    feed = parse_feed(content, limit=limit, cutoff=cutoff, skip_ids=skip_ids)
+    for entry in feed.entries:
+        entry['text'] = html_to_text(entry['content'] or entry['summary'])
+    return feed
@@ -0,0 +1,212 @@
+"""
+Adaptive polling of RSS feeds (RSS and tech news scrapers)
+Some feeds publish dozens of items a day, others a few a month, yet every
+feed used to be fetched on every RSS run. Each feed's statistics (moving
+average of the time between its new entries, from their published dates,
+and the streak of polls that found nothing new) decide when it is polled
+next: about when target_items new entries are expected, backing off after
+empty polls, within min_minutes / max_minutes.
+
+Each poll also records how many new entries were expected against how many
+arrived (the scraper_feed_poll_items_total metric and the stored totals),
+to tune the bounds and the smoothing.
+"""
+import os
+import time
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+import redis
+
+from config.loader import get_feed_polling_config
+from config.settings import settings
+from monitoring.metrics import record_feed_poll, record_feed_polls_skipped
+from scrapers.utils.json_fallback_store import JsonFallbackStore
+from storage.redis_client import get_shared_redis_client, report_redis_failure
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Redis key prefix, one hash per feed URL
+FEED_STATS_KEY = "feed:stats:"
+
+# Statistics of feeds that stop being polled expire after 60 days
+FEED_STATS_TTL_SECONDS = 86400 * 60
+
+# Runs start a little earlier or later than the hour; a feed due within this
+# window is polled now rather than one run later
+DUE_SLACK_SECONDS = 300
+
+DEFAULT_MIN_MINUTES = 60
+DEFAULT_MAX_MINUTES = 1440
+DEFAULT_TARGET_ITEMS = 1
+DEFAULT_SMOOTHING = 0.3
+DEFAULT_EMPTY_BACKOFF = 1.5
+
+
+@dataclass
+class FeedStats:
+    """Publishing history of one feed (times are epoch seconds)"""
+    mean_interval: Optional[float] = None   # Moving average of seconds between new entries
+    last_published: Optional[float] = None  # Newest entry seen
+    last_poll: Optional[float] = None
+    next_poll: Optional[float] = None
+    empty_streak: int = 0                   # Consecutive polls without a new entry
+    polls: int = 0
+    expected_items: float = 0.0             # Totals over polls with a known expectation
+    actual_items: int = 0
+
+    def expected_yield(self, now: float) -> Optional[float]:
+        """New entries expected if the feed were polled at now (None until learned)"""
+        if self.mean_interval is None or self.last_poll is None:
+            return None
+        return (now - self.last_poll) / max(self.mean_interval, 1.0)
+
+
+def _epoch(value: datetime) -> float:
+    """Epoch seconds of a feed date (naive dates are UTC)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class FeedStatsStore:
+    """
+    Stores FeedStats per feed URL and schedules each feed's next poll
+    Redis is the primary store; a local JSON file is used when Redis is unavailable
+    """
+
+    def __init__(self, config: Optional[Dict] = None, local_path: Optional[str] = None,
+                 clock: Callable[[], float] = time.time):
+        config = config if config is not None else get_feed_polling_config()
+        self.min_interval = config.get('min_minutes', DEFAULT_MIN_MINUTES) * 60
+        self.max_interval = config.get('max_minutes', DEFAULT_MAX_MINUTES) * 60
+        self.target_items = config.get('target_items', DEFAULT_TARGET_ITEMS)
+        self.smoothing = config.get('smoothing', DEFAULT_SMOOTHING)
+        self.empty_backoff = config.get('empty_backoff', DEFAULT_EMPTY_BACKOFF)
+        self.local = JsonFallbackStore(
+            local_path or os.path.join(settings.LOCAL_CACHE_DIR, "feed_stats.json"), "feed stats")
+        self._clock = clock
+
+    def load(self, urls: List[str]) -> Dict[str, FeedStats]:
+        """Statistics of each feed (empty for feeds never polled)"""
+        client = get_shared_redis_client()
+        if client is not None:
+            try:
+                pipe = client.pipeline()
+                for url in urls:
+                    pipe.hgetall(f"{FEED_STATS_KEY}{url}")
+                return {url: self._stats(stored) for url, stored in zip(urls, pipe.execute())}
+            except redis.RedisError as e:
+                report_redis_failure(e)
+        data = self.local.read()
+        return {url: self._stats(data.get(url, {})) for url in urls}
+
+    def due(self, urls: List[str]) -> List[str]:
+        """
+        Feeds whose next poll time has come, in their original order
+        (all of them when ADAPTIVE_POLLING is off)
+        """
+        if not settings.ADAPTIVE_POLLING or not urls:
+            return list(urls)
+        now = self._clock()
+        stats = self.load(urls)
+        due = [url for url in urls if stats[url].next_poll is None
+               or stats[url].next_poll <= now + DUE_SLACK_SECONDS]
+        skipped = len(urls) - len(due)
+        if skipped:
+            logger.info(f"[FEED STATS] {skipped}/{len(urls)} feeds not due yet")
+            record_feed_polls_skipped(skipped)
+        return due
+
+    def record_poll(self, url: str, published: Iterable[Optional[datetime]],
+                    polled_at: Optional[float] = None) -> FeedStats:
+        """
+        Update a feed's statistics after a poll and schedule its next one
+
+        Call this only for polls that succeeded (200 or 304) and whose entries
+        were published (the handoff applies the scrapers' pending_polls), so a
+        failing feed or a lost batch is retried on the next run.
+
+        Args:
+            url: Feed URL
+            published: Published dates of the entries the poll returned
+                (None for undated entries); entries not newer than the
+                feed's newest known entry are ignored
+            polled_at: When the poll happened (epoch seconds, default now)
+
+        Returns:
+            The updated statistics
+        """
+        now = polled_at if polled_at is not None else self._clock()
+        published = list(published)
+        stats = self.load([url])[url]
+        expected = stats.expected_yield(now)
+
+        dates = sorted(min(_epoch(value), now) for value in published if value is not None)
+        new_dates = [date for date in dates if stats.last_published is None or date > stats.last_published]
+        actual = len(new_dates) + sum(1 for value in published if value is None)
+
+        previous = stats.last_published
+        for date in new_dates:
+            if previous is not None:
+                gap = date - previous
+                if stats.mean_interval is None:
+                    stats.mean_interval = gap
+                else:
+                    stats.mean_interval += self.smoothing * (gap - stats.mean_interval)
+            previous = date
+        stats.last_published = previous
+
+        stats.empty_streak = 0 if actual else stats.empty_streak + 1
+        stats.polls += 1
+        stats.last_poll = now
+        if expected is not None:
+            stats.expected_items += expected
+            stats.actual_items += actual
+        interval = self.poll_interval(stats)
+        stats.next_poll = now + interval
+
+        self._save(url, stats)
+        record_feed_poll(url, expected, actual, interval)
+        return stats
+
+    def poll_interval(self, stats: FeedStats) -> float:
+        """
+        Seconds until the next poll: the time target_items new entries take
+        to arrive, multiplied by empty_backoff per empty poll, within bounds
+        """
+        if stats.mean_interval is None:
+            interval = self.min_interval
+        else:
+            interval = stats.mean_interval * self.target_items
+        interval *= self.empty_backoff ** min(stats.empty_streak, 32)
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    @staticmethod
+    def _stats(stored: Dict) -> FeedStats:
+        stats = FeedStats()
+        for stat in fields(FeedStats):
+            if stored.get(stat.name) not in (None, ''):
+                setattr(stats, stat.name, int(stored[stat.name]) if stat.type is int else float(stored[stat.name]))
+        return stats
+
+    def _save(self, url: str, stats: FeedStats) -> bool:
+        values = {name: value for name, value in asdict(stats).items() if value is not None}
+        client = get_shared_redis_client()
+        if client is not None:
+            try:
+                key = f"{FEED_STATS_KEY}{url}"
+                pipe = client.pipeline()
+                pipe.delete(key)
+                pipe.hset(key, mapping=values)
+                pipe.expire(key, FEED_STATS_TTL_SECONDS)
+                pipe.execute()
+                return True
+            except redis.RedisError as e:
+                report_redis_failure(e)
+        return self.local.set(url, values)
+
+
+# Singleton instance
+feed_stats = FeedStatsStore()
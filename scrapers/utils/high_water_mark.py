@@ -0,0 +1,155 @@
+"""
+Per-source high-water marks for incremental scraping
+Remembers, for each feed / query, the newest published date seen and the
+IDs of recently seen entries, so the next run only parses, enriches and
+emits entries that are new since the last one
+"""
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, FrozenSet, Iterable, Optional
+import redis
+
+from config.settings import settings
+from scrapers.utils.json_fallback_store import JsonFallbackStore
+from storage.redis_client import get_shared_redis_client, report_redis_failure
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Redis key prefix; <prefix><source> is a hash, <prefix><source>:seen a sorted set
+HIGH_WATER_MARK_KEY = "scraper:hwm:"
+
+# Seen IDs kept per source (newest first); feeds and arXiv pages hold far fewer
+MAX_SEEN_IDS = 1000
+
+# Entries published up to this long before the mark are still read, for
+# feeds that add items late or with back-dated timestamps
+LATE_ENTRY_GRACE = timedelta(days=1)
+
+# Marks of sources that stop being scraped expire after 60 days
+HIGH_WATER_MARK_TTL_SECONDS = 86400 * 60
+
+
+@dataclass
+class HighWaterMark:
+    """What a source had already delivered by the end of its last run"""
+    newest: Optional[datetime] = None  # Naive UTC
+    seen: FrozenSet[str] = field(default_factory=frozenset)
+
+    def cutoff(self, window_cutoff: datetime) -> datetime:
+        """
+        The later of the scrape window's cutoff and the mark (less
+        LATE_ENTRY_GRACE); keeps window_cutoff's naive/aware style
+        """
+        if self.newest is None:
+            return window_cutoff
+        mark = self.newest - LATE_ENTRY_GRACE
+        if window_cutoff.tzinfo is not None:
+            mark = mark.replace(tzinfo=timezone.utc)
+        return max(window_cutoff, mark)
+
+    def is_new(self, entry_id: Optional[str]) -> bool:
+        return not entry_id or entry_id not in self.seen
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class HighWaterMarkStore:
+    """
+    Stores a HighWaterMark per source (feed URL, arXiv query, ...)
+    Redis is the primary store; a local JSON file is used when Redis is unavailable
+    """
+
+    def __init__(self, local_path: Optional[str] = None):
+        self.local = JsonFallbackStore(
+            local_path or os.path.join(settings.LOCAL_CACHE_DIR, "high_water_marks.json"), "high-water marks")
+
+    def load(self, source: str) -> HighWaterMark:
+        """
+        Get a source's mark (empty for new sources, or when
+        INCREMENTAL_SCRAPING is off and every run re-reads the full window)
+        """
+        if not settings.INCREMENTAL_SCRAPING:
+            return HighWaterMark()
+
+        client = get_shared_redis_client()
+        if client is not None:
+            try:
+                key = f"{HIGH_WATER_MARK_KEY}{source}"
+                pipe = client.pipeline()
+                pipe.hget(key, 'newest')
+                pipe.zrange(f"{key}:seen", 0, -1)
+                newest, seen = pipe.execute()
+                return self._mark(newest, seen)
+            except redis.RedisError as e:
+                report_redis_failure(e)
+
+        stored = self.local.get(source)
+        return self._mark(stored.get('newest'), stored.get('seen', {}))
+
+    def advance(self, source: str, entry_ids: Iterable[str], newest: Optional[datetime] = None) -> bool:
+        """
+        Record entries delivered by a run
+
+        Call this only once the entries' documents were published (the
+        handoff applies the scrapers' pending_marks), so a failed run reads
+        them again next time.
+
+        Args:
+            source: Feed URL / query the entries came from
+            entry_ids: GUIDs / IDs of the entries
+            newest: Latest published date among them (kept if later than the mark)
+        """
+        entry_ids = [entry_id for entry_id in entry_ids if entry_id]
+        if not entry_ids and newest is None:
+            return False
+        newest = _naive_utc(newest) if newest is not None else None
+        now = time.time()
+
+        client = get_shared_redis_client()
+        if client is not None:
+            try:
+                key = f"{HIGH_WATER_MARK_KEY}{source}"
+                stored = client.hget(key, 'newest')
+                pipe = client.pipeline()
+                if newest is not None and (not stored or newest > datetime.fromisoformat(stored)):
+                    pipe.hset(key, 'newest', newest.isoformat())
+                if entry_ids:
+                    pipe.zadd(f"{key}:seen", {entry_id: now for entry_id in entry_ids})
+                    pipe.zremrangebyrank(f"{key}:seen", 0, -MAX_SEEN_IDS - 1)
+                pipe.expire(key, HIGH_WATER_MARK_TTL_SECONDS)
+                pipe.expire(f"{key}:seen", HIGH_WATER_MARK_TTL_SECONDS)
+                pipe.execute()
+                return True
+            except redis.RedisError as e:
+                report_redis_failure(e)
+        return self.local.update(source, lambda stored: self._advanced(stored, entry_ids, newest, now))
+
+    @staticmethod
+    def _mark(newest: Optional[str], seen: Iterable[str]) -> HighWaterMark:
+        return HighWaterMark(
+            newest=datetime.fromisoformat(newest) if newest else None,
+            seen=frozenset(seen)
+        )
+
+    @staticmethod
+    def _advanced(stored: Dict, entry_ids, newest: Optional[datetime], now: float) -> Dict:
+        """A source's local fallback entry with the entries added"""
+        if newest is not None and (not stored.get('newest')
+                                   or newest > datetime.fromisoformat(stored['newest'])):
+            stored['newest'] = newest.isoformat()
+        seen = stored.setdefault('seen', {})
+        seen.update({entry_id: now for entry_id in entry_ids})
+        if len(seen) > MAX_SEEN_IDS:
+            stored['seen'] = dict(sorted(seen.items(), key=lambda item: item[1])[-MAX_SEEN_IDS:])
+        return stored
+
+
+# Singleton instance
+high_water_marks = HighWaterMarkStore()
@@ -0,0 +1,250 @@
+"""
+Adaptive per-host concurrency (AIMD) with Retry-After support
+Each host starts at a configured concurrency limit that grows additively
+while responses are fast and healthy, and is cut multiplicatively on
+429/503 or when latency climbs well above the host's baseline
+"""
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+import requests
+
+from config.loader import get_host_concurrency_config
+from utils.deadline import Deadline, DeadlineExceeded
+from monitoring.metrics import record_host_concurrency_limit
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Status codes that mean "slow down"
+THROTTLE_STATUS_CODES = {429, 503}
+
+# Longest a single Retry-After can block a host
+MAX_RETRY_AFTER_SECONDS = 300
+
+# Requests to a host blocked for longer than this fail fast instead of waiting
+MAX_THROTTLE_WAIT_SECONDS = 60
+
+# Back-off when a throttling response has no Retry-After (doubles per consecutive throttle)
+BASE_THROTTLE_BACKOFF_SECONDS = 1
+
+# Latency above this multiple of the host's baseline counts as congestion
+LATENCY_CONGESTION_FACTOR = 2.0
+
+# Weight of the newest sample in the latency moving average
+LATENCY_EWMA_ALPHA = 0.2
+
+# Async waiters re-check the host state at least this often
+ASYNC_POLL_SECONDS = 0.05
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date)
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class HostBackoffError(requests.RequestException):
+    """Raised when a host asked us to back off for longer than MAX_THROTTLE_WAIT_SECONDS"""
+
+
+class _HostState:
+    """Mutable AIMD state of one host (guarded by the controller lock)"""
+
+    def __init__(self, limit: float, min_limit: float, max_limit: float):
+        self.limit = limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.consecutive_throttles = 0
+        self.latency_ewma: Optional[float] = None
+        self.latency_baseline: Optional[float] = None
+        self.last_decrease = 0.0
+
+
+class HostConcurrencyController:
+    """
+    Per-host concurrency limits adjusted by AIMD
+
+    Callers wrap each request in acquire() / release(); release() feeds the
+    status, latency and Retry-After back into the host's limit. Limits are
+    per process; the shared token-bucket rate limiter still applies on top.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, clock: Callable[[], float] = time.monotonic):
+        config = config if config is not None else get_host_concurrency_config()
+        self._defaults = config.get('default', {}) or {}
+        self._host_config = config.get('hosts', {}) or {}
+        self.decrease_factor = float(config.get('decrease_factor', 0.5))
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._hosts: Dict[str, _HostState] = {}
+
+    def _state(self, host: str) -> _HostState:
+        """Get (or create) a host's state (lock held)"""
+        state = self._hosts.get(host)
+        if state is None:
+            settings = {**self._defaults, **(self._host_config.get(host) or {})}
+            min_limit = float(settings.get('min', 1))
+            max_limit = float(settings.get('max', 8))
+            initial = float(settings.get('initial', 2))
+            state = self._hosts[host] = _HostState(
+                limit=min(max(initial, min_limit), max_limit),
+                min_limit=min_limit,
+                max_limit=max_limit
+            )
+            record_host_concurrency_limit(host, state.limit)
+        return state
+
+    def limit(self, host: str) -> float:
+        """Current concurrency limit of a host"""
+        with self._condition:
+            return self._state(host).limit
+
+    def blocked_for(self, host: str) -> float:
+        """Seconds until the host's Retry-After / back-off window ends"""
+        with self._condition:
+            return max(0.0, self._state(host).blocked_until - self._clock())
+
+    def check_backoff(self, host: str):
+        """Raise HostBackoffError if the host is blocked for too long to wait out"""
+        wait = self.blocked_for(host)
+        if wait > MAX_THROTTLE_WAIT_SECONDS:
+            raise HostBackoffError(f"{host} asked to back off for another {wait:.0f}s")
+
+    def try_acquire(self, host: str) -> float:
+        """
+        Take a request slot for a host if one is free
+
+        Returns:
+            0 if the slot was taken, otherwise seconds to wait before trying again
+        """
+        with self._condition:
+            state = self._state(host)
+            blocked = state.blocked_until - self._clock()
+            if blocked > 0:
+                return blocked
+            if state.in_flight < max(1, int(state.limit)):
+                state.in_flight += 1
+                return 0.0
+            return ASYNC_POLL_SECONDS
+
+    @staticmethod
+    def _cap_wait(host: str, wait: float, deadline: Optional[Deadline]) -> float:
+        """Shorten a wait so it ends by the deadline; raise once it has passed"""
+        if deadline is None:
+            return wait
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Deadline passed while waiting for a request slot for {host}")
+        return min(wait, remaining)
+
+    def acquire(self, host: str, deadline: Optional[Deadline] = None):
+        """
+        Block until a request slot for the host is free
+
+        Raises:
+            DeadlineExceeded: If the deadline passes before a slot is free
+        """
+        with self._condition:
+            while True:
+                wait = self.try_acquire(host)
+                if wait == 0:
+                    return
+                self._condition.wait(timeout=self._cap_wait(host, wait, deadline))
+
+    async def acquire_async(self, host: str, deadline: Optional[Deadline] = None):
+        """Async version of acquire(); polls instead of blocking the loop"""
+        while True:
+            wait = self.try_acquire(host)
+            if wait == 0:
+                return
+            await asyncio.sleep(self._cap_wait(host, wait, deadline))
+
+    def release(self, host: str, status_code: Optional[int] = None, latency: Optional[float] = None,
+                retry_after: Optional[str] = None):
+        """
+        Return a request slot and adjust the host's limit
+
+        Args:
+            host: Hostname the request went to
+            status_code: Response status (None for connection errors / timeouts)
+            latency: Seconds until the response headers arrived
+            retry_after: Raw Retry-After header value, if any
+        """
+        with self._condition:
+            state = self._state(host)
+            # Only grow the limit when it was actually the bottleneck
+            saturated = state.in_flight >= int(state.limit)
+            state.in_flight = max(0, state.in_flight - 1)
+            now = self._clock()
+
+            if status_code in THROTTLE_STATUS_CODES:
+                state.consecutive_throttles += 1
+                delay = parse_retry_after(retry_after)
+                if delay is None:
+                    delay = BASE_THROTTLE_BACKOFF_SECONDS * 2 ** (state.consecutive_throttles - 1)
+                state.blocked_until = max(state.blocked_until, now + min(delay, MAX_RETRY_AFTER_SECONDS))
+                self._decrease(host, state, now, f"status {status_code}, retry in {delay:.1f}s")
+            elif status_code is None:
+                self._decrease(host, state, now, "connection error")
+            else:
+                state.consecutive_throttles = 0
+                if latency is not None and self._is_congested(state, latency):
+                    self._decrease(host, state, now, f"latency {latency:.2f}s")
+                elif status_code < 500 and saturated:
+                    # Additive increase: about +1 per limit's worth of successful requests
+                    self._set_limit(host, state, state.limit + 1 / state.limit)
+
+            self._condition.notify_all()
+
+    def _is_congested(self, state: _HostState, latency: float) -> bool:
+        """Update the latency average; True if it is well above the baseline"""
+        if state.latency_ewma is None:
+            state.latency_ewma = state.latency_baseline = latency
+            return False
+        state.latency_ewma += LATENCY_EWMA_ALPHA * (latency - state.latency_ewma)
+        if state.latency_ewma < state.latency_baseline:
+            state.latency_baseline = state.latency_ewma
+        else:
+            # Let the baseline drift up slowly so a host that got permanently
+            # slower is not throttled forever
+            state.latency_baseline += 0.01 * (state.latency_ewma - state.latency_baseline)
+        return state.latency_ewma > state.latency_baseline * LATENCY_CONGESTION_FACTOR
+
+    def _decrease(self, host: str, state: _HostState, now: float, reason: str):
+        """Multiplicative decrease, at most once per latency window so one burst counts once"""
+        window = state.latency_ewma or 1.0
+        if now - state.last_decrease < window:
+            return
+        state.last_decrease = now
+        previous = state.limit
+        self._set_limit(host, state, state.limit * self.decrease_factor)
+        logger.warning(f"Concurrency for {host} cut {previous:.1f} -> {state.limit:.1f} ({reason})")
+
+    def _set_limit(self, host: str, state: _HostState, limit: float):
+        limit = min(max(limit, state.min_limit), state.max_limit)
+        if limit != state.limit:
+            state.limit = limit
+            record_host_concurrency_limit(host, limit)
+
+
+# Singleton instance shared by the sync and async HTTP clients
+host_controller = HostConcurrencyController()
@@ -3,14 +3,51 @@ HTTP client with retry logic and timeout handling
 Uses requests library with exponential backoff
 """
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from typing import Optional
-import time
+from dataclasses import dataclass
+from urllib.parse import urlparse
+from requests.structures import CaseInsensitiveDict
+from typing import Dict, Optional
+from config.loader import get_body_limit_config
+from monitoring.metrics import record_body_limit
+from utils.deadline import Deadline
 from utils.logger import setup_logger
+from scrapers.utils.session_registry import session_registry
+from scrapers.utils.host_controller import host_controller, THROTTLE_STATUS_CODES, MAX_THROTTLE_WAIT_SECONDS
+from scrapers.utils.circuit_breaker import circuit_breaker, CircuitOpenError
+from scrapers.utils.single_flight import single_flight
+from scrapers.utils.url_validator import normalize_url
 
 logger = setup_logger(__name__)
 
+# Chunk size for streamed reads
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Servers that omit Content-Type are assumed to send HTML
+DEFAULT_CONTENT_TYPE = 'text/html'
+
+
+class UnsupportedContentTypeError(requests.RequestException):
+    """Raised by get_limited when the response is not an allowed content type"""
+
+
+@dataclass
+class LimitedResponse:
+    """Body of a streamed GET, read up to the content type's byte cap"""
+    url: str
+    status_code: int
+    headers: CaseInsensitiveDict
+    content: bytes
+    truncated: bool = False
+
+# Browser-like headers shared by the sync and async clients
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
 class HTTPClient:
     """
     Robust HTTP client with retries and timeout
@@ -19,55 +56,124 @@ class HTTPClient:
     def __init__(self, timeout: int = 30, max_retries: int = 3):
         self.timeout = timeout
         self.max_retries = max_retries
-        self.session = self._create_session()
+        # Per-client headers; sessions are shared, so never mutate session.headers
+        self.headers = CaseInsensitiveDict(DEFAULT_HEADERS)
+        # Set by the owning scraper for the duration of a run; caps every timeout
+        self.deadline: Optional[Deadline] = None
+        # content type -> max body bytes for get_limited
+        self.body_limits: Dict[str, int] = {
+            content_type.lower(): int(mb * 1024 * 1024)
+            for content_type, mb in get_body_limit_config().items()
+        }
     
-    def _create_session(self) -> requests.Session:
+    @property
+    def session(self) -> requests.Session:
         """
-        Create requests session with retry strategy
+        Pooled session for the calling thread (see SessionRegistry)
+        Connections are reused across clients, scrapers and runs
         """
-        session = requests.Session()
+        return session_registry.get_session(self.max_retries)
+    
+    def _merge_headers(self, extra: Optional[dict] = None) -> CaseInsensitiveDict:
+        """Client headers with per-request overrides"""
+        headers = CaseInsensitiveDict(self.headers)
+        if extra:
+            headers.update(extra)
+        return headers
+    
+    def _send(self, url: str, params: Optional[dict], timeout: int, headers: Optional[dict],
+              stream: bool = False) -> requests.Response:
+        """
+        GET through the host's circuit breaker and adaptive concurrency limit
         
-        retry_strategy = Retry(
-            total=self.max_retries,
-            backoff_factor=1,  # Wait 1s, 2s, 4s between retries
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
+        Hosts with an open circuit raise CircuitOpenError without any network
+        traffic; connection errors, timeouts and 5xx count against the circuit.
+        429/503 responses shrink the host's limit and block it for the
+        Retry-After window; the request is retried once that window ends,
+        unless it is longer than MAX_THROTTLE_WAIT_SECONDS. Requests to a host
+        that is still blocked for longer than that raise HostBackoffError.
+        Timeouts are capped by self.deadline, which raises DeadlineExceeded
+        once it has passed.
+        """
+        host = urlparse(url).netloc
+        if not circuit_breaker.allow(host):
+            raise CircuitOpenError(f"Circuit open for {host}, skipping {url}")
+        host_controller.check_backoff(host)
+        for attempt in range(self.max_retries + 1):
+            attempt_timeout = self.deadline.cap(timeout) if self.deadline else timeout
+            host_controller.acquire(host, self.deadline)
+            try:
+                response = self.session.get(
+                    url,
+                    params=params,
+                    headers=self._merge_headers(headers),
+                    timeout=attempt_timeout,
+                    allow_redirects=True,
+                    stream=stream
+                )
+            except requests.exceptions.RequestException as e:
+                host_controller.release(host, None)
+                circuit_breaker.record_failure(host, str(e))
+                raise
+            except BaseException:
+                host_controller.release(host, None)
+                raise
+            
+            retry_after = response.headers.get('Retry-After')
+            host_controller.release(
+                host,
+                response.status_code,
+                latency=response.elapsed.total_seconds(),
+                retry_after=retry_after
+            )
+            circuit_breaker.record_response(host, response.status_code, retry_after)
+            if response.status_code not in THROTTLE_STATUS_CODES or attempt == self.max_retries:
+                return response
+            
+            wait = host_controller.blocked_for(host)
+            if wait > MAX_THROTTLE_WAIT_SECONDS or (self.deadline and wait >= self.deadline.remaining()):
+                logger.warning(f"{host} asked to back off for {wait:.0f}s, not retrying {url}")
+                return response
+            logger.warning(f"Throttled by {host} (status {response.status_code}), retrying in {wait:.1f}s")
+            response.close()
+        return response
+    
+    def _flight_key(self, kind: str, url: str, params: Optional[dict], headers: Optional[dict]) -> tuple:
+        """Single-flight key: identical requests for the same (normalized) URL"""
+        return (
+            kind,
+            normalize_url(url),
+            tuple(sorted((params or {}).items())),
+            tuple(sorted((k.lower(), v) for k, v in self._merge_headers(headers).items()))
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        # Set headers to mimic browser
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
-        
-        return session
     
-    def get(self, url: str, params: Optional[dict] = None, timeout: Optional[int] = None) -> requests.Response:
+    def get(self, url: str, params: Optional[dict] = None, timeout: Optional[int] = None,
+            headers: Optional[dict] = None) -> requests.Response:
         """
         GET request with error handling
+        Extra headers are merged over this client's headers for this request only
+        Concurrent identical requests (from any client/thread) share one fetch
         """
+        return single_flight.do(
+            self._flight_key('get', url, params, headers),
+            lambda: self._get(url, params, timeout, headers)
+        )
+    
+    def _get(self, url: str, params: Optional[dict], timeout: Optional[int],
+             headers: Optional[dict]) -> requests.Response:
         try:
             timeout = timeout or self.timeout
             logger.info(f"GET request to: {url}")
             
-            response = self.session.get(
-                url,
-                params=params,
-                timeout=timeout,
-                allow_redirects=True
-            )
+            response = self._send(url, params, timeout, headers)
             response.raise_for_status()
             
             logger.info(f"Success: {url} - Status {response.status_code}")
             return response
             
+        except CircuitOpenError as e:
+            logger.warning(str(e))
+            raise
         except requests.exceptions.Timeout:
             logger.error(f"Timeout error for {url}")
             raise
@@ -75,6 +181,67 @@ class HTTPClient:
             logger.error(f"Request error for {url}: {str(e)}")
             raise
     
+    def get_limited(self, url: str, params: Optional[dict] = None, timeout: Optional[int] = None,
+                    headers: Optional[dict] = None) -> LimitedResponse:
+        """
+        Streaming GET that keeps at most body_limits[content type] bytes in memory
+        
+        The content type is checked from the headers before any of the body is
+        read; types without a configured cap raise UnsupportedContentTypeError.
+        Bodies over the cap are cut off and returned with truncated=True.
+        Concurrent identical requests (from any client/thread) share one fetch.
+        """
+        return single_flight.do(
+            self._flight_key('limited', url, params, headers),
+            lambda: self._get_limited(url, params, timeout, headers)
+        )
+    
+    def _get_limited(self, url: str, params: Optional[dict], timeout: Optional[int],
+                     headers: Optional[dict]) -> LimitedResponse:
+        timeout = timeout or self.timeout
+        logger.info(f"GET (streamed) request to: {url}")
+        
+        response = self._send(url, params, timeout, headers, stream=True)
+        try:
+            response.raise_for_status()
+            
+            content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            max_bytes = self.body_limits.get(content_type or DEFAULT_CONTENT_TYPE)
+            if max_bytes is None:
+                record_body_limit("rejected", content_type)
+                raise UnsupportedContentTypeError(f"Unsupported content type '{content_type}' for {url}")
+            
+            chunks = []
+            size = 0
+            truncated = False
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                if size + len(chunk) > max_bytes:
+                    chunks.append(chunk[:max_bytes - size])
+                    truncated = True
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+            
+            if truncated:
+                record_body_limit("truncated", content_type)
+                logger.warning(f"Truncated {url} at {max_bytes} bytes ({content_type})")
+            
+            logger.info(f"Success: {url} - Status {response.status_code}")
+            return LimitedResponse(
+                url=response.url,
+                status_code=response.status_code,
+                headers=response.headers,
+                content=b''.join(chunks),
+                truncated=truncated
+            )
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request error for {url}: {str(e)}")
+            raise
+        finally:
+            # Releases the connection to the pool when fully read, drops it otherwise
+            response.close()
+    
     def post(self, url: str, data: Optional[dict] = None, json: Optional[dict] = None) -> requests.Response:
         """
         POST request with error handling
@@ -84,6 +251,7 @@ class HTTPClient:
             
             response = self.session.post(
                 url,
+                headers=self._merge_headers(),
                 data=data,
                 json=json,
                 timeout=self.timeout
@@ -98,5 +266,9 @@ class HTTPClient:
             raise
     
     def close(self):
-        """Close session"""
-        self.session.close()
\ No newline at end of file
+        """
+        Release this client
+        The pooled session stays open for other scrapers; it is closed by
+        session_registry.close_all() on worker shutdown
+        """
+        pass
\ No newline at end of file
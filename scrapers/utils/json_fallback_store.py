@@ -0,0 +1,70 @@
+"""
+Local JSON fallback for the Redis-backed stores
+One file per store, mapping a key (feed URL, source, ...) to its entry, used
+while Redis is unavailable
+"""
+import json
+import os
+import threading
+from typing import Callable, Dict
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class JsonFallbackStore:
+    """
+    Dict of entries persisted to a local JSON file
+    Writes are serialized by a lock and replace the file atomically
+    """
+
+    def __init__(self, path: str, description: str):
+        """
+        Args:
+            path: JSON file (created on first write)
+            description: What the file holds, for error logs ("feed stats", ...)
+        """
+        self.path = path
+        self.description = description
+        self._lock = threading.Lock()
+
+    def read(self) -> Dict[str, Dict]:
+        """All entries (empty if the file does not exist or cannot be read)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error(f"Error reading local {self.description}: {e}")
+            return {}
+
+    def get(self, key: str) -> Dict:
+        """One entry (empty if missing)"""
+        return self.read().get(key, {})
+
+    def set(self, key: str, entry: Dict) -> bool:
+        """Replace one entry"""
+        return self.update(key, lambda stored: entry)
+
+    def update(self, key: str, update: Callable[[Dict], Dict]) -> bool:
+        """
+        Read-modify-write one entry
+
+        Args:
+            update: Called with the stored entry (empty if missing), returns the new one
+        """
+        with self._lock:
+            try:
+                data = self.read()
+                data[key] = update(data.get(key, {}))
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+                return True
+            except Exception as e:
+                logger.error(f"Error writing local {self.description}: {e}")
+                return False
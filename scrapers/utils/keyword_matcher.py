@@ -0,0 +1,119 @@
+"""
+Keyword relevance matching
+All keywords (config/keywords.yaml plus the tech news search_topics) are
+compiled into one Aho-Corasick automaton over words, so a title or summary
+is scanned once, in time linear in its length, whatever the number of
+keywords - instead of one substring search per keyword.
+
+Matching is on whole words, case-insensitive, with punctuation and hyphens
+treated as spaces ("smart-ports" matches "smart ports"); a keyword also
+matches with a plural last word ("AGV" matches "AGVs").
+"""
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+# Title matches count double in score()
+DEFAULT_TITLE_WEIGHT = 2
+
+_WORD = re.compile(r'[^\W_]+')
+
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall((text or '').lower())
+
+
+def _spellings(keyword: str) -> List[List[str]]:
+    """Word sequences a keyword matches: as written, and with its last word plural"""
+    words = _words(keyword)
+    if not words:
+        return []
+    last = words[-1]
+    if last.endswith('s') and len(last) > 3:
+        return [words, words[:-1] + [last[:-1]]]
+    return [words, words[:-1] + [last + 's']]
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over the words of a keyword list
+    Build through keyword_matcher() to reuse one per keyword list
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._output: List[Tuple[int, ...]] = [()]
+        for keyword in keywords:
+            ends = [self._insert(words) for words in _spellings(keyword)]
+            if ends and not self._output[ends[0]]:  # The first keyword of duplicates wins
+                for state in ends:
+                    self._output[state] = (len(self.keywords),)
+                self.keywords.append(keyword)
+        self._fail = self._link()
+        # Words outside every keyword reset the automaton without a lookup
+        self._vocabulary = frozenset(word for transitions in self._goto for word in transitions)
+
+    def _insert(self, words: List[str]) -> int:
+        """Add a word sequence; returns its final state"""
+        state = 0
+        for word in words:
+            if word not in self._goto[state]:
+                self._goto.append({})
+                self._output.append(())
+                self._goto[state][word] = len(self._goto) - 1
+            state = self._goto[state][word]
+        return state
+
+    def _link(self) -> List[int]:
+        """Failure links (breadth-first), merging each state's outputs with its fallback's"""
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())  # Depth 1 falls back to the root
+        while queue:
+            state = queue.popleft()
+            for word, child in self._goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = self._goto[fallback].get(word, 0)
+                self._output[child] += self._output[fail[child]]
+        return fail
+
+    def find(self, text: str) -> List[str]:
+        """Keywords found in text, in order of first occurrence"""
+        goto, fail, output, vocabulary = self._goto, self._fail, self._output, self._vocabulary
+        found: Dict[int, None] = {}
+        state = 0
+        for word in _words(text):
+            if word not in vocabulary:
+                state = 0
+                continue
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            for index in output[state]:
+                found.setdefault(index, None)
+        return [self.keywords[index] for index in found]
+
+    def score(self, title: str, summary: str, title_weight: int = DEFAULT_TITLE_WEIGHT) -> Tuple[int, List[str]]:
+        """
+        Relevance of an entry: distinct keywords found, those in the title
+        counting title_weight times
+
+        Returns:
+            (score, matched keywords, title matches first)
+        """
+        in_title = self.find(title)
+        in_summary = [keyword for keyword in self.find(summary) if keyword not in in_title]
+        return len(in_title) * title_weight + len(in_summary), in_title + in_summary
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+
+@lru_cache(maxsize=8)
+def keyword_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """The automaton for a keyword list, built once per distinct list (config version)"""
+    return KeywordMatcher(keywords)
@@ -0,0 +1,186 @@
+"""
+Deterministic keyword rotation for per-keyword searches
+Google Patents and Lens.org are searched with a few keywords per run. A
+random sample per run left some keywords unsearched for days and searched
+others run after run. The rotation remembers when each keyword was last
+searched (per source) and picks each run's batch:
+
+1. the keywords that must be searched now for every keyword to be searched
+   within cycle_hours (never searched first, in config order, then oldest
+   first), counting the runs left before each keyword's cycle ends
+2. in the slots left over, the others by time since their last search
+   times their category weight
+
+so every keyword is searched once per cycle (when batch_size keywords per
+run at the source's interval can cover the list) and weighted categories
+more often, only with the capacity the cycle does not need.
+"""
+import math
+import os
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+import redis
+
+from config.loader import get_keyword_categories, get_keyword_rotation_config, get_source_interval_config
+from config.settings import settings
+from monitoring.metrics import record_keyword_rotation
+from scrapers.utils.json_fallback_store import JsonFallbackStore
+from storage.redis_client import get_shared_redis_client, report_redis_failure
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Redis key prefix, one hash (keyword -> last searched, epoch seconds) per source
+KEYWORD_ROTATION_KEY = "scraper:keyword_rotation:"
+
+# Rotation state of sources that stop searching expires after 60 days
+KEYWORD_ROTATION_TTL_SECONDS = 86400 * 60
+
+DEFAULT_CYCLE_HOURS = 96
+DEFAULT_BATCH_SIZE = 5
+
+
+class KeywordRotation:
+    """
+    Picks each run's keywords and records which ones were searched
+    Redis is the primary store; a local JSON file is used when Redis is unavailable
+    """
+
+    def __init__(self, config: Optional[Dict] = None, local_path: Optional[str] = None,
+                 clock: Callable[[], float] = time.time):
+        config = config if config is not None else get_keyword_rotation_config()
+        self.cycle_seconds = config.get('cycle_hours', DEFAULT_CYCLE_HOURS) * 3600
+        self.batch_sizes: Dict[str, int] = config.get('batch_size', {}) or {}
+        self.category_weights: Dict[str, float] = config.get('category_weights', {}) or {}
+        self.local = JsonFallbackStore(
+            local_path or os.path.join(settings.LOCAL_CACHE_DIR, "keyword_rotation.json"), "keyword rotation")
+        self._clock = clock
+        self._categories: Optional[Dict[str, str]] = None  # Loaded on first use
+
+    def category(self, keyword: str) -> str:
+        if self._categories is None:
+            self._categories = get_keyword_categories()
+        return self._categories.get(keyword.lower(), 'default')
+
+    def weight(self, keyword: str) -> float:
+        return self.category_weights.get(self.category(keyword), self.category_weights.get('default', 1))
+
+    def _run_interval(self, source: str) -> float:
+        """Seconds between two runs of a source (the orchestrator's interval)"""
+        intervals = get_source_interval_config()
+        return intervals.get(source, intervals.get('default', settings.SCRAPE_INTERVAL_MINUTES)) * 60
+
+    def next_batch(self, source: str, keywords: List[str], size: Optional[int] = None) -> List[str]:
+        """
+        The keywords to search this run
+
+        Args:
+            source: Searching source (patents, tech_news, ...)
+            keywords: All keywords, in config order
+            size: Keywords per run (default: batch_size[source] in schedule.yaml)
+
+        Returns:
+            Up to size keywords, highest priority first
+        """
+        size = size or self.batch_sizes.get(source, DEFAULT_BATCH_SIZE)
+        keywords = list(dict.fromkeys(keywords))
+        now = self._clock()
+        last_searched = self.load(source)
+        horizon = self._run_interval(source)
+
+        # Earliest cycle end first. runs_left is how many later runs can still
+        # search a keyword before its cycle ends; this run must take as many
+        # as the later runs (size each) cannot fit in time
+        by_deadline = sorted(enumerate(keywords), key=lambda item: (
+            item[1] in last_searched, last_searched.get(item[1], 0), item[0]))
+        required = 0
+        for count, (_, keyword) in enumerate(by_deadline, 1):
+            runs_left = 0
+            if keyword in last_searched:
+                runs_left = max(math.ceil((last_searched[keyword] + self.cycle_seconds - now) / horizon) - 1, 0)
+            required = max(required, count - size * runs_left)
+        if required > size:
+            logger.warning(f"[ROTATION] {source}: {required - size} keywords will pass "
+                           f"{self.cycle_seconds / 3600:.0f}h without a search")
+        batch = [keyword for _, keyword in by_deadline[:min(required, size)]]
+
+        # Spare slots go to the keywords searched longest ago, by category weight
+        spare = sorted((item for item in enumerate(keywords) if item[1] not in batch), key=lambda item: (
+            -(now - last_searched[item[1]]) * self.weight(item[1]) if item[1] in last_searched else -math.inf,
+            item[0]))
+        batch += [keyword for _, keyword in spare[:size - len(batch)]]
+
+        overdue = [keyword for keyword in keywords
+                   if keyword not in last_searched or now - last_searched[keyword] >= self.cycle_seconds]
+        oldest = max((now - last_searched[keyword] for keyword in keywords if keyword in last_searched), default=0)
+        record_keyword_rotation(source, len(overdue), oldest)
+        runs_per_cycle = max(int(self.cycle_seconds // horizon), 1)
+        if len(keywords) > size * runs_per_cycle:
+            logger.warning(
+                f"[ROTATION] {source}: {len(keywords)} keywords need more than {runs_per_cycle} runs "
+                f"of {size}; some will be searched less than once per {self.cycle_seconds / 3600:.0f}h"
+            )
+        logger.info(f"[ROTATION] {source}: {len(batch)}/{len(keywords)} keywords this run, "
+                    f"{len(overdue)} not searched within the cycle")
+        return batch
+
+    def load(self, source: str) -> Dict[str, float]:
+        """Keyword -> last searched (epoch seconds) for a source"""
+        client = get_shared_redis_client()
+        if client is not None:
+            try:
+                stored = client.hgetall(f"{KEYWORD_ROTATION_KEY}{source}")
+                return {keyword: float(value) for keyword, value in stored.items()}
+            except redis.RedisError as e:
+                report_redis_failure(e)
+        return self.local.get(source)
+
+    def mark_searched(self, source: str, keywords: Iterable[str]) -> bool:
+        """
+        Record keywords as searched now
+
+        Call this with the keywords whose search actually ran, so those
+        skipped (deadline, rate limiting) keep their priority.
+        """
+        searched = {keyword: self._clock() for keyword in keywords}
+        if not searched:
+            return False
+        client = get_shared_redis_client()
+        if client is not None:
+            try:
+                key = f"{KEYWORD_ROTATION_KEY}{source}"
+                pipe = client.pipeline()
+                pipe.hset(key, mapping=searched)
+                pipe.expire(key, KEYWORD_ROTATION_TTL_SECONDS)
+                pipe.execute()
+                return True
+            except redis.RedisError as e:
+                report_redis_failure(e)
+        return self.local.update(source, lambda stored: {**stored, **searched})
+
+    def report(self, source: str, keywords: List[str]) -> List[Dict]:
+        """
+        Coverage of each keyword for a source, least recently searched first
+
+        Returns:
+            Dicts with keyword, category, weight, last_searched (ISO 8601 or
+            None if never) and overdue (not searched within cycle_hours)
+        """
+        now = self._clock()
+        last_searched = self.load(source)
+        rows = []
+        for keyword in dict.fromkeys(keywords):
+            last = last_searched.get(keyword)
+            rows.append({
+                'keyword': keyword,
+                'category': self.category(keyword),
+                'weight': self.weight(keyword),
+                'last_searched': datetime.fromtimestamp(last, timezone.utc).isoformat() if last else None,
+                'overdue': last is None or now - last >= self.cycle_seconds
+            })
+        return sorted(rows, key=lambda row: row['last_searched'] or '')
+
+
+# Singleton instance
+keyword_rotation = KeywordRotation()
@@ -0,0 +1,207 @@
+"""
+lxml extraction backend
+Same heuristics as SoupHelper, working directly on lxml.html trees parsed
+from response bytes with compiled XPath. Several times faster than
+BeautifulSoup with html.parser.
+"""
+from typing import Optional, Union
+import re
+from lxml import etree, html as lxml_html
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# lxml guesses Latin-1 for bytes without a charset declaration; UTF-8 is far
+# more common, so bytes that decode as UTF-8 are parsed as such
+_UTF8_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+_DEFAULT_PARSER = lxml_html.HTMLParser()
+
+_LOWER = "translate(@{attr}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+
+def attr_contains(attr: str, value: str) -> str:
+    """XPath predicate: case-insensitive substring match on an attribute"""
+    return f"contains({_LOWER.format(attr=attr)}, '{value}')"
+
+
+# Content heuristics shared with page_scanner (mirror SoupHelper)
+CONTENT_DIV_CLASSES = ('article-content', 'post-content', 'entry-content', 'main-content')
+AD_CLASSES = ('ad', 'advertisement', 'sidebar', 'widget')
+BOILERPLATE_TAGS = frozenset(('nav', 'footer', 'header', 'aside', 'form'))
+PARAGRAPHS = etree.XPath('//p')
+BOILERPLATE = etree.XPath('|'.join(f'.//{tag}' for tag in sorted(BOILERPLATE_TAGS)))
+
+# Compiled XPath for the content heuristics (mirrors SoupHelper)
+_ARTICLE = etree.XPath('(//article)[1]')
+_MAIN = etree.XPath('(//main)[1]')
+_TITLE = etree.XPath('(//title)[1]')
+_H1 = etree.XPath('(//h1)[1]')
+_META_BY_NAME = etree.XPath('(//meta[@name=$name])[1]')
+_META_BY_PROPERTY = etree.XPath('(//meta[@property=$name])[1]')
+_AUTHOR_ELEMENT = etree.XPath(f"(//*[{attr_contains('class', 'author')}])[1]")
+_CONTENT_DIVS = [
+    etree.XPath(f"(//div[{attr_contains('class', name)}])[1]")
+    for name in CONTENT_DIV_CLASSES
+]
+_ADS_AND_WIDGETS = etree.XPath(
+    "//div[" + " or ".join(
+        [attr_contains('class', name) for name in AD_CLASSES]
+        + [attr_contains('id', 'ad')]
+    ) + "]"
+)
+
+
+def _first(xpath: etree.XPath, tree, **variables):
+    found = xpath(tree, **variables)
+    return found[0] if found else None
+
+
+def _strings(element) -> list:
+    """Non-empty stripped text nodes (BeautifulSoup get_text(strip=True) semantics)"""
+    return [s.strip() for s in element.itertext() if s.strip()]
+
+
+class LxmlExtractor:
+    """
+    Drop-in counterpart of SoupHelper operating on lxml.html trees
+
+    Method names match SoupHelper so ContentExtractor can use either backend.
+    """
+
+    @staticmethod
+    def create_soup(html_content: Union[bytes, str]) -> Optional[lxml_html.HtmlElement]:
+        """
+        Parse HTML (preferably raw response bytes) into a tree
+        script/style elements are stripped right away, keeping their tail text
+
+        Returns:
+            Root element, or None for empty / unparseable documents
+        """
+        if not html_content:
+            return None
+        parser = _DEFAULT_PARSER
+        if isinstance(html_content, bytes):
+            try:
+                html_content.decode('utf-8')
+                parser = _UTF8_PARSER
+            except UnicodeDecodeError:
+                pass
+        try:
+            tree = lxml_html.document_fromstring(html_content, parser=parser)
+        except (etree.ParserError, ValueError) as e:
+            logger.debug(f"Unparseable HTML: {e}")
+            return None
+        etree.strip_elements(tree, 'script', 'style', with_tail=False)
+        return tree
+
+    @staticmethod
+    def find_article_content(tree) -> Optional[str]:
+        """
+        Extract article content: <article>, content divs, <main>, then paragraphs
+        """
+        if tree is None:
+            return None
+
+        article = _first(_ARTICLE, tree)
+        if article is not None:
+            return LxmlExtractor.extract_text(article)
+
+        for content_div in _CONTENT_DIVS:
+            div = _first(content_div, tree)
+            if div is not None:
+                return LxmlExtractor.extract_text(div)
+
+        main = _first(_MAIN, tree)
+        if main is not None:
+            return LxmlExtractor.extract_text(main)
+
+        paragraphs = [''.join(_strings(p)) for p in PARAGRAPHS(tree)]
+        paragraphs = [p for p in paragraphs if p]
+        if paragraphs:
+            return '\n\n'.join(paragraphs)
+
+        return None
+
+    @staticmethod
+    def extract_text(element) -> str:
+        """
+        Extract clean text from an element
+        Removes navigation, footer, header, aside and forms
+        """
+        for tag in BOILERPLATE(element):
+            tag.drop_tree()
+
+        text = '\n'.join(_strings(element))
+        lines = [line.strip() for line in text.splitlines()]
+        return '\n\n'.join(line for line in lines if line)
+
+    @staticmethod
+    def extract_page_text(html_content: Union[bytes, str]) -> str:
+        """
+        Main text of a page as a single whitespace-normalized line
+        <article> or <main> if present, otherwise all paragraphs
+        """
+        tree = LxmlExtractor.create_soup(html_content)
+        if tree is None:
+            return ""
+
+        article = _first(_ARTICLE, tree)
+        if article is None:
+            article = _first(_MAIN, tree)
+
+        if article is not None:
+            text = ' '.join(_strings(article))
+        else:
+            text = ' '.join(''.join(_strings(p)) for p in PARAGRAPHS(tree))
+
+        return ' '.join(text.split())
+
+    @staticmethod
+    def find_meta_content(tree, meta_name: str) -> Optional[str]:
+        """
+        Extract content from a meta tag (name=... or og-style property=...)
+        """
+        if tree is None:
+            return None
+        for xpath in (_META_BY_NAME, _META_BY_PROPERTY):
+            meta = _first(xpath, tree, name=meta_name)
+            if meta is not None and meta.get('content'):
+                return meta.get('content')
+        return None
+
+    @staticmethod
+    def find_title(tree) -> Optional[str]:
+        """Page title without the site name, falling back to the first <h1>"""
+        if tree is None:
+            return None
+        title_tag = _first(_TITLE, tree)
+        if title_tag is not None:
+            return re.split(r'\s+[-|]\s+', ''.join(_strings(title_tag)))[0]
+        h1 = _first(_H1, tree)
+        if h1 is not None:
+            return ''.join(_strings(h1))
+        return None
+
+    @staticmethod
+    def find_author(tree) -> Optional[str]:
+        """Author from meta tags or the first element with an 'author' class"""
+        author = LxmlExtractor.find_meta_content(tree, 'author')
+        if author:
+            return author
+        if tree is None:
+            return None
+        element = _first(_AUTHOR_ELEMENT, tree)
+        if element is not None:
+            return ''.join(_strings(element))
+        return None
+
+    @staticmethod
+    def remove_ads_and_widgets(tree):
+        """
+        Remove common ad and widget containers
+        """
+        if tree is None:
+            return tree
+        for element in _ADS_AND_WIDGETS(tree):
+            element.drop_tree()
+        return tree
@@ -0,0 +1,294 @@
+"""
+Near-duplicate detection across sources
+The same press release is republished with small edits by several outlets
+(Port Technology, Maritime Executive, Supply Chain Dive, ...). Exact URL
+dedup cannot see that, so each copy used to reach Graph 2.
+
+Documents are compared by the Jaccard similarity of their word 3-shingle
+sets, estimated with a 64-value MinHash signature (one-permutation
+hashing: each shingle hash goes to one of 64 bins, which keep their
+minimum). Banded LSH finds candidates without comparing every pair:
+signatures sharing all rows of any band land in the same bucket, and only
+those candidates are checked against min_similarity.
+
+Signatures of published documents are kept in Redis (a sorted set scored
+by expiry time) so copies published in a later run are caught as well.
+When Redis is unavailable only the duplicates within a batch are collapsed.
+"""
+import base64
+import hashlib
+import operator
+import re
+import struct
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+import redis
+
+from config.loader import get_near_duplicate_config
+from monitoring.metrics import record_near_duplicates
+from scrapers.utils.dedup_index import url_key
+from scrapers.utils.url_validator import canonical_url
+from storage.redis_client import get_shared_redis_client, report_redis_failure
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Redis sorted set: member = "<url_key>|<base64 signature>", score = expiry (epoch seconds)
+NEAR_DUPLICATE_KEY = "dedup:near_duplicates"
+
+SHINGLE_SIZE = 3
+SIGNATURE_SIZE = 64         # Bins, selected by the top 6 bits of a shingle hash
+SIGNATURE_FORMAT = f">{SIGNATURE_SIZE}I"
+
+# 16 bands of 4 rows: pairs at 0.7 similarity become candidates 99% of the
+# time, unrelated articles (< 0.1) almost never
+LSH_BANDS = 16
+LSH_ROWS = SIGNATURE_SIZE // LSH_BANDS
+
+# Only the start of very long texts is compared
+MAX_WORDS = 5000
+
+DEFAULT_MIN_SIMILARITY = 0.7
+DEFAULT_MIN_WORDS = 40
+DEFAULT_TTL_DAYS = 7
+DEFAULT_REFRESH_SECONDS = 600
+
+_WORD = re.compile(r'\w+')
+_BIN_SHIFT = 64 - (SIGNATURE_SIZE.bit_length() - 1)
+_VALUE_MASK = 0xFFFFFFFF
+_EMPTY = _VALUE_MASK + 1
+_DENSIFY_STEP = 0x9E3779B1
+
+
+def minhash(text: str, min_words: int = DEFAULT_MIN_WORDS) -> Optional[bytes]:
+    """
+    MinHash signature of a text's distinct word 3-shingles
+
+    Args:
+        text: Document text (case and punctuation are ignored)
+        min_words: Texts with fewer words get no signature (None); a
+            handful of shingles cannot tell a copy from a similar headline
+
+    Returns:
+        SIGNATURE_SIZE packed 32-bit values, or None for short texts
+    """
+    words = _WORD.findall((text or '').lower())[:MAX_WORDS]
+    if len(words) < max(min_words, SHINGLE_SIZE):
+        return None
+    shingles = {' '.join(shingle).encode('utf-8') for shingle in zip(*(words[i:] for i in range(SHINGLE_SIZE)))}
+    # blake2b rather than hash(): signatures are compared across processes
+    digests = b''.join([hashlib.blake2b(shingle, digest_size=8).digest() for shingle in shingles])
+
+    mins = [_EMPTY] * SIGNATURE_SIZE
+    for value in struct.unpack(f">{len(shingles)}Q", digests):
+        bin_, value = value >> _BIN_SHIFT, value & _VALUE_MASK
+        if value < mins[bin_]:
+            mins[bin_] = value
+    if _EMPTY in mins:
+        # Densify: an empty bin borrows the next filled bin's value (offset by
+        # the distance), so short texts still compare on every bin
+        values = mins + mins
+        for i in range(SIGNATURE_SIZE):
+            if mins[i] == _EMPTY:
+                distance = 1
+                while values[i + distance] == _EMPTY:
+                    distance += 1
+                mins[i] = (values[i + distance] + distance * _DENSIFY_STEP) & _VALUE_MASK
+    return struct.pack(SIGNATURE_FORMAT, *mins)
+
+
+def similarity(a: bytes, b: bytes) -> float:
+    """Estimated Jaccard similarity of two signatures' shingle sets"""
+    return sum(map(operator.eq, struct.unpack(SIGNATURE_FORMAT, a),
+                   struct.unpack(SIGNATURE_FORMAT, b))) / SIGNATURE_SIZE
+
+
+class MinHashLSH:
+    """
+    In-memory index of signatures answering "which items are at least
+    min_similarity similar to this one" without a linear scan
+    """
+
+    def __init__(self, min_similarity: float = DEFAULT_MIN_SIMILARITY):
+        self.min_similarity = min_similarity
+        self._signatures: Dict[Hashable, bytes] = {}
+        # Band value -> item, or a list of items once several share it
+        # (most buckets hold one item; this keeps the index small)
+        self._buckets: List[Dict[bytes, object]] = [{} for _ in range(LSH_BANDS)]
+
+    @staticmethod
+    def _bands(signature: bytes):
+        width = LSH_ROWS * 4
+        return [signature[band * width:(band + 1) * width] for band in range(LSH_BANDS)]
+
+    def add(self, signature: bytes, item: Hashable):
+        self._signatures[item] = signature
+        for buckets, key in zip(self._buckets, self._bands(signature)):
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = item
+            elif isinstance(bucket, list):
+                bucket.append(item)
+            else:
+                buckets[key] = [bucket, item]
+
+    def query(self, signature: bytes) -> List[Tuple[Hashable, float]]:
+        """(item, similarity) pairs at or above min_similarity, most similar first"""
+        candidates = set()
+        for buckets, key in zip(self._buckets, self._bands(signature)):
+            bucket = buckets.get(key)
+            if isinstance(bucket, list):
+                candidates.update(bucket)
+            elif bucket is not None:
+                candidates.add(bucket)
+        matches = [(item, similarity(signature, self._signatures[item])) for item in candidates]
+        return sorted([match for match in matches if match[1] >= self.min_similarity],
+                      key=lambda match: -match[1])
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+
+class NearDuplicateIndex:
+    """
+    Collapses near-duplicate documents (the near_duplicate graph node) and
+    remembers the signatures of published ones (the handoff node)
+    """
+
+    def __init__(self, config: Optional[Dict] = None, clock: Callable[[], float] = time.time):
+        config = config if config is not None else get_near_duplicate_config()
+        self.min_similarity = config.get('min_similarity', DEFAULT_MIN_SIMILARITY)
+        self.min_words = config.get('min_words', DEFAULT_MIN_WORDS)
+        self.ttl_seconds = config.get('ttl_days', DEFAULT_TTL_DAYS) * 86400
+        self.refresh_seconds = config.get('refresh_seconds', DEFAULT_REFRESH_SECONDS)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._published = MinHashLSH(self.min_similarity)
+        self._loaded_at: Optional[float] = None
+
+    def _ensure_loaded(self, client: redis.Redis):
+        """
+        (Re)build the index of published signatures from Redis, dropping
+        expired entries; reloading picks up other workers' publishes
+        """
+        now = self._clock()
+        with self._lock:
+            if self._loaded_at is not None and now - self._loaded_at < self.refresh_seconds:
+                return
+            pipe = client.pipeline()
+            pipe.zremrangebyscore(NEAR_DUPLICATE_KEY, '-inf', now)
+            pipe.zrange(NEAR_DUPLICATE_KEY, 0, -1)
+            _, members = pipe.execute()
+            index = MinHashLSH(self.min_similarity)
+            for member in members:
+                key, _, signature = member.partition('|')
+                index.add(base64.b64decode(signature), key)
+            self._published = index
+            self._loaded_at = now
+
+    def published_index(self) -> MinHashLSH:
+        """Signatures published within ttl_days (empty when Redis is down)"""
+        client = get_shared_redis_client()
+        if client is None:
+            return MinHashLSH(self.min_similarity)
+        try:
+            self._ensure_loaded(client)
+            return self._published
+        except redis.RedisError as e:
+            report_redis_failure(e)
+            return MinHashLSH(self.min_similarity)
+
+    def collapse(self, documents: List[Dict]) -> List[Dict]:
+        """
+        Keep one representative per cluster of near-identical documents
+
+        Documents close to one published by an earlier run (under another
+        URL) are dropped. Within the batch, each cluster is forwarded once,
+        as its longest text, with the other members' URLs in alternate_urls.
+        Texts too short to compare are always kept.
+
+        Args:
+            documents: Valid documents (url, source, text, ...), in order
+
+        Returns:
+            The representatives, at the position of their cluster's first member
+        """
+        if not documents:
+            return documents
+        published = self.published_index()
+        batch = MinHashLSH(self.min_similarity)
+        clusters: List[List[Dict]] = []
+        slots: List = []  # A short document, or the index of a cluster
+        duplicates: Dict[str, Counter] = defaultdict(Counter)
+
+        for doc in documents:
+            signature = minhash(doc.get('text'), self.min_words)
+            if signature is None:
+                slots.append(doc)
+                continue
+            # The same URL is not a copy of itself (exact dedup handles it)
+            key = url_key(doc['url'])
+            if any(match != key for match, _ in published.query(signature)):
+                duplicates[doc['source']]['published'] += 1
+                continue
+            matches = batch.query(signature)
+            if matches:
+                clusters[matches[0][0]].append(doc)
+                duplicates[doc['source']]['batch'] += 1
+                continue
+            # Only first members are indexed, so clusters cannot chain
+            batch.add(signature, len(clusters))
+            slots.append(len(clusters))
+            clusters.append([doc])
+
+        kept = [slot if isinstance(slot, dict) else self._representative(clusters[slot]) for slot in slots]
+        for source, counts in duplicates.items():
+            for match, count in counts.items():
+                record_near_duplicates(source, match, count)
+        dropped = len(documents) - len(kept)
+        if dropped:
+            logger.info(f"[NEAR-DUP] Collapsed {dropped}/{len(documents)} near-duplicate documents "
+                        f"({sum(counts['published'] for counts in duplicates.values())} already published)")
+        return kept
+
+    @staticmethod
+    def _representative(cluster: List[Dict]) -> Dict:
+        representative = max(cluster, key=lambda doc: len(doc.get('text') or ''))
+        if len(cluster) == 1:
+            return representative
+        alternates, seen = [], {canonical_url(representative['url'])}
+        for doc in cluster:
+            if canonical_url(doc['url']) not in seen:
+                seen.add(canonical_url(doc['url']))
+                alternates.append(doc['url'])
+        return {**representative, 'alternate_urls': alternates}
+
+    def add(self, documents: List[Dict]) -> bool:
+        """Remember published documents' signatures (call only once the publish succeeded)"""
+        entries = []
+        for doc in documents:
+            signature = minhash(doc.get('text'), self.min_words)
+            if signature is not None:
+                entries.append((url_key(doc['url']), signature))
+        if not entries:
+            return False
+        client = get_shared_redis_client()
+        if client is None:
+            return False
+        try:
+            expires = self._clock() + self.ttl_seconds
+            client.zadd(NEAR_DUPLICATE_KEY, {f"{key}|{base64.b64encode(signature).decode('ascii')}": expires
+                                             for key, signature in entries})
+        except redis.RedisError as e:
+            report_redis_failure(e)
+            return False
+        with self._lock:
+            for key, signature in entries:
+                self._published.add(signature, key)
+        return True
+
+
+# Singleton instance
+near_duplicate_index = NearDuplicateIndex()
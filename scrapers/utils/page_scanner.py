@@ -0,0 +1,361 @@
+"""
+Single-pass page scanner
+Collects everything ContentExtractor needs - title, meta tags, author,
+candidate content blocks with their text, paragraphs - in one walk over a
+parsed page, instead of a separate whole-tree search per field. Text inside
+ad/widget containers is skipped during the same walk.
+
+Works on both extraction backends. BeautifulSoup objects are walked node by
+node; lxml.html trees are searched with one combined XPath (a single C-level
+pass) and only the matched blocks are read further.
+"""
+from typing import Dict, Iterator, List, Optional, Tuple
+import re
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from lxml import etree
+from .lxml_extractor import AD_CLASSES, BOILERPLATE, BOILERPLATE_TAGS, CONTENT_DIV_CLASSES, PARAGRAPHS, attr_contains
+
+# Blocks that may hold the article, with their tie-break priority
+# (the order the per-field heuristics used to try them in)
+_ARTICLE_PRIORITY = 3
+_CONTENT_DIV_PRIORITY = 2
+_MAIN_PRIORITY = 1
+
+# Never text; dropped by both backends
+_SKIPPED_TAGS = frozenset(('script', 'style'))
+
+# BeautifulSoup walk events: ('start', element), ('text', str), ('end', element)
+Event = Tuple[str, object]
+
+
+def _walk_soup(soup: BeautifulSoup) -> Iterator[Event]:
+    stack = [(soup, iter(soup.contents))]
+    while stack:
+        tag, children = stack[-1]
+        node = next(children, None)
+        if node is None:
+            stack.pop()
+            if tag is not soup:
+                yield 'end', tag
+        elif isinstance(node, Tag):
+            yield 'start', node
+            stack.append((node, iter(node.contents)))
+        elif type(node) in (NavigableString, CData):  # Not comments, doctypes, ...
+            yield 'text', str(node)
+
+
+def _tag_name(element) -> str:
+    return element.name if isinstance(element, Tag) else element.tag
+
+
+def _attr(element, name: str) -> str:
+    """Attribute value as a lowercase string (bs4 returns class as a list)"""
+    value = element.get(name)
+    if isinstance(value, list):
+        value = ' '.join(value)
+    return (value or '').lower()
+
+
+def _joined(strings: List[str]) -> str:
+    """get_text(strip=True) of the collected strings"""
+    return ''.join(s.strip() for s in strings)
+
+
+class _Block:
+    """A candidate content block being filled during the walk"""
+
+    __slots__ = ('priority', 'order', 'boilerplate_depth', 'strings', 'chars', 'link_chars')
+
+    def __init__(self, priority: int, order: int, boilerplate_depth: int):
+        self.priority = priority
+        self.order = order
+        self.boilerplate_depth = boilerplate_depth  # Nesting at which the block opened
+        self.strings: List[str] = []
+        self.chars = 0
+        self.link_chars = 0
+
+    def score(self) -> float:
+        """
+        Text density: non-link text weighted by its share of the block's
+        text, so link lists and widget piles lose to prose
+        """
+        if not self.chars:
+            return 0.0
+        text = self.chars - self.link_chars
+        return text * text / self.chars
+
+    def text(self) -> str:
+        """Same layout as SoupHelper.extract_text"""
+        lines = [line.strip() for line in '\n'.join(self.strings).splitlines()]
+        return '\n\n'.join(line for line in lines if line)
+
+
+def _block_priority(tag: str, element) -> int:
+    if tag == 'article':
+        return _ARTICLE_PRIORITY
+    if tag == 'main':
+        return _MAIN_PRIORITY
+    if tag == 'div':
+        css_class = _attr(element, 'class')
+        if any(name in css_class for name in CONTENT_DIV_CLASSES):
+            return _CONTENT_DIV_PRIORITY
+    return 0
+
+
+def _is_ad(tag: str, element) -> bool:
+    if tag != 'div':
+        return False
+    css_class = _attr(element, 'class')
+    return any(name in css_class for name in AD_CLASSES) or 'ad' in _attr(element, 'id')
+
+
+def _scan_soup(soup: BeautifulSoup) -> Dict[str, Optional[str]]:
+    events = _walk_soup(soup)
+
+    meta_by_name: Dict[str, str] = {}
+    meta_by_property: Dict[str, str] = {}
+    title: Optional[List[str]] = None
+    h1: Optional[List[str]] = None
+    author: Optional[List[str]] = None
+    blocks: List[_Block] = []
+    open_blocks: List[_Block] = []
+    paragraphs: List[str] = []
+    paragraph: Optional[List[str]] = None
+
+    # Per open element: what its start opened, undone at its end
+    frames: List[tuple] = []
+    skip_depth = ad_depth = boilerplate_depth = link_depth = 0
+    collecting: List[List[str]] = []  # title / h1 / author strings being read
+
+    for event, item in events:
+        if event == 'text':
+            if skip_depth:
+                continue
+            for strings in collecting:
+                strings.append(item)
+            if ad_depth:
+                continue
+            if paragraph is not None:
+                paragraph.append(item)
+            stripped = item.strip()
+            if stripped:
+                for block in open_blocks:
+                    if boilerplate_depth == block.boilerplate_depth:
+                        block.strings.append(item)
+                        block.chars += len(stripped)
+                        if link_depth:
+                            block.link_chars += len(stripped)
+            continue
+
+        if event == 'end':
+            tag, opened = frames.pop()
+            if 'skip' in opened:
+                skip_depth -= 1
+            if 'ad' in opened:
+                ad_depth -= 1
+            if 'boilerplate' in opened:
+                boilerplate_depth -= 1
+            if 'link' in opened:
+                link_depth -= 1
+            if 'block' in opened:
+                open_blocks.pop()
+            if 'paragraph' in opened:
+                text = _joined(paragraph)
+                if text:
+                    paragraphs.append(text)
+                paragraph = None
+            for key in ('title', 'h1', 'author'):
+                if key in opened:
+                    collecting.pop()
+            continue
+
+        element = item
+        tag = _tag_name(element)
+        opened = set()
+        if tag in _SKIPPED_TAGS:
+            skip_depth += 1
+            opened.add('skip')
+        elif tag == 'meta':
+            content = element.get('content')
+            name, prop = element.get('name'), element.get('property')
+            if name:
+                meta_by_name.setdefault(name, content)
+            if prop:
+                meta_by_property.setdefault(prop, content)
+        elif tag == 'title' and title is None:
+            title = []
+            collecting.append(title)
+            opened.add('title')
+        elif tag == 'h1' and h1 is None:
+            h1 = []
+            collecting.append(h1)
+            opened.add('h1')
+
+        if author is None and 'author' in _attr(element, 'class'):
+            author = []
+            collecting.append(author)
+            opened.add('author')
+
+        if not ad_depth and _is_ad(tag, element):
+            opened.add('ad')
+            ad_depth += 1
+        if not ad_depth:
+            priority = _block_priority(tag, element)
+            if priority:
+                block = _Block(priority, len(blocks), boilerplate_depth)
+                blocks.append(block)
+                open_blocks.append(block)
+                opened.add('block')
+            elif tag == 'p' and paragraph is None:
+                paragraph = []
+                opened.add('paragraph')
+        if tag in BOILERPLATE_TAGS:
+            boilerplate_depth += 1
+            opened.add('boilerplate')
+        if tag == 'a':
+            link_depth += 1
+            opened.add('link')
+        frames.append((tag, opened))
+
+    author_text = _joined(author) if author is not None else None
+    title_text = _joined(title) if title is not None else None
+    h1_text = _joined(h1) if h1 is not None else None
+    return _result(meta_by_name, meta_by_property, title_text, h1_text, author_text, blocks, paragraphs)
+
+
+def _result(meta_by_name: Dict[str, str], meta_by_property: Dict[str, str],
+            title: Optional[str], h1: Optional[str], author: Optional[str],
+            blocks: List[_Block], paragraphs: List[str]) -> Dict[str, Optional[str]]:
+    def meta(name: str) -> Optional[str]:
+        return meta_by_name.get(name) or meta_by_property.get(name) or None
+
+    page_title = None
+    if title is not None:
+        page_title = re.split(r'\s+[-|]\s+', title)[0]
+    elif h1 is not None:
+        page_title = h1
+
+    content = None
+    scored = [block for block in blocks if block.chars]
+    if scored:
+        best = max(scored, key=lambda block: (block.score(), block.priority, -block.order))
+        content = best.text()
+    elif paragraphs:
+        content = '\n\n'.join(paragraphs)
+
+    return {
+        'title': page_title,
+        'description': meta('description'),
+        'author': meta('author') or author,
+        'content': content
+    }
+
+
+def _any_contains(attr: str, names) -> str:
+    return ' or '.join(attr_contains(attr, name) for name in names)
+
+
+# Everything the scan needs from the whole tree, in document order
+_LXML_SCAN = etree.XPath(
+    "(//title)[1] | (//h1)[1] | //meta[@name or @property] | //article | //main"
+    f" | //div[{_any_contains('class', CONTENT_DIV_CLASSES + AD_CLASSES)} or {_any_contains('id', ['ad'])}]"
+    f" | (//*[@class][{_any_contains('class', ['author'])}])[1]"
+)
+# Text node lists straight from libxml2 (itertext builds an element proxy per node)
+_TEXT = etree.XPath('.//text()', smart_strings=False)
+_LINK_TEXT = etree.XPath('.//a//text()', smart_strings=False)
+
+
+def _fill_block(block: _Block, element, ads: set, in_link: bool = False) -> None:
+    """Add element's text to block, leaving out nested boilerplate and ads"""
+    in_link = in_link or element.tag == 'a'
+    _add_text(block, element.text, in_link)
+    for child in element:
+        # Comments and skipped children still carry element's text in their tail
+        if isinstance(child.tag, str) and child.tag not in BOILERPLATE_TAGS and child not in ads:
+            _fill_block(block, child, ads, in_link)
+        _add_text(block, child.tail, in_link)
+
+
+def _fill_block_fast(block: _Block, element) -> None:
+    """_fill_block for a block without nested boilerplate or ads, counting in C"""
+    block.strings = _TEXT(element)  # Blank strings vanish in text()
+    block.chars = sum(map(len, map(str.strip, block.strings)))
+    block.link_chars = sum(map(len, map(str.strip, _LINK_TEXT(element))))
+
+
+def _add_text(block: _Block, text: Optional[str], in_link: bool) -> None:
+    if text:
+        stripped = text.strip()
+        if stripped:
+            block.strings.append(text)
+            block.chars += len(stripped)
+            if in_link:
+                block.link_chars += len(stripped)
+
+
+def _scan_lxml(root) -> Dict[str, Optional[str]]:
+    meta_by_name: Dict[str, str] = {}
+    meta_by_property: Dict[str, str] = {}
+    title = h1 = author = None
+    blocks: List[_Block] = []
+    paragraphs: List[str] = []
+    found = _LXML_SCAN(root)
+    ads = {element for element in found if _is_ad(element.tag, element)}
+
+    for element in found:
+        tag = element.tag
+        if tag == 'meta':
+            content = element.get('content')
+            name, prop = element.get('name'), element.get('property')
+            if name:
+                meta_by_name.setdefault(name, content)
+            if prop:
+                meta_by_property.setdefault(prop, content)
+            continue
+        if tag == 'title' and title is None:
+            title = _joined(_TEXT(element))
+        elif tag == 'h1' and h1 is None:
+            h1 = _joined(_TEXT(element))
+        if author is None and 'author' in _attr(element, 'class'):
+            author = _joined(_TEXT(element))
+
+        if element in ads or any(ancestor in ads for ancestor in element.iterancestors('div')):
+            continue
+        priority = _block_priority(tag, element)
+        if priority:
+            block = _Block(priority, len(blocks), 0)
+            if BOILERPLATE(element) or any(element in ad.iterancestors() for ad in ads):
+                _fill_block(block, element, ads)
+            else:
+                _fill_block_fast(block, element)
+            blocks.append(block)
+
+    if not any(block.chars for block in blocks):
+        # Paragraphs are only the fallback, so only then are they searched for
+        for element in PARAGRAPHS(root):
+            if not any(ancestor in ads for ancestor in element.iterancestors('div')):
+                text = _joined(_TEXT(element))
+                if text:
+                    paragraphs.append(text)
+    return _result(meta_by_name, meta_by_property, title, h1, author, blocks, paragraphs)
+
+
+def scan_page(root) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Collect a page's title, description, author and main content at once
+
+    Args:
+        root: BeautifulSoup object or lxml.html root element
+
+    Returns:
+        {'title', 'description', 'author', 'content'} (values may be None),
+        or None for an unparsed page. content is the densest candidate block
+        (<article>, <main>, article/post/entry/main-content divs) without
+        boilerplate or ads, else the page's paragraphs.
+    """
+    if root is None:
+        return None
+    if isinstance(root, BeautifulSoup):
+        return _scan_soup(root)
+    return _scan_lxml(root)
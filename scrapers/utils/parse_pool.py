@@ -0,0 +1,101 @@
+"""
+Bounded process pool for CPU-bound parsing
+Scrapers fetch on their own threads, but BeautifulSoup/lxml parsing holds
+the GIL, so parallel scrapers serialize on it. Raw bytes are handed to worker
+processes instead and only the extracted dicts come back.
+
+Tasks must be picklable: module-level functions, static methods or
+classmethods, called with plain data (bytes, str, datetime, ...).
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from config.settings import settings
+from monitoring.metrics import record_parse_task
+from utils.deadline import Deadline, DeadlineExceeded
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ParsePool:
+    """
+    Runs parsing tasks in a lazily started process pool
+
+    With 0 workers, or where child processes cannot be started (e.g. inside
+    a daemonic worker process), tasks run in the calling thread.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = settings.PARSE_POOL_WORKERS if workers is None else workers
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._disabled = self.workers <= 0
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if self._disabled:
+                return None
+            if self._executor is None:
+                # spawn: forking a process that runs scraper threads can
+                # copy locks held by other threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+                logger.info(f"Started parse pool with {self.workers} processes")
+            return self._executor
+
+    def _discard_executor(self, disable: bool):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._disabled = self._disabled or disable
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, fn: Callable[..., Any], *args, deadline: Optional[Deadline] = None, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) in a worker process and return its result
+
+        Exceptions raised by fn propagate to the caller unchanged.
+
+        Args:
+            deadline: Optional; the caller stops waiting for the worker once it passes
+
+        Raises:
+            DeadlineExceeded: If the deadline passes before the worker returns
+        """
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                future = executor.submit(fn, *args, **kwargs)
+            except (AssertionError, OSError, RuntimeError) as e:
+                # e.g. "daemonic processes are not allowed to have children"
+                logger.warning(f"Parse pool unavailable, parsing in-thread: {e}")
+                self._discard_executor(disable=True)
+            else:
+                try:
+                    result = future.result(timeout=deadline.remaining() if deadline is not None else None)
+                    record_parse_task("process")
+                    return result
+                except FuturesTimeoutError:
+                    future.cancel()  # Only stops a task still queued
+                    raise DeadlineExceeded(f"Deadline passed while parsing with {fn.__qualname__}")
+                except BrokenProcessPool as e:
+                    # A worker died (e.g. out of memory); start a fresh pool next time
+                    logger.warning(f"Parse pool worker died, retrying in-thread: {e}")
+                    self._discard_executor(disable=False)
+
+        record_parse_task("inline")
+        return fn(*args, **kwargs)
+
+    def shutdown(self):
+        """Stop the worker processes (a later run() starts new ones)"""
+        self._discard_executor(disable=False)
+
+
+# Singleton instance shared by all scrapers in the process
+parse_pool = ParsePool()
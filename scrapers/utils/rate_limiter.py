@@ -0,0 +1,127 @@
+"""
+Distributed per-host token-bucket rate limiter
+Buckets live in Redis so threads, processes and Celery worker nodes hitting
+the same host share one budget. Falls back to in-process buckets when Redis
+is unavailable.
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+import redis
+
+from storage.redis_client import get_shared_redis_client, report_redis_failure
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Redis key prefix, one hash per host
+RATE_LIMIT_KEY = "ratelimit:"
+
+# Idle buckets are full again after capacity / rate seconds; keep them a bit longer
+BUCKET_TTL_SECONDS = 3600
+
+# Reserve one token and return how long the caller must wait for it.
+# Tokens may go negative: each reservation queues behind the previous ones,
+# so concurrent callers get increasing waits instead of all retrying at once.
+# A caller that cannot wait max_wait seconds (ARGV[4], negative = no limit)
+# gets the wait without taking the token.
+# Uses the Redis server clock so worker nodes with clock drift agree.
+RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+local max_wait = tonumber(ARGV[4])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - 1
+if tokens < 0 and max_wait >= 0 and -tokens / rate >= max_wait then
+    return tostring(-tokens / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], ttl)
+if tokens >= 0 then
+    return '0'
+end
+return tostring(-tokens / rate)
+"""
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket per host
+
+    rate is in tokens (requests) per second, capacity is the allowed burst.
+    Callers only wait when the bucket is empty.
+    """
+
+    def __init__(self, capacity: float = 1, clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self._clock = clock
+        self._scripts = {}  # client id -> registered script
+        self._lock = threading.Lock()
+        self._local_buckets: Dict[str, Tuple[float, float]] = {}  # host -> (tokens, timestamp)
+
+    def reserve(self, host: str, rate: float, max_wait: Optional[float] = None) -> float:
+        """
+        Take one token from the host's bucket
+
+        Args:
+            host: Bucket key (hostname)
+            rate: Refill rate in requests per second
+            max_wait: Longest the caller can wait; a wait at least this long
+                is returned without taking the token
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        if rate <= 0:
+            return 0.0
+
+        client = get_shared_redis_client()
+        if client is None:
+            return self._reserve_local(host, rate, max_wait)
+        
+        try:
+            script = self._scripts.get(id(client))
+            if script is None:
+                script = self._scripts[id(client)] = client.register_script(RESERVE_SCRIPT)
+            wait = script(keys=[f"{RATE_LIMIT_KEY}{host}"],
+                          args=[rate, self.capacity, BUCKET_TTL_SECONDS, -1 if max_wait is None else max_wait])
+            return float(wait)
+        except redis.RedisError as e:
+            report_redis_failure(e)
+            return self._reserve_local(host, rate, max_wait)
+
+    def acquire(self, host: str, rate: float) -> float:
+        """
+        Block until a token is available for the host
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(host, rate)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def _reserve_local(self, host: str, rate: float, max_wait: Optional[float] = None) -> float:
+        """In-process version of RESERVE_SCRIPT"""
+        with self._lock:
+            now = self._clock()
+            tokens, ts = self._local_buckets.get(host, (self.capacity, now))
+            tokens = min(self.capacity, tokens + max(0.0, now - ts) * rate) - 1
+            if tokens < 0 and max_wait is not None and -tokens / rate >= max_wait:
+                return -tokens / rate
+            self._local_buckets[host] = (tokens, now)
+        return 0.0 if tokens >= 0 else -tokens / rate
+
+
+# Singleton instance shared by all scrapers in the process
+rate_limiter = TokenBucketRateLimiter()
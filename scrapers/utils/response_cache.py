@@ -0,0 +1,191 @@
+"""
+On-disk HTTP response cache for full-text article fetches
+Entries are keyed by a hash of the URL, store the compressed body plus a
+few response headers, expire after a per-source TTL and are evicted
+least-recently-used once the cache exceeds its size cap
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from typing import Dict, Optional, Tuple
+
+from config.loader import get_response_cache_config
+from config.settings import settings
+from monitoring.metrics import record_response_cache_lookup, record_response_cache_evictions
+from scrapers.utils.url_validator import normalize_url
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Response headers worth keeping alongside the body
+CACHED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+class ResponseCache:
+    """
+    Content cache on local disk, safe for concurrent use by scraping threads
+
+    Writes go to a temp file and are atomically renamed into place, so
+    readers (including other worker processes sharing the directory) never
+    see partial entries. File mtime doubles as the LRU timestamp.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None,
+                 default_ttl: Optional[int] = None):
+        config = get_response_cache_config()
+        self.cache_dir = cache_dir or os.path.join(settings.LOCAL_CACHE_DIR, "http")
+        self.max_bytes = max_bytes if max_bytes is not None else int(config.get('max_size_mb', 512)) * 1024 * 1024
+        ttl_hours = config.get('ttl_hours', {}) or {}
+        self.default_ttl = default_ttl if default_ttl is not None else int(ttl_hours.get('default', 168) * 3600)
+        self._ttl_by_source = {source: int(hours * 3600) for source, hours in ttl_hours.items()}
+
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Tuple[int, float]]] = None  # path -> (size, mtime)
+        self._total_bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'bytes_saved': 0, 'evictions': 0}
+
+    def ttl_for(self, source: str) -> int:
+        """TTL in seconds for a source key (see response_cache in schedule.yaml)"""
+        return self._ttl_by_source.get(source, self.default_ttl)
+
+    def get(self, url: str) -> Optional[bytes]:
+        """
+        Get a cached body
+
+        Returns:
+            Decompressed body, or None on miss / expiry / unreadable entry
+        """
+        path = self._path_for(url)
+        try:
+            with open(path, 'rb') as f:
+                meta = json.loads(f.readline())
+                if time.time() - meta['stored_at'] > meta['ttl']:
+                    self._record(hit=False)
+                    return None
+                body = zlib.decompress(f.read())
+            # Touch for LRU ordering
+            os.utime(path)
+            with self._lock:
+                if self._index is not None and path in self._index:
+                    self._index[path] = (self._index[path][0], time.time())
+            self._record(hit=True, size=len(body))
+            return body
+        except FileNotFoundError:
+            self._record(hit=False)
+            return None
+        except Exception as e:
+            logger.warning(f"Unreadable cache entry for {url}: {e}")
+            self._record(hit=False)
+            return None
+
+    def put(self, url: str, body: bytes, headers=None, ttl: Optional[int] = None) -> bool:
+        """
+        Store a response body
+
+        Args:
+            url: Request URL
+            body: Raw (uncompressed) response body
+            headers: Response headers; only CACHED_HEADERS are kept
+            ttl: Seconds the entry stays fresh (default_ttl if omitted)
+        """
+        headers = headers or {}
+        meta = {
+            'url': url,
+            'stored_at': time.time(),
+            'ttl': ttl if ttl is not None else self.default_ttl,
+            'size': len(body),
+            'headers': {name: headers[name] for name in CACHED_HEADERS if headers.get(name)}
+        }
+        path = self._path_for(url)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(json.dumps(meta).encode('utf-8') + b'\n')
+                f.write(zlib.compress(body, 6))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not cache response for {url}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+
+        size = os.path.getsize(path)
+        with self._lock:
+            self._load_index()
+            previous = self._index.get(path)
+            self._total_bytes += size - (previous[0] if previous else 0)
+            self._index[path] = (size, time.time())
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Counters since process start (hits, misses, bytes_saved, evictions)"""
+        with self._lock:
+            return dict(self._stats)
+
+    def _path_for(self, url: str) -> str:
+        """Content-addressed path: sha256 of the normalized URL, fanned out by prefix"""
+        key = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], f"{key}.bin")
+
+    def _record(self, hit: bool, size: int = 0):
+        with self._lock:
+            if hit:
+                self._stats['hits'] += 1
+                self._stats['bytes_saved'] += size
+            else:
+                self._stats['misses'] += 1
+        record_response_cache_lookup(hit, size)
+
+    def _load_index(self):
+        """Scan the cache directory once to learn sizes and LRU order (lock held)"""
+        if self._index is not None:
+            return
+        self._index = {}
+        self._total_bytes = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith('.bin'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                self._index[path] = (st.st_size, st.st_mtime)
+                self._total_bytes += st.st_size
+
+    def _evict(self):
+        """Drop least-recently-used entries until 90% of max_bytes (lock held)"""
+        target = self.max_bytes * 0.9
+        evicted = 0
+        for path, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # Already evicted by another process
+            except OSError as e:
+                logger.warning(f"Could not evict cache entry {path}: {e}")
+                continue
+            del self._index[path]
+            self._total_bytes -= size
+            evicted += 1
+
+        if evicted:
+            self._stats['evictions'] += evicted
+            record_response_cache_evictions(evicted)
+            logger.info(f"Response cache evicted {evicted} entries")
+
+
+# Singleton instance shared by all scrapers in the process
+response_cache = ResponseCache()
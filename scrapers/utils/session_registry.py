@@ -0,0 +1,155 @@
+"""
+Process-wide registry of pooled HTTP sessions
+Scrapers are rebuilt on every run, but their connection pools live here so
+keep-alive TCP/TLS connections are reused across scrapers and runs in a
+long-lived Celery worker
+"""
+import threading
+from typing import Dict
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from config.loader import get_connection_pool_config
+from monitoring.metrics import record_new_connection
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    """Connection pool that reports every new (non-reused) connection"""
+
+    def _new_conn(self):
+        session_registry._count_new_connection(self.scheme)
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    """HTTPS pool - each new connection costs a TLS handshake"""
+
+    def _new_conn(self):
+        session_registry._count_new_connection(self.scheme)
+        return super()._new_conn()
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools count newly opened connections"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool,
+        }
+
+
+class SessionRegistry:
+    """
+    Hands out requests sessions backed by shared, tuned connection pools
+
+    requests.Session objects are not guaranteed thread-safe, so each thread
+    gets its own lightweight Session. All of them mount the same adapters,
+    and the adapters own the urllib3 pools, so connections are shared.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._adapters: Dict[int, Dict[str, HTTPAdapter]] = {}  # max_retries -> prefix -> adapter
+        self._new_connections: Dict[str, int] = {'http': 0, 'https': 0}
+
+    def get_session(self, max_retries: int = 3) -> requests.Session:
+        """
+        Get the calling thread's session for a retry policy
+
+        Args:
+            max_retries: urllib3 retries for connection errors and 500/502/504
+
+        Returns:
+            requests.Session sharing the registry's connection pools
+        """
+        sessions = getattr(self._local, 'sessions', None)
+        if sessions is None:
+            sessions = self._local.sessions = {}
+
+        session = sessions.get(max_retries)
+        if session is None:
+            session = requests.Session()
+            for prefix, adapter in self._get_adapters(max_retries).items():
+                session.mount(prefix, adapter)
+            sessions[max_retries] = session
+        return session
+
+    def _get_adapters(self, max_retries: int) -> Dict[str, HTTPAdapter]:
+        """Create the shared adapters for a retry policy on first use"""
+        with self._lock:
+            if max_retries in self._adapters:
+                return self._adapters[max_retries]
+
+            config = get_connection_pool_config()
+            pool_connections = config.get('pool_connections', 50)
+            pool_maxsize = config.get('pool_maxsize', 10)
+
+            def make_adapter(maxsize: int) -> HTTPAdapter:
+                retry_strategy = Retry(
+                    total=max_retries,
+                    backoff_factor=1,  # Wait 1s, 2s, 4s between retries
+                    # 429/503 are left to HTTPClient, which honours Retry-After
+                    # through the per-host concurrency controller
+                    status_forcelist=[500, 502, 504],
+                    respect_retry_after_header=False,
+                    allowed_methods=["HEAD", "GET", "OPTIONS"]
+                )
+                return PooledHTTPAdapter(
+                    pool_connections=pool_connections,
+                    pool_maxsize=maxsize,
+                    max_retries=retry_strategy
+                )
+
+            default_adapter = make_adapter(pool_maxsize)
+            adapters = {'http://': default_adapter, 'https://': default_adapter}
+
+            # Per-host pool sizes; mounted with longer prefixes so they take precedence
+            for host, maxsize in (config.get('hosts') or {}).items():
+                host_adapter = make_adapter(maxsize)
+                adapters[f'http://{host}'] = host_adapter
+                adapters[f'https://{host}'] = host_adapter
+
+            self._adapters[max_retries] = adapters
+            logger.info(f"Created pooled HTTP adapters (retries={max_retries}, pool_maxsize={pool_maxsize})")
+            return adapters
+
+    def _count_new_connection(self, scheme: str):
+        """Called by the counting pools whenever a connection is opened"""
+        with self._lock:
+            self._new_connections[scheme] = self._new_connections.get(scheme, 0) + 1
+        record_new_connection(scheme)
+
+    def new_connection_count(self, scheme: str = 'https') -> int:
+        """
+        Total connections opened since process start
+        For 'https' this is the number of TLS handshakes
+        """
+        with self._lock:
+            return self._new_connections.get(scheme, 0)
+
+    def close_all(self):
+        """Close every pooled connection (called on worker shutdown)"""
+        with self._lock:
+            closed = set()
+            for adapters in self._adapters.values():
+                for adapter in adapters.values():
+                    if id(adapter) not in closed:
+                        adapter.close()
+                        closed.add(id(adapter))
+            self._adapters.clear()
+        # Sessions created before close_all() in other threads still mount the
+        # closed adapters; urllib3 simply reopens pools on their next request
+        self._local = threading.local()
+        logger.info("Closed pooled HTTP sessions")
+
+
+# Singleton instance
+session_registry = SessionRegistry()
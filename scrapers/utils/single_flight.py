@@ -0,0 +1,81 @@
+"""
+Single-flight request coalescing
+Scrapers running in parallel threads often resolve to the same article URL;
+concurrent fetches of one key share a single in-flight call and its result
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+from monitoring.metrics import record_duplicate_fetch_avoided
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class _Call:
+    """One in-flight call and its outcome"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key
+
+    The first caller (the leader) runs the function; callers arriving while
+    it is in flight wait and receive the same result or exception. Once the
+    call finishes the key is forgotten, so later calls fetch again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._stats = {'calls': 0, 'duplicates_avoided': 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn() unless a call for key is already in flight
+
+        Returns:
+            fn()'s result (shared with concurrent callers)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+                self._stats['calls'] += 1
+            else:
+                leader = False
+                self._stats['duplicates_avoided'] += 1
+
+        if not leader:
+            record_duplicate_fetch_avoided()
+            logger.debug(f"Joining in-flight fetch for {key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters since process start (calls, duplicates_avoided)"""
+        with self._lock:
+            return dict(self._stats)
+
+
+# Singleton instance shared by all HTTP clients in the process
+single_flight = SingleFlight()
@@ -4,6 +4,8 @@ Common parsing functions
 """
 from bs4 import BeautifulSoup
 from typing import Optional, List
+import re
+from config.settings import settings
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -14,17 +16,20 @@ class SoupHelper:
     """
     
     @staticmethod
-    def create_soup(html_content: str, parser: str = "html.parser") -> BeautifulSoup:
+    def create_soup(html_content: str, parser: Optional[str] = None) -> BeautifulSoup:
         """
         Create BeautifulSoup object
         
         Args:
-            html_content: HTML string
-            parser: Parser to use (html.parser, lxml, html5lib)
+            html_content: HTML string or response bytes
+            parser: Parser to use (html.parser, lxml, html5lib); defaults to
+                lxml unless HTML_EXTRACTION_BACKEND is "bs4"
         
         Returns:
             BeautifulSoup object
         """
+        if parser is None:
+            parser = "html.parser" if settings.HTML_EXTRACTION_BACKEND == "bs4" else "lxml"
         return BeautifulSoup(html_content, parser)
     
     @staticmethod
@@ -51,7 +56,7 @@ class SoupHelper:
         ]
         
         for selector in content_selectors:
-            content_div = soup.find('div', selector)
+            content_div = soup.find('div', **selector)
             if content_div:
                 return SoupHelper.extract_text(content_div)
         
@@ -86,6 +91,63 @@ class SoupHelper:
         
         return '\n\n'.join(lines)
     
+    @staticmethod
+    def extract_page_text(html_content: str, parser: Optional[str] = None) -> str:
+        """
+        Main text of a page as a single whitespace-normalized line
+        <article> or <main> if present, otherwise all paragraphs
+        """
+        soup = SoupHelper.create_soup(html_content, parser)
+        
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+        
+        # Find main content (heuristic: look for article, main, or long paragraphs)
+        article = soup.find('article') or soup.find('main')
+        
+        if article:
+            text = article.get_text(separator=' ', strip=True)
+        else:
+            # Fallback: get all text from paragraphs
+            paragraphs = soup.find_all('p')
+            text = ' '.join([p.get_text(strip=True) for p in paragraphs])
+        
+        # Clean up text
+        return ' '.join(text.split())
+    
+    @staticmethod
+    def find_title(soup: BeautifulSoup) -> Optional[str]:
+        """Page title without the site name, falling back to the first <h1>"""
+        # Try <title> tag
+        title_tag = soup.find('title')
+        if title_tag:
+            title = title_tag.get_text(strip=True)
+            # Remove site name (usually after | or -)
+            return re.split(r'\s+[-|]\s+', title)[0]
+        
+        # Try h1
+        h1 = soup.find('h1')
+        if h1:
+            return h1.get_text(strip=True)
+        
+        return None
+    
+    @staticmethod
+    def find_author(soup: BeautifulSoup) -> Optional[str]:
+        """Author from meta tags or the first element with an 'author' class"""
+        # Try meta tag
+        author = SoupHelper.find_meta_content(soup, 'author')
+        if author:
+            return author
+        
+        # Try common author class
+        author_element = soup.find(class_=lambda x: x and 'author' in x.lower())
+        if author_element:
+            return author_element.get_text(strip=True)
+        
+        return None
+    
     @staticmethod
     def find_meta_content(soup: BeautifulSoup, meta_name: str) -> Optional[str]:
         """
@@ -119,7 +181,7 @@ class SoupHelper:
         ]
         
         for selector in unwanted_selectors:
-            for element in soup.find_all('div', selector):
+            for element in soup.find_all('div', **selector):
                 element.decompose()
         
         return soup
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+URL canonicalization for dedup and cache keys
+The same document is linked under many spellings: tracking parameters
+(?utm_source=rss), http vs https, a www. prefix, trailing slashes, arXiv
+version suffixes (v1, v2), Google Patents language paths (/en). Keys built
+from raw URLs treat each spelling as a separate document or cache entry.
+
+normalize_url() removes only the spellings that never change the response
+(fragment, default port, query order, tracking parameters) and is used for
+fetch-level keys (response cache, single-flight); scheme, host and path are
+kept as given, since http vs https or example.com vs www.example.com can be
+served differently. canonical_url() additionally folds those (https, no
+www., no duplicate or trailing slashes) and applies per-source rules that
+map every version / language of a document to one URL; it is used for
+document identity (seen-URL sets, the quality filter, the dedup index, S3 ids).
+
+Both are memoized: the same URLs are keyed many times per run.
+Neither changes the URLs that are fetched or forwarded.
+"""
+import re
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only identify the campaign / referrer
+TRACKING_PARAMS = frozenset({
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid', 'mkt_tok',
+    '_ga', '_gl', '_hsenc', '_hsmi', 'ref_src', 'ref_url', 'cmpid', 'spm', 'wt_mc', 'at_medium',
+    'at_campaign', 'oly_anon_id', 'oly_enc_id', 'vero_id',
+})
+TRACKING_PREFIXES = ('utm_', 'pk_', 'mtm_')
+
+_DEFAULT_PORTS = {'http': '80', 'https': '443'}
+_DUPLICATE_SLASHES = re.compile(r'/{2,}')
+
+# New-style (2401.01234) and old-style (cs/0112017, math.GT/0309136) arXiv IDs
+_ARXIV_PATH = re.compile(
+    r'^/(?:abs|pdf|html)/((?:\d{4}\.\d{4,5})|(?:[a-z\-]+(?:\.[A-Z]{2})?/\d{7}))(?:v\d+)?(?:\.pdf)?$'
+)
+_PATENT_PATH = re.compile(r'^/patent/([A-Za-z0-9]+)(?:/[a-z]{2}(?:-[A-Za-z]+)?)?$')
+
+
+def _split(url: str):
+    """urlsplit() result of an http(s) URL with a host, None otherwise"""
+    try:
+        parts = urlsplit(url)
+        parts.port  # Raises on an invalid port
+    except ValueError:
+        return None
+    if parts.scheme.lower() not in _DEFAULT_PORTS or not parts.hostname:
+        return None
+    return parts
+
+
+@lru_cache(maxsize=16384)
+def normalize_url(url: str) -> str:
+    """
+    URL with the variations that never change the response removed
+
+    Drops the fragment, the default port and tracking parameters, and sorts
+    the remaining query parameters. Scheme, host and path are kept as given.
+    Strings that are not http(s) URLs are returned stripped, otherwise unchanged.
+    """
+    url = (url or '').strip()
+    parts = _split(url)
+    if parts is None:
+        return url
+    netloc = parts.netloc
+    if parts.port is not None and str(parts.port) == _DEFAULT_PORTS[parts.scheme.lower()]:
+        netloc = netloc.rsplit(':', 1)[0]
+    params = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in TRACKING_PARAMS and not name.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((parts.scheme, netloc, parts.path or '/', urlencode(params), ''))
+
+
+@lru_cache(maxsize=16384)
+def canonical_url(url: str) -> str:
+    """
+    One URL per document: normalize_url, then https, a lowercase host
+    without www. or a trailing dot, no duplicate or trailing slashes, plus
+    per-source rules
+
+    - arXiv: abs / pdf / html links of any version -> https://arxiv.org/abs/<id>
+    - Google Patents: /patent/<ID>/<lang> -> https://patents.google.com/patent/<ID>
+    """
+    url = normalize_url(url)
+    parts = _split(url)
+    if parts is None:
+        return url
+
+    host = parts.hostname.rstrip('.')
+    if host.startswith('www.'):
+        host = host[4:]
+    elif ':' in host:
+        host = f"[{host}]"  # IPv6 literal
+    if parts.port is not None:
+        host = f"{host}:{parts.port}"  # normalize_url dropped the default port
+    path = _DUPLICATE_SLASHES.sub('/', parts.path).rstrip('/') or '/'
+    url = urlunsplit(('https', host, path, parts.query, ''))
+
+    if host in ('arxiv.org', 'export.arxiv.org'):
+        match = _ARXIV_PATH.match(path)
+        if match:
+            return f"https://arxiv.org/abs/{match.group(1)}"
+    elif host == 'patents.google.com':
+        match = _PATENT_PATH.match(path)
+        if match:
+            return f"https://patents.google.com/patent/{match.group(1).upper()}"
+    return url
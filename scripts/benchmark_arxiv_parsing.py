@@ -0,0 +1,105 @@
+"""
+Benchmark: BeautifulSoup 'xml' DOM vs streaming iterparse for arXiv responses
+
+Builds a synthetic arXiv Atom response (newest first), then compares time and
+peak Python heap (tracemalloc; lxml's C-level tree is not
+counted) of parsing it with the previous BeautifulSoup approach and
+with iter_atom_entries, with and without the days_back cutoff.
+
+Usage:
+    python scripts/benchmark_arxiv_parsing.py --entries 2000 --iterations 5
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from bs4 import BeautifulSoup
+from scrapers.utils.atom_parser import iter_atom_entries
+
+
+def build_feed(entries: int) -> bytes:
+    """One entry per hour going back in time"""
+    now = datetime.now(timezone.utc)
+    parts = []
+    for i in range(entries):
+        published = (now - timedelta(hours=i)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        authors = ''.join(f"<author><name>Author {j}</name></author>" for j in range(6))
+        parts.append(
+            f"<entry><id>http://arxiv.org/abs/2401.{i:05d}v1</id>"
+            f"<updated>{published}</updated><published>{published}</published>"
+            f"<title>Port automation study {i}</title>"
+            f"<summary>{'Digital twins for container terminals. ' * 30}</summary>"
+            f"{authors}<category term='cs.AI'/><category term='cs.LG'/></entry>"
+        )
+    return (
+        "<?xml version='1.0' encoding='UTF-8'?>"
+        "<feed xmlns='http://www.w3.org/2005/Atom'><title>ArXiv Query</title>"
+        + ''.join(parts) + "</feed>"
+    ).encode('utf-8')
+
+
+def parse_bs4(content: bytes, cutoff: datetime) -> int:
+    """The previous implementation: full DOM, then repeated find() per entry"""
+    soup = BeautifulSoup(content, 'xml')
+    kept = 0
+    for entry in soup.find_all('entry'):
+        entry.find('id').get_text(strip=True)
+        entry.find('title').get_text(strip=True)
+        entry.find('summary').get_text(strip=True)
+        [a.find('name').get_text(strip=True) for a in entry.find_all('author')]
+        [c.get('term') for c in entry.find_all('category')]
+        published = entry.find('published').get_text(strip=True)
+        if datetime.fromisoformat(published.replace('Z', '+00:00')) >= cutoff:
+            kept += 1
+    return kept
+
+
+def parse_iterparse(content: bytes, cutoff: datetime) -> int:
+    return sum(1 for _ in iter_atom_entries(content, cutoff=cutoff))
+
+
+def measure(fn, content: bytes, cutoff: datetime, iterations: int):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        kept = fn(content, cutoff)
+    elapsed = (time.perf_counter() - start) / iterations
+
+    tracemalloc.start()
+    fn(content, cutoff)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return kept, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare arXiv Atom parsers")
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--days-back", type=int, default=30)
+    args = parser.parse_args()
+
+    content = build_feed(args.entries)
+    no_cutoff = datetime.min.replace(tzinfo=timezone.utc)
+    cutoff = datetime.now(timezone.utc) - timedelta(days=args.days_back)
+    print(f"Feed: {args.entries} entries, {len(content) / 1024 / 1024:.1f} MB")
+
+    runs = [
+        ("bs4 (xml)", parse_bs4, no_cutoff),
+        ("iterparse", parse_iterparse, no_cutoff),
+        (f"bs4, {args.days_back}d cutoff", parse_bs4, cutoff),
+        (f"iterparse, {args.days_back}d cutoff", parse_iterparse, cutoff),
+    ]
+    for name, fn, run_cutoff in runs:
+        kept, elapsed, peak = measure(fn, content, run_cutoff, args.iterations)
+        print(f"  {name:<24} {kept:>6} entries  {elapsed * 1000:8.1f} ms  peak heap {peak / 1024:8.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
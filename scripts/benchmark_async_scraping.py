@@ -0,0 +1,116 @@
+"""
+Benchmark: sync vs async RSS scraping on the same fixture set
+
+Serves tests/fixtures/sample_rss_feed.xml from one local HTTP server per feed
+(each bound to its own 127.0.0.x address, so every feed is a distinct host)
+with artificial latency, then times RSSScraperTool.run() against arun().
+
+Usage:
+    python scripts/benchmark_async_scraping.py --feeds 8 --latency 0.2
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from config.settings import settings
+from scrapers.tools.rss_scraper import RSSScraperTool
+
+FIXTURE_FEED = os.path.join(project_root, "tests", "fixtures", "sample_rss_feed.xml")
+
+ARTICLE_HTML = (
+    "<html><body><article>"
+    + "<p>Port automation and smart terminal operations keep evolving.</p>" * 40
+    + "</article></body></html>"
+).encode("utf-8")
+
+
+def make_handler(feed_xml: bytes, latency: float):
+    """Build a request handler serving the fixture feed and article pages"""
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            if self.path.startswith("/feed"):
+                body, content_type = feed_xml, "application/rss+xml"
+            else:
+                body, content_type = ARTICLE_HTML, "text/html"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+def start_servers(feed_count: int, latency: float):
+    """Start one fixture server per feed, each on its own loopback address"""
+    with open(FIXTURE_FEED, "rb") as f:
+        template = f.read()
+
+    servers, feed_urls = [], []
+    for i in range(feed_count):
+        host = f"127.0.0.{i + 2}"
+        server = ThreadingHTTPServer((host, 0), None)
+        base_url = f"http://{host}:{server.server_port}"
+        # Point article links at the local server so full-text fetches stay offline
+        feed_xml = template.replace(b"https://www.porttechnology.org", base_url.encode("utf-8"))
+        server.RequestHandlerClass = make_handler(feed_xml, latency)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        feed_urls.append(f"{base_url}/feed/")
+    return servers, feed_urls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare sync vs async RSS scraping wall-clock time")
+    parser.add_argument("--feeds", type=int, default=8, help="Number of fixture feeds (distinct hosts)")
+    parser.add_argument("--latency", type=float, default=0.2, help="Server latency per request in seconds")
+    parser.add_argument("--rate-limit", type=float, default=1.0, help="Scraper rate_limit_delay in seconds")
+    args = parser.parse_args()
+
+    servers, feed_urls = start_servers(args.feeds, args.latency)
+    # Fixture entries are dated early 2026, keep them all inside the window
+    days_back = 3650
+    # Both runs read the same feeds; the second must not skip what the first saw
+    settings.INCREMENTAL_SCRAPING = False
+    settings.ADAPTIVE_POLLING = False
+
+    try:
+        sync_scraper = RSSScraperTool()
+        sync_scraper.rate_limit_delay = args.rate_limit
+        start = time.perf_counter()
+        sync_docs = sync_scraper.run(feed_urls=feed_urls, days_back=days_back)
+        sync_elapsed = time.perf_counter() - start
+
+        async_scraper = RSSScraperTool()
+        async_scraper.rate_limit_delay = args.rate_limit
+        start = time.perf_counter()
+        async_docs = asyncio.run(async_scraper.arun(feed_urls=feed_urls, days_back=days_back))
+        async_elapsed = time.perf_counter() - start
+    finally:
+        for server in servers:
+            server.shutdown()
+
+    print("=" * 60)
+    print(f"Feeds: {args.feeds}  Latency: {args.latency}s  Rate limit: {args.rate_limit}s")
+    print(f"Sync : {sync_elapsed:7.2f}s  ({len(sync_docs)} documents)")
+    print(f"Async: {async_elapsed:7.2f}s  ({len(async_docs)} documents)")
+    if async_elapsed > 0:
+        print(f"Speedup: {sync_elapsed / async_elapsed:.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark: feedparser vs the lazy lxml feed parser
+
+For every feed of the corpus, checks that parse_feed keeps the same entries
+(title, link, date, text) as the previous feedparser path - parse
+everything, take the first N entries, drop those past the cutoff - then
+times both.
+
+The cutoff is days_back before the newest entry of each feed so saved
+feeds keep behaving the same over time.
+
+Usage:
+    python scripts/benchmark_feed_parsing.py
+    python scripts/benchmark_feed_parsing.py --limit 20 --days-back 7 saved/*.xml
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import feedparser
+from bs4 import BeautifulSoup
+from scrapers.utils.feed_parser import parse_feed
+
+DEFAULT_CORPUS = os.path.join(project_root, "tests", "fixtures", "feeds", "*.xml")
+
+
+def feedparser_entries(content: bytes, limit: int, cutoff: datetime) -> list:
+    """The previous scraper path"""
+    feed = feedparser.parse(content)
+    kept = []
+    for entry in feed.entries[:limit]:
+        published = entry.get('published_parsed') or entry.get('updated_parsed')
+        pub_date = datetime(*published[:6]) if published else None
+        if pub_date and pub_date < cutoff:
+            continue
+        content_value = entry.content[0].get('value', '') if entry.get('content') else ''
+        kept.append({
+            'title': entry.get('title', '').strip(),
+            'link': entry.get('link', '').strip(),
+            'content': content_value,
+            'summary': entry.get('summary', ''),
+            'published': pub_date
+        })
+    return kept
+
+
+def comparable(entry: dict) -> tuple:
+    """Fields as the scrapers use them (HTML stripped)"""
+    html = entry['content'] or entry['summary']
+    text = BeautifulSoup(html, 'html.parser').get_text(separator=' ', strip=True) if html else ''
+    return entry['title'], entry['link'], entry['published'], text
+
+
+def newest_date(content: bytes) -> datetime:
+    dates = [entry['published'] for entry in parse_feed(content).entries if entry['published']]
+    return max(dates) if dates else datetime.now()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare feedparser with the lazy feed parser")
+    parser.add_argument("files", nargs="*", help=f"Feed files (default: {DEFAULT_CORPUS})")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--days-back", type=int, default=7)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    paths = args.files or sorted(glob.glob(DEFAULT_CORPUS))
+    mismatches = 0
+    total_old = total_new = 0.0
+
+    print(f"{'feed':<24} {'kept':>5} {'feedparser':>12} {'lazy':>10} {'speedup':>8}  check")
+    for path in paths:
+        with open(path, 'rb') as f:
+            content = f.read()
+        cutoff = newest_date(content) - timedelta(days=args.days_back)
+
+        old = [comparable(e) for e in feedparser_entries(content, args.limit, cutoff)]
+        parsed = parse_feed(content, limit=args.limit, cutoff=cutoff)
+        new = [comparable(e) for e in parsed.entries]
+        same = old == new
+        mismatches += not same
+
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            feedparser_entries(content, args.limit, cutoff)
+        old_time = (time.perf_counter() - start) / args.iterations
+
+        start = time.perf_counter()
+        for _ in range(args.iterations):
+            parse_feed(content, limit=args.limit, cutoff=cutoff)
+        new_time = (time.perf_counter() - start) / args.iterations
+
+        total_old += old_time
+        total_new += new_time
+        note = 'same' if same else 'DIFFERENT'
+        if parsed.fallback:
+            note += ' (feedparser fallback)'
+        print(f"{os.path.basename(path):<24} {len(new):>5} {old_time * 1000:>10.2f}ms "
+              f"{new_time * 1000:>8.2f}ms {old_time / new_time:>7.1f}x  {note}")
+
+    if paths:
+        print(f"\nTotal: feedparser {total_old * 1000:.1f}ms, lazy {total_new * 1000:.1f}ms "
+              f"({total_old / total_new:.1f}x)")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
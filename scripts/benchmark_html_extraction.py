@@ -0,0 +1,121 @@
+"""
+Benchmark: BeautifulSoup (html.parser) vs lxml extraction backends
+
+Checks that both backends produce the same text for the full-text
+(_fetch_full_text) and ContentExtractor paths, then times them.
+
+Pages are generated article layouts by default; pass saved HTML files to
+compare on real pages.
+
+Usage:
+    python scripts/benchmark_html_extraction.py --iterations 50
+    python scripts/benchmark_html_extraction.py page1.html page2.html
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scrapers.utils.soup_helper import SoupHelper
+from scrapers.utils.lxml_extractor import LxmlExtractor
+from scrapers.utils.content_extractor import ContentExtractor
+from config.settings import settings
+
+PARAGRAPH = (
+    "<p>Port authorities are rolling out <b>automated</b> cranes &amp; "
+    "<a href='/x'>digital twins</a> to cut berth time by 20%.</p>\n"
+)
+
+HEAD = (
+    "<head><meta charset='utf-8'><title>Smart ports - Maritime News</title>"
+    "<meta name='description' content='Automation in ports'>"
+    "<meta property='author' content='Jane Doe'>"
+    "<style>body { color: red }</style><script>var tracking = 1;</script></head>"
+)
+
+PAGES = {
+    "article": f"<html>{HEAD}<body><nav>Home | News</nav><article><h1>Smart ports</h1>"
+               + PARAGRAPH * 40 + "<!-- related --><script>ads()</script></article>"
+               "<footer>(c) 2024</footer></body></html>",
+    "main": f"<html>{HEAD}<body><header>Site</header><main>"
+            + PARAGRAPH * 40 + "<aside>Subscribe</aside></main></body></html>",
+    "content-div": f"<html>{HEAD}<body><div class='sidebar'>Latest</div>"
+                   "<div class='Entry-Content single'>" + PARAGRAPH * 40 + "</div></body></html>",
+    "paragraphs": f"<html>{HEAD}<body><div id='wrap'>" + PARAGRAPH * 40
+                  + "<div class='ad-slot'><p>Buy now</p></div></div></body></html>",
+    "unicode": f"<html>{HEAD}<body><article><p>Café – Rotterdam → Hamburg “quoted” 港口</p>"
+               + PARAGRAPH * 10 + "</article></body></html>",
+}
+
+
+def extract_all(backend, content: bytes, parser=None) -> dict:
+    """Outputs of every extraction path for one backend"""
+    if backend is SoupHelper:
+        page_text = SoupHelper.extract_page_text(content, parser)
+    else:
+        page_text = LxmlExtractor.extract_page_text(content)
+    settings.HTML_EXTRACTION_BACKEND = 'bs4' if backend is SoupHelper else 'lxml'
+    return {
+        'page_text': page_text,
+        'full_article': ContentExtractor.extract_full_article(content),
+        'metadata': ContentExtractor.extract_with_metadata(content),
+    }
+
+
+def time_backend(backend, pages: dict, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for content in pages.values():
+            if backend is SoupHelper:
+                SoupHelper.extract_page_text(content, 'html.parser')
+            else:
+                LxmlExtractor.extract_page_text(content)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare HTML extraction backends")
+    parser.add_argument("files", nargs="*", help="HTML files to compare (default: generated pages)")
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.files:
+        pages = {}
+        for path in args.files:
+            with open(path, 'rb') as f:
+                pages[os.path.basename(path)] = f.read()
+    else:
+        pages = {name: html.encode('utf-8') for name, html in PAGES.items()}
+
+    original_backend = settings.HTML_EXTRACTION_BACKEND
+    mismatches = 0
+    print("Equality check (bs4/html.parser vs lxml):")
+    for name, content in pages.items():
+        bs4_out = extract_all(SoupHelper, content, 'html.parser')
+        lxml_out = extract_all(LxmlExtractor, content)
+        for key in bs4_out:
+            same = bs4_out[key] == lxml_out[key]
+            mismatches += not same
+            print(f"  {name:<14} {key:<13} {'same' if same else 'DIFFERENT'}")
+            if not same:
+                print(f"    bs4:  {str(bs4_out[key])[:200]!r}")
+                print(f"    lxml: {str(lxml_out[key])[:200]!r}")
+    settings.HTML_EXTRACTION_BACKEND = original_backend
+
+    bs4_time = time_backend(SoupHelper, pages, args.iterations)
+    lxml_time = time_backend(LxmlExtractor, pages, args.iterations)
+    total = args.iterations * len(pages)
+    print(f"\nPage text extraction, {total} pages:")
+    print(f"  bs4 (html.parser): {bs4_time:.2f}s ({bs4_time / total * 1000:.2f} ms/page)")
+    print(f"  lxml:              {lxml_time:.2f}s ({lxml_time / total * 1000:.2f} ms/page)")
+    print(f"  Speedup:           {bs4_time / lxml_time:.1f}x")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
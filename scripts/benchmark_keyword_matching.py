@@ -0,0 +1,84 @@
+"""
+Benchmark: per-keyword substring search vs the Aho-Corasick keyword matcher
+
+TechNewsScraperTool used to check every entry with
+any(topic.lower() in title_lower or topic.lower() in content_lower ...),
+one scan per keyword that re-lowercases the keywords each time. The
+KeywordMatcher scans each title / summary once for all keywords.
+
+Entries are generated from the configured keywords and filler words; both
+methods score every keyword (keywords.yaml + tech news search_topics), the
+way relevance scoring needs to.
+
+Substring search slows down linearly with the keyword count, the
+automaton does not; --extra-keywords adds synthetic keywords to show it.
+
+Usage:
+    python scripts/benchmark_keyword_matching.py --entries 5000
+    python scripts/benchmark_keyword_matching.py --extra-keywords 1000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from config.loader import get_relevance_keywords
+from scrapers.utils.keyword_matcher import KeywordMatcher
+
+
+def generate(keywords, count: int, seed: int = 42):
+    rng = random.Random(seed)
+    filler = "the port said on monday that its new system will reduce costs for shipping lines and operators".split()
+    entries = []
+    for _ in range(count):
+        words = [rng.choice(filler) for _ in range(60)]
+        for _ in range(rng.randint(0, 3)):
+            words.insert(rng.randrange(len(words)), rng.choice(keywords))
+        entries.append((' '.join(words[:10]).title(), ' '.join(words)))
+    return entries
+
+
+def substring_search(keywords, title: str, summary: str):
+    title_lower, summary_lower = title.lower(), summary.lower()
+    return [keyword for keyword in keywords
+            if keyword.lower() in title_lower or keyword.lower() in summary_lower]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entries', type=int, default=5000)
+    parser.add_argument('--extra-keywords', type=int, default=0)
+    args = parser.parse_args()
+
+    keywords = get_relevance_keywords()
+    rng = random.Random(7)
+    keywords += [f"{rng.choice(keywords)} variant{i}" for i in range(args.extra_keywords)]
+    entries = generate(keywords, args.entries)
+
+    start = time.perf_counter()
+    matcher = KeywordMatcher(keywords)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for title, summary in entries:
+        substring_search(keywords, title, summary)
+    substring_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matched = sum(bool(matcher.score(title, summary)[1]) for title, summary in entries)
+    automaton_seconds = time.perf_counter() - start
+
+    print(f"{len(keywords)} keywords ({len(matcher)} distinct), {len(entries)} entries, "
+          f"automaton built in {build_seconds * 1000:.1f}ms")
+    print(f"  substring search: {substring_seconds / len(entries) * 1e6:.0f} us/entry")
+    print(f"  automaton:        {automaton_seconds / len(entries) * 1e6:.0f} us/entry "
+          f"({substring_seconds / automaton_seconds:.1f}x), {matched} entries with a match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark: per-field tree searches vs the single-pass page scanner
+
+The previous ContentExtractor.extract_with_metadata / extract_full_article
+ran one whole-tree search per field (title, two meta lookups, article
+heuristics, author, five ad/widget scans). scan_page collects all of it in
+one walk (lxml: one combined XPath). For each backend this counts
+whole-tree passes, compares the outputs and times both.
+
+Pages are generated article layouts by default; pass saved HTML files to
+measure real pages.
+
+Usage:
+    python scripts/benchmark_metadata_extraction.py --iterations 50
+    python scripts/benchmark_metadata_extraction.py saved/*.html
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from bs4 import BeautifulSoup, Tag
+from scrapers.utils import lxml_extractor, page_scanner
+from scrapers.utils.lxml_extractor import LxmlExtractor
+from scrapers.utils.soup_helper import SoupHelper
+from scrapers.utils.page_scanner import scan_page
+from benchmark_html_extraction import PAGES
+
+
+def multi_pass(helper, html: bytes) -> dict:
+    """The previous extract_with_metadata plus extract_full_article's ad removal"""
+    soup = helper.create_soup(html)
+    metadata = {
+        'title': helper.find_title(soup),
+        'description': helper.find_meta_content(soup, 'description'),
+        'author': helper.find_author(soup),
+    }
+    metadata['content'] = helper.find_article_content(helper.remove_ads_and_widgets(soup))
+    return metadata
+
+
+def single_pass(helper, html: bytes) -> dict:
+    return scan_page(helper.create_soup(html))
+
+
+class PassCounter:
+    """Counts searches and walks that start from the document root"""
+
+    def __init__(self):
+        self.passes = 0
+        self._restore = []
+
+    def __enter__(self):
+        counter = self
+        # find() and find_all() both search through Tag._find_all
+        find_all = Tag._find_all
+
+        def counting_find_all(tag, *args, **kwargs):
+            if isinstance(tag, BeautifulSoup):
+                counter.passes += 1
+            return find_all(tag, *args, **kwargs)
+
+        Tag._find_all = counting_find_all
+        self._restore.append(lambda: setattr(Tag, '_find_all', find_all))
+
+        def counting(xpath):
+            def call(tree, **variables):
+                if isinstance(tree, BeautifulSoup) or tree.getparent() is None:
+                    counter.passes += 1
+                return xpath(tree, **variables)
+            return call
+
+        for module, name in ((lxml_extractor, '_ARTICLE'), (lxml_extractor, '_MAIN'),
+                             (lxml_extractor, 'PARAGRAPHS'), (lxml_extractor, '_TITLE'),
+                             (lxml_extractor, '_H1'), (lxml_extractor, '_META_BY_NAME'),
+                             (lxml_extractor, '_META_BY_PROPERTY'), (lxml_extractor, '_AUTHOR_ELEMENT'),
+                             (lxml_extractor, '_ADS_AND_WIDGETS'), (page_scanner, '_LXML_SCAN'),
+                             (page_scanner, 'PARAGRAPHS'), (page_scanner, '_walk_soup')):
+            original = getattr(module, name)
+            setattr(module, name, counting(original))
+            self._restore.append(lambda module=module, name=name, original=original:
+                                 setattr(module, name, original))
+        original_divs = lxml_extractor._CONTENT_DIVS
+        lxml_extractor._CONTENT_DIVS = [counting(xpath) for xpath in original_divs]
+        self._restore.append(lambda: setattr(lxml_extractor, '_CONTENT_DIVS', original_divs))
+        return self
+
+    def __exit__(self, *exc):
+        for restore in reversed(self._restore):
+            restore()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare multi-pass and single-pass metadata extraction")
+    parser.add_argument("files", nargs="*", help="HTML files (default: generated pages)")
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.files:
+        pages = {}
+        for path in args.files:
+            with open(path, 'rb') as f:
+                pages[os.path.basename(path)] = f.read()
+    else:
+        pages = {name: html.encode('utf-8') for name, html in PAGES.items()}
+
+    for backend_name, helper in (("bs4 (html.parser)", SoupHelper), ("lxml", LxmlExtractor)):
+        print(f"\n{backend_name}:")
+        total_old = total_new = 0.0
+        for name, html in pages.items():
+            with PassCounter() as old_passes:
+                old = multi_pass(helper, html)
+            with PassCounter() as new_passes:
+                new = single_pass(helper, html)
+            differing = [key for key in old if old[key] != new[key]]
+
+            start = time.perf_counter()
+            for _ in range(args.iterations):
+                multi_pass(helper, html)
+            old_time = (time.perf_counter() - start) / args.iterations
+            start = time.perf_counter()
+            for _ in range(args.iterations):
+                single_pass(helper, html)
+            new_time = (time.perf_counter() - start) / args.iterations
+            total_old += old_time
+            total_new += new_time
+
+            note = "same" if not differing else f"differs: {', '.join(differing)}"
+            print(f"  {name:<14} passes {old_passes.passes:>2} -> {new_passes.passes}   "
+                  f"{old_time * 1000:7.2f}ms -> {new_time * 1000:6.2f}ms   {note}")
+        print(f"  Total: {total_old * 1000:.1f}ms -> {total_new * 1000:.1f}ms "
+              f"({(1 - total_new / total_old) * 100:.0f}% saved)")
+
+
+if __name__ == "__main__":
+    main()
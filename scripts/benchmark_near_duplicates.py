@@ -0,0 +1,117 @@
+"""
+Benchmark: near-duplicate collapse with MinHash LSH vs pairwise comparison
+
+Generates a batch of synthetic articles (random words from a Zipf-like
+vocabulary) in which a share are republished copies of an earlier article
+(a few words changed, a different intro or outro). Times:
+
+- NearDuplicateIndex.collapse over the whole batch (signatures + LSH)
+- Lookups against an index of previously published signatures, the
+  cross-run case, and that index's memory footprint
+- All-pairs signature comparison on a sample, extrapolated to the batch
+
+and reports how many injected copies were caught and how many distinct
+articles were wrongly merged. Redis is not used.
+
+Usage:
+    python scripts/benchmark_near_duplicates.py
+    python scripts/benchmark_near_duplicates.py --docs 20000 --copy-rate 0.2
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scrapers.utils import near_duplicates
+from scrapers.utils.near_duplicates import MinHashLSH, NearDuplicateIndex, minhash, similarity
+
+
+def generate(count: int, copy_rate: float, words: int, seed: int = 42):
+    """Articles as (doc, origin): copies share their original's origin"""
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(20000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    documents = []
+    for i in range(count):
+        if documents and rng.random() < copy_rate:
+            original, origin = rng.choice(documents)
+            text = original['text'].split()
+            for position in rng.sample(range(len(text)), 3):
+                text[position] = rng.choice(vocabulary)
+            if rng.random() < 0.5:
+                # Outlet-specific intro or outro
+                extra = rng.choices(vocabulary, weights, k=words // 10)
+                text = extra + text if rng.random() < 0.5 else text + extra
+        else:
+            text, origin = rng.choices(vocabulary, weights, k=words), i
+        documents.append(({'url': f"https://outlet{i % 7}.example/{i}", 'source': f"Outlet {i % 7}",
+                           'text': ' '.join(text)}, origin))
+    return documents
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--docs', type=int, default=100000)
+    parser.add_argument('--copy-rate', type=float, default=0.1)
+    parser.add_argument('--words', type=int, default=250, help="Words per article")
+    parser.add_argument('--pairwise-sample', type=int, default=1000)
+    args = parser.parse_args()
+
+    # Batch-only collapse: no published index
+    near_duplicates.get_shared_redis_client = lambda: None
+    near_duplicates.record_near_duplicates = lambda *args, **kwargs: None
+
+    print(f"Generating {args.docs} articles ({args.copy_rate:.0%} copies, {args.words} words)...")
+    generated = generate(args.docs, args.copy_rate, args.words)
+    documents = [doc for doc, _ in generated]
+    origin = {doc['url']: source for doc, source in generated}
+
+    index = NearDuplicateIndex(config={})
+    start = time.perf_counter()
+    kept = index.collapse(documents)
+    collapse_seconds = time.perf_counter() - start
+
+    copies = len(documents) - len(set(origin.values()))
+    caught = len(documents) - len(kept)
+    false_merges = sum(
+        1 for doc in kept for url in doc.get('alternate_urls', []) if origin[url] != origin[doc['url']]
+    )
+    print(f"\ncollapse: {collapse_seconds:.1f}s ({collapse_seconds / len(documents) * 1e6:.0f} us/doc)")
+    print(f"  copies caught: {caught}/{copies} ({caught / max(copies, 1):.1%}), false merges: {false_merges}")
+
+    # Cross-run: the first half was published, the second half is looked up
+    half = len(documents) // 2
+    signatures = [minhash(doc['text']) for doc in documents]
+    tracemalloc.start()
+    published = MinHashLSH()
+    for i in range(half):
+        published.add(signatures[i], i)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    hits = sum(1 for signature in signatures[half:] if published.query(signature))
+    lookup_seconds = time.perf_counter() - start
+    print(f"\npublished index: {half} signatures, {memory / 1e6:.0f} MB")
+    print(f"  lookups: {lookup_seconds / (len(documents) - half) * 1e6:.0f} us/doc, {hits} matches")
+
+    sample = signatures[:args.pairwise_sample]
+    start = time.perf_counter()
+    for i in range(len(sample)):
+        for j in range(i):
+            similarity(sample[i], sample[j])
+    sample_seconds = time.perf_counter() - start
+    pairs = len(sample) * (len(sample) - 1) / 2
+    projected = sample_seconds / pairs * len(documents) * (len(documents) - 1) / 2
+    print(f"\npairwise: {sample_seconds:.1f}s for {len(sample)} docs, "
+          f"projected {projected / 3600:.1f}h for {len(documents)} "
+          f"({projected / collapse_seconds:.0f}x the LSH collapse)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: parse throughput of scraper threads vs the parse pool
+
+Parses the same batch of pages (full-text extraction with BeautifulSoup,
+the CPU-heavy path) from 4 threads, like the scraping node does, first
+in-thread and then through ParsePool with increasing worker counts.
+Throughput should scale with workers up to the number of cores.
+
+Usage:
+    python scripts/benchmark_parse_pool.py --pages 200 --workers 1 2 4
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from scrapers.utils.parse_pool import ParsePool
+from scrapers.utils.soup_helper import SoupHelper
+
+PARAGRAPH = (
+    "<p>Port authorities are rolling out <b>automated</b> cranes &amp; "
+    "<a href='/x'>digital twins</a> to cut berth time by 20%.</p>\n"
+)
+PAGE = (
+    "<html><head><title>Smart ports</title><script>var t = 1;</script></head><body>"
+    "<nav>Home | News</nav><article><h1>Smart ports</h1>" + PARAGRAPH * 150
+    + "</article><footer>(c) 2024</footer></body></html>"
+).encode('utf-8')
+
+
+def parse_batch(pool: ParsePool, pages: int, threads: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(
+            lambda _: pool.run(SoupHelper.extract_page_text, PAGE, 'html.parser'),
+            range(pages)
+        ))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure parse pool scaling")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=4, help="Scraper threads submitting work")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    print(f"CPUs: {os.cpu_count()}, pages: {args.pages}, scraper threads: {args.threads}")
+
+    baseline = parse_batch(ParsePool(workers=0), args.pages, args.threads)
+    print(f"  in-thread (GIL):  {args.pages / baseline:7.1f} pages/s")
+
+    for workers in args.workers:
+        pool = ParsePool(workers=workers)
+        try:
+            pool.run(os.getpid)  # Start the processes outside the timing
+            elapsed = parse_batch(pool, args.pages, args.threads)
+        finally:
+            pool.shutdown()
+        print(f"  {workers} process(es):   {args.pages / elapsed:7.1f} pages/s "
+              f"({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Keyword coverage report
+Lists, for a searching source, when each keyword of config/keywords.yaml was
+last searched by the keyword rotation, least recently searched first, and
+flags the keywords not searched within the rotation cycle.
+
+Usage:
+    python scripts/keyword_coverage_report.py
+    python scripts/keyword_coverage_report.py --source tech_news --overdue
+"""
+import argparse
+import os
+import sys
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from config.loader import get_all_keywords
+from scrapers.utils.keyword_rotation import keyword_rotation
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--source', default='patents', help="Searching source (patents, tech_news)")
+    parser.add_argument('--overdue', action='store_true', help="Only keywords not searched within the cycle")
+    args = parser.parse_args()
+
+    rows = keyword_rotation.report(args.source, get_all_keywords())
+    overdue = sum(row['overdue'] for row in rows)
+    if args.overdue:
+        rows = [row for row in rows if row['overdue']]
+
+    print(f"{args.source}: {len(rows)} keywords, {overdue} not searched within "
+          f"{keyword_rotation.cycle_seconds / 3600:.0f}h")
+    for row in rows:
+        print(f"  {'!' if row['overdue'] else ' '} {row['last_searched'] or 'never':<32} "
+              f"{row['category']:<16} x{row['weight']:<4g} {row['keyword']}")
+
+
+if __name__ == "__main__":
+    main()
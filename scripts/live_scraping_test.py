@@ -134,6 +134,12 @@ def run_live_scraping():
     print(f"  Output: {len(valid_docs)} valid documents")
     print(f"  Filtered: {len(all_documents) - len(valid_docs)}")
     
+    from graph.nodes.near_duplicate_node import near_duplicate_node
+    
+    unique_docs = near_duplicate_node({"valid_documents": valid_docs})["valid_documents"]
+    print(f"  Near-duplicates collapsed: {len(valid_docs) - len(unique_docs)}")
+    valid_docs = unique_docs
+    
     # ===== STEP 6: Formatter =====
     print_step(6, "FORMATTER - Converting to Signal format")
     
@@ -45,7 +45,8 @@ def test_live_workflow():
     print("Executing Graph (with Orchestrator skip bypass)...")
     # Bypass orchestrator skip by mocking the last scrape time check
     from unittest.mock import patch
-    with patch('graph.nodes.orchestrator_node.get_last_scrape_time') as mock_scrape_time:
+    with patch('graph.nodes.orchestrator_node.get_last_scrape_time') as mock_scrape_time, \
+            patch('graph.nodes.orchestrator_node.get_source_last_run_times', return_value={}):
         mock_scrape_time.return_value = None
         final_state = app.invoke(initial_state)
     
@@ -2,9 +2,13 @@
 Redis client for storing scraping state
 """
 import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterable, Optional
 import json
+import threading
+import time
 
 from config.settings import settings
 from utils.logger import setup_logger
@@ -13,6 +17,14 @@ logger = setup_logger(__name__)
 
 # Redis key constants
 LAST_SCRAPE_KEY = "scraper:last_scrape_time"
+SOURCE_LAST_RUN_KEY = "scraper:source_last_run"    # Hash: source -> ISO timestamp
+
+# Hot-path callers skip Redis for this long after a connection failure
+REDIS_FAILURE_BACKOFF_SECONDS = 30
+
+_shared_client: Optional[redis.Redis] = None
+_shared_client_lock = threading.Lock()
+_redis_unavailable_until = 0.0
 
 
 def get_redis_client() -> redis.Redis:
@@ -28,6 +40,44 @@ def get_redis_client() -> redis.Redis:
     )
 
 
+def get_shared_redis_client() -> Optional[redis.Redis]:
+    """
+    Process-wide Redis client for hot paths (rate limiting, caches)
+    
+    Fails fast (short timeouts, no retries) and returns None during the
+    back-off window after a failure, so callers go straight to their local
+    fallback instead of paying a connection timeout per request.
+    """
+    global _shared_client
+    
+    if time.monotonic() < _redis_unavailable_until:
+        return None
+    
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = redis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                password=settings.REDIS_PASSWORD,
+                decode_responses=True,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+                retry=Retry(NoBackoff(), 0)
+            )
+        return _shared_client
+
+
+def report_redis_failure(error: Exception):
+    """
+    Start the back-off window after a hot-path Redis failure
+    """
+    global _redis_unavailable_until
+    
+    _redis_unavailable_until = time.monotonic() + REDIS_FAILURE_BACKOFF_SECONDS
+    logger.warning(f"Redis unavailable: {error}. Using local fallbacks for {REDIS_FAILURE_BACKOFF_SECONDS}s.")
+
+
 def get_last_scrape_time() -> Optional[datetime]:
     """
     Get the timestamp of the last scrape
@@ -75,6 +125,54 @@ def save_last_scrape_time(timestamp: datetime) -> bool:
         return False
 
 
+def get_source_last_run_times() -> Dict[str, datetime]:
+    """
+    Get the timestamp of the last run of each source (patents, rss, ...)
+    
+    Returns:
+        source -> datetime of its last run (sources never run are absent)
+    """
+    try:
+        client = get_redis_client()
+        values = client.hgetall(SOURCE_LAST_RUN_KEY)
+        return {source: datetime.fromisoformat(value) for source, value in values.items()}
+        
+    except redis.ConnectionError as e:
+        logger.warning(f"Redis connection failed: {e}. Returning no source run times.")
+        return {}
+    except Exception as e:
+        logger.error(f"Error getting source run times: {e}")
+        return {}
+
+
+def save_source_last_run_times(sources: Iterable[str], timestamp: datetime) -> bool:
+    """
+    Save the timestamp of the current run for the sources it scraped
+    
+    Args:
+        sources: Sources that ran
+        timestamp: datetime to save
+    
+    Returns:
+        True if saved successfully
+    """
+    mapping = {source: timestamp.isoformat() for source in sources}
+    if not mapping:
+        return False
+    try:
+        client = get_redis_client()
+        client.hset(SOURCE_LAST_RUN_KEY, mapping=mapping)
+        logger.info(f"Saved last run time of {', '.join(mapping)}: {timestamp.isoformat()}")
+        return True
+        
+    except redis.ConnectionError as e:
+        logger.warning(f"Redis connection failed: {e}. Source run times not saved.")
+        return False
+    except Exception as e:
+        logger.error(f"Error saving source run times: {e}")
+        return False
+
+
 def store_batch_metadata(batch_id: str, metadata: dict) -> bool:
     """
     Store batch metadata in Redis
@@ -16,14 +16,14 @@ from graph.state import GraphState
 class TestFullWorkflow:
     """Integration tests for the complete workflow"""
     
+    @patch('graph.nodes.orchestrator_node.get_source_last_run_times', MagicMock(return_value={}))
     @patch('graph.nodes.orchestrator_node.get_last_scrape_time')
-    @patch('graph.nodes.handoff_node.save_last_scrape_time')
+    @patch('graph.nodes.handoff_node.save_source_last_run_times', MagicMock(return_value=True))
     @patch('graph.nodes.handoff_node.publish_batch')
-    def test_full_workflow_with_mock_data(self, mock_publish, mock_save_time, mock_get_time):
+    def test_full_workflow_with_mock_data(self, mock_publish, mock_get_time):
         """Test complete workflow with mocked external dependencies"""
         # Setup mocks
         mock_get_time.return_value = None  # Never scraped before
-        mock_save_time.return_value = True
         mock_publish.return_value = True
         
         # Build the graph
@@ -46,13 +46,14 @@ class TestFullWorkflow:
             # Expected to fail on actual HTTP calls, that's OK for structure test
             print(f"Workflow execution error (expected for mock test): {e}")
     
+    @patch('graph.nodes.orchestrator_node.get_source_last_run_times', MagicMock(return_value={}))
     @patch('graph.nodes.orchestrator_node.get_last_scrape_time')
     def test_workflow_skips_when_recently_scraped(self, mock_get_time):
         """Test that workflow skips when recently scraped"""
         from datetime import datetime, timedelta
         
-        # Setup: last scrape was 1 hour ago
-        mock_get_time.return_value = datetime.utcnow() - timedelta(hours=1)
+        # Setup: last scrape was 30 minutes ago (shortest source interval is 1 hour)
+        mock_get_time.return_value = datetime.utcnow() - timedelta(minutes=30)
         
         # Build the graph
         app = build_scraping_graph()
@@ -77,6 +78,7 @@ class TestFullWorkflow:
         assert "orchestrator" in node_names
         assert "scraping" in node_names
         assert "quality_filter" in node_names
+        assert "near_duplicate" in node_names
         assert "formatter" in node_names
         assert "handoff" in node_names
         
@@ -0,0 +1,178 @@
+"""
+Tests for scrapers/tools/academic_scraper.py and scrapers/utils/atom_parser.py
+"""
+import pytest
+from unittest.mock import MagicMock
+from datetime import datetime, timedelta, timezone
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.tools.academic_scraper import AcademicScraperTool, plan_arxiv_queries
+from scrapers.utils.atom_parser import iter_atom_entries
+from scrapers.utils.high_water_mark import HighWaterMark
+
+
+def atom_entry(arxiv_id: str, days_ago: int, authors: int = 2, title: str = "Smart   port\n  automation") -> str:
+    published = (datetime.now(timezone.utc) - timedelta(days=days_ago)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    names = ''.join(f"<author><name>Author {i}</name></author>" for i in range(authors))
+    return (
+        f"<entry><id>http://arxiv.org/abs/{arxiv_id}</id>"
+        f"<published>{published}</published>"
+        f"<title>{title} {arxiv_id}</title>"
+        f"<summary>\n  Digital twins for\n  container terminals.\n</summary>"
+        f"{names}"
+        f"<category term='cs.AI' scheme='http://arxiv.org/schemas/atom'/>"
+        f"<category term='cs.LG' scheme='http://arxiv.org/schemas/atom'/>"
+        f"</entry>"
+    )
+
+
+def atom_feed(*entries: str) -> bytes:
+    return (
+        "<?xml version='1.0' encoding='UTF-8'?>"
+        "<feed xmlns='http://www.w3.org/2005/Atom' "
+        "xmlns:opensearch='http://a9.com/-/spec/opensearch/1.1/'>"
+        "<title>ArXiv Query</title><opensearch:totalResults>3</opensearch:totalResults>"
+        + ''.join(entries) + "</feed>"
+    ).encode('utf-8')
+
+
+def make_scraper() -> AcademicScraperTool:
+    scraper = AcademicScraperTool()
+    scraper.rate_limit_delay = 0
+    scraper.http_client = MagicMock()
+    scraper.high_water_marks = MagicMock()
+    scraper.high_water_marks.load.return_value = HighWaterMark()
+    return scraper
+
+
+class TestAtomParser:
+    """Tests for iter_atom_entries"""
+
+    def test_yields_normalized_entries(self):
+        entries = list(iter_atom_entries(atom_feed(atom_entry('2401.00001', 1, authors=3))))
+
+        assert entries == [{
+            'id': 'http://arxiv.org/abs/2401.00001',
+            'title': 'Smart port automation 2401.00001',
+            'summary': 'Digital twins for container terminals.',
+            'published': entries[0]['published'],
+            'authors': ['Author 0', 'Author 1', 'Author 2'],
+            'categories': ['cs.AI', 'cs.LG']
+        }]
+
+    def test_stops_at_cutoff(self):
+        """Parsing ends at the first old entry; later entries are never read"""
+        feed = atom_feed(atom_entry('new', 1), atom_entry('old', 40), atom_entry('misplaced', 2))
+        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+
+        ids = [entry['id'] for entry in iter_atom_entries(feed, cutoff=cutoff)]
+
+        assert ids == ['http://arxiv.org/abs/new']
+
+    def test_malformed_feed_keeps_parsed_entries(self):
+        feed = atom_feed(atom_entry('good', 1))[:-len(b"</feed>")] + b"<entry><id>broken"
+
+        ids = [entry['id'] for entry in iter_atom_entries(feed)]
+
+        assert ids == ['http://arxiv.org/abs/good']
+
+    def test_empty_content(self):
+        assert list(iter_atom_entries(b"")) == []
+
+
+class TestPlanArxivQueries:
+    """Tests for plan_arxiv_queries"""
+
+    def test_packs_keywords_into_or_query(self):
+        queries = plan_arxiv_queries(["IoT", "digital twin"], ["cs.AI", "cs.LG"])
+
+        assert len(queries) == 1
+        assert queries[0].keywords == ["IoT", "digital twin"]
+        assert queries[0].search_query == '(all:"IoT" OR all:"digital twin") AND (cat:cs.AI OR cat:cs.LG)'
+
+    def test_splits_at_max_length_and_drops_duplicates(self):
+        keywords = [f"keyword {i}" for i in range(30)] + ["Keyword 3", 'quoted "term"']
+
+        queries = plan_arxiv_queries(keywords, ["cs.AI"], max_query_length=200)
+
+        assert all(len(query.search_query) <= 200 for query in queries)
+        planned = [kw for query in queries for kw in query.keywords]
+        assert planned == [f"keyword {i}" for i in range(30)] + ["quoted term"]
+        assert len(queries) < len(planned)
+
+    def test_oversized_keyword_gets_own_query(self):
+        queries = plan_arxiv_queries(["short", "x" * 300], max_query_length=100)
+
+        assert [query.keywords for query in queries] == [["short"], ["x" * 300]]
+
+
+class TestAcademicScraperTool:
+    """Tests for AcademicScraperTool"""
+
+    def test_pages_until_short_page(self):
+        """A full page triggers the next one; a short page ends the query"""
+        scraper = make_scraper()
+        scraper.http_client.get.side_effect = [
+            MagicMock(content=atom_feed(atom_entry('a', 1), atom_entry('b', 1))),
+            MagicMock(content=atom_feed(atom_entry('c', 2))),
+        ]
+
+        docs = scraper.scrape(keywords=["smart port"], days_back=30, max_results=2, max_pages=5)
+
+        assert len(docs) == 3
+        starts = [call.kwargs['params']['start'] for call in scraper.http_client.get.call_args_list]
+        assert starts == [0, 2]
+
+    def test_skips_seen_papers_but_keeps_paging(self):
+        """Seen papers are dropped; a full page still triggers the next one"""
+        scraper = make_scraper()
+        scraper.high_water_marks.load.return_value = HighWaterMark(
+            seen=frozenset({'http://arxiv.org/abs/a', 'http://arxiv.org/abs/b'})
+        )
+        scraper.http_client.get.side_effect = [
+            MagicMock(content=atom_feed(atom_entry('a', 1), atom_entry('b', 1))),
+            MagicMock(content=atom_feed(atom_entry('c', 2))),
+        ]
+
+        docs = scraper.scrape(keywords=["smart port"], days_back=30, max_results=2, max_pages=5)
+
+        assert [doc['url'] for doc in docs] == ['http://arxiv.org/abs/c']
+        [mark] = scraper.pending_marks
+        assert mark['source'].startswith("arxiv:") and mark['entry_ids'] == ['http://arxiv.org/abs/c']
+        assert mark['newest'] is not None
+
+    def test_maps_papers_to_matched_keywords(self):
+        scraper = make_scraper()
+        scraper.http_client.get.return_value = MagicMock(content=atom_feed(
+            atom_entry('a', 1, title="Digital twin of a container terminal"),
+            atom_entry('b', 1, title="Unrelated wording only")
+        ))
+
+        docs = scraper.scrape(keywords=["digital twin", "blockchain"], days_back=30)
+
+        assert scraper.http_client.get.call_count == 1
+        assert docs[0]['matched_keywords'] == ["digital twin"]
+        # No keyword in title/abstract: credited to the whole query
+        assert docs[1]['matched_keywords'] == ["digital twin", "blockchain"]
+
+    def test_scrape_builds_documents(self):
+        scraper = make_scraper()
+        scraper.http_client.get.return_value = MagicMock(
+            status_code=200,
+            content=atom_feed(atom_entry('2401.00001', 1, authors=7), atom_entry('2301.00002', 400))
+        )
+
+        docs = scraper.scrape(keywords=["smart port"], days_back=30)
+
+        assert [doc['url'] for doc in docs] == ['http://arxiv.org/abs/2401.00001']
+        assert docs[0]['source'] == 'arXiv'
+        assert "AUTHORS: Author 0, Author 1, Author 2, Author 3, Author 4 et al. (7 authors)" in docs[0]['text']
+        assert "CATEGORIES: cs.AI, cs.LG" in docs[0]['text']
+        assert docs[0]['text'].endswith("ABSTRACT:\nDigital twins for container terminals.")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
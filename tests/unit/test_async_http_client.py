@@ -0,0 +1,140 @@
+"""
+Tests for scrapers/utils/async_http_client.py
+"""
+import pytest
+import asyncio
+import httpx
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.async_http_client import AsyncHTTPClient
+from scrapers.utils.host_controller import HostConcurrencyController
+
+
+class TestAsyncHTTPClient:
+    """Tests for AsyncHTTPClient"""
+
+    @pytest.mark.asyncio
+    async def test_respects_per_host_limit(self):
+        """Should never exceed max_per_host in-flight requests to one host"""
+        in_flight = {"current": 0, "peak": 0}
+
+        async def handler(request):
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            await asyncio.sleep(0.01)
+            in_flight["current"] -= 1
+            return httpx.Response(200, text="ok")
+
+        async with AsyncHTTPClient(max_per_host=2, transport=httpx.MockTransport(handler)) as client:
+            await asyncio.gather(*(client.get(f"https://example.com/{i}") for i in range(8)))
+
+        assert in_flight["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_hosts_are_limited_independently(self):
+        """Requests to different hosts should not share a cap"""
+        in_flight = {"current": 0, "peak": 0}
+
+        async def handler(request):
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            await asyncio.sleep(0.01)
+            in_flight["current"] -= 1
+            return httpx.Response(200, text="ok")
+
+        urls = [f"https://host{i}.example.com/feed" for i in range(4)]
+        async with AsyncHTTPClient(max_per_host=1, transport=httpx.MockTransport(handler)) as client:
+            await asyncio.gather(*(client.get(url) for url in urls))
+
+        assert in_flight["peak"] == 4
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_status(self, monkeypatch):
+        """Should retry 503 responses and return the eventual success"""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url)
+            if len(calls) < 3:
+                return httpx.Response(503)
+            return httpx.Response(200, text="ok")
+
+        async def no_sleep(_):
+            return None
+
+        monkeypatch.setattr("scrapers.utils.async_http_client.asyncio.sleep", no_sleep)
+
+        async with AsyncHTTPClient(max_retries=3, transport=httpx.MockTransport(handler)) as client:
+            response = await client.get("https://example.com/feed")
+
+        assert response.status_code == 200
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_raises_on_client_error(self):
+        """Non-retryable errors should raise HTTPStatusError"""
+        async def handler(request):
+            return httpx.Response(404)
+
+        async with AsyncHTTPClient(transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get("https://example.com/missing")
+
+
+    @pytest.mark.asyncio
+    async def test_throttle_reported_to_host_controller(self):
+        """429 with Retry-After should shrink the host limit and be retried after the wait"""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, text="ok")
+
+        controller = HostConcurrencyController(config={'default': {'initial': 4}})
+        async with AsyncHTTPClient(host_controller=controller, transport=httpx.MockTransport(handler)) as client:
+            response = await client.get("https://example.com/feed")
+
+        assert response.status_code == 200
+        assert len(calls) == 2
+        assert controller.limit("example.com") == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_returns_its_slot(self):
+        """A request cancelled mid-flight (e.g. by a timeout) must not keep the host's slot"""
+        started = asyncio.Event()
+
+        async def handler(request):
+            started.set()
+            await asyncio.sleep(10)
+            return httpx.Response(200, text="ok")
+
+        controller = HostConcurrencyController(config={'default': {'initial': 1, 'max': 1}})
+        async with AsyncHTTPClient(host_controller=controller, transport=httpx.MockTransport(handler)) as client:
+            task = asyncio.create_task(client.get("https://example.com/slow"))
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert controller.try_acquire("example.com") == 0
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_returns_its_slot(self):
+        async def handler(request):
+            raise ValueError("broken response")
+
+        controller = HostConcurrencyController(config={'default': {'initial': 1, 'max': 1}})
+        async with AsyncHTTPClient(host_controller=controller, transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(ValueError):
+                await client.get("https://example.com/feed")
+
+        assert controller.try_acquire("example.com") == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
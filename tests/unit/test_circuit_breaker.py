@@ -0,0 +1,115 @@
+"""
+Tests for scrapers/utils/circuit_breaker.py
+"""
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.circuit_breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+
+CONFIG = {
+    'failure_threshold': 2,
+    'cooldown_seconds': 60,
+    'max_cooldown_seconds': 200,
+    'probe_timeout_seconds': 10,
+    'report_after_runs': 3
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    with patch('scrapers.utils.circuit_breaker.get_shared_redis_client', return_value=None):
+        yield CircuitBreaker(config=CONFIG, clock=clock)
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker with the in-process fallback store"""
+
+    def test_opens_after_threshold(self, breaker):
+        breaker.record_failure("dead.example.com", "timeout")
+        assert breaker.allow("dead.example.com")
+
+        breaker.record_failure("dead.example.com", "timeout")
+        assert breaker.state("dead.example.com") == OPEN
+        assert not breaker.allow("dead.example.com")
+
+    def test_success_resets_failures(self, breaker):
+        breaker.record_failure("flaky.example.com")
+        breaker.record_success("flaky.example.com")
+        breaker.record_failure("flaky.example.com")
+
+        assert breaker.state("flaky.example.com") == CLOSED
+
+    def test_half_open_allows_single_probe(self, breaker, clock):
+        breaker.record_failure("dead.example.com")
+        breaker.record_failure("dead.example.com")
+        clock.now += 61
+
+        assert breaker.allow("dead.example.com")
+        assert breaker.state("dead.example.com") == HALF_OPEN
+        assert not breaker.allow("dead.example.com")
+
+    def test_probe_success_closes(self, breaker, clock):
+        breaker.record_failure("dead.example.com")
+        breaker.record_failure("dead.example.com")
+        clock.now += 61
+        breaker.allow("dead.example.com")
+
+        breaker.record_success("dead.example.com")
+
+        assert breaker.state("dead.example.com") == CLOSED
+        assert breaker.allow("dead.example.com")
+
+    def test_probe_failure_doubles_cooldown(self, breaker, clock):
+        breaker.record_failure("dead.example.com")
+        breaker.record_failure("dead.example.com")
+        for expected_cooldown in (120, 200, 200):
+            clock.now += 1000
+            assert breaker.allow("dead.example.com")
+            breaker.record_failure("dead.example.com")
+
+            clock.now += expected_cooldown - 1
+            assert not breaker.allow("dead.example.com")
+            clock.now += 1
+
+    def test_report_sources_failing_consecutive_runs(self, breaker):
+        for _ in range(3):
+            breaker.record_failure("dead.example.com")
+            breaker.record_success("ok.example.com")
+            failing = breaker.end_run()
+
+        assert [item['source'] for item in failing] == ["dead.example.com"]
+        assert failing[0]['failed_runs'] == 3
+        assert failing[0]['state'] == OPEN
+
+    def test_skipped_run_counts_as_failed_and_success_resets(self, breaker):
+        breaker.record_failure("dead.example.com")
+        breaker.record_failure("dead.example.com")
+        breaker.end_run()
+        breaker.allow("dead.example.com")  # Refused, circuit open
+        breaker.end_run()
+        assert breaker.failing_sources(min_runs=2)[0]['failed_runs'] == 2
+
+        breaker.record_success("dead.example.com")
+        breaker.end_run()
+        assert breaker.failing_sources(min_runs=1) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
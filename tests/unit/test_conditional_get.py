@@ -0,0 +1,65 @@
+"""
+Tests for scrapers/utils/conditional_get.py
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+import redis
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.conditional_get import FeedValidatorCache
+
+FEED_URL = "https://www.porttechnology.org/feed/"
+
+
+class TestFeedValidatorCache:
+    """Tests for FeedValidatorCache"""
+
+    @patch('scrapers.utils.conditional_get.get_shared_redis_client')
+    def test_no_headers_for_unknown_feed(self, mock_redis, tmp_path):
+        """A feed that was never fetched gets no conditional headers"""
+        mock_redis.return_value.hgetall.return_value = {}
+        cache = FeedValidatorCache(local_path=str(tmp_path / "validators.json"))
+
+        assert cache.request_headers(FEED_URL) == {}
+
+    @patch('scrapers.utils.conditional_get.get_shared_redis_client')
+    def test_builds_conditional_headers_from_redis(self, mock_redis, tmp_path):
+        """Stored validators become If-None-Match / If-Modified-Since"""
+        mock_redis.return_value.hgetall.return_value = {
+            'etag': '"abc123"',
+            'last_modified': 'Wed, 05 Feb 2026 14:30:00 GMT'
+        }
+        cache = FeedValidatorCache(local_path=str(tmp_path / "validators.json"))
+
+        headers = cache.request_headers(FEED_URL)
+
+        assert headers['If-None-Match'] == '"abc123"'
+        assert headers['If-Modified-Since'] == 'Wed, 05 Feb 2026 14:30:00 GMT'
+
+    @patch('scrapers.utils.conditional_get.report_redis_failure')
+    @patch('scrapers.utils.conditional_get.get_shared_redis_client')
+    def test_falls_back_to_local_file(self, mock_redis, mock_report, tmp_path):
+        """Validators round-trip through the local file when Redis is down"""
+        mock_redis.return_value.hgetall.side_effect = redis.ConnectionError("down")
+        mock_redis.return_value.pipeline.side_effect = redis.ConnectionError("down")
+        cache = FeedValidatorCache(local_path=str(tmp_path / "validators.json"))
+
+        saved = cache.update(FEED_URL, {'ETag': '"v1"'})
+
+        assert saved is True
+        assert cache.request_headers(FEED_URL) == {'If-None-Match': '"v1"'}
+
+    @patch('scrapers.utils.conditional_get.get_shared_redis_client')
+    def test_update_without_validators_is_noop(self, mock_redis, tmp_path):
+        """Responses without ETag/Last-Modified are not stored"""
+        cache = FeedValidatorCache(local_path=str(tmp_path / "validators.json"))
+
+        assert cache.update(FEED_URL, {}) is False
+        mock_redis.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
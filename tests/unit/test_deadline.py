@@ -0,0 +1,42 @@
+"""
+Tests for utils/deadline.py
+"""
+import pytest
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.deadline import Deadline, DeadlineExceeded
+
+
+class TestDeadline:
+    """Tests for Deadline"""
+
+    def test_remaining_and_expired(self):
+        assert 9 < Deadline.after(10).remaining() <= 10
+        assert not Deadline.after(10).expired()
+        assert Deadline.after(-1).expired()
+        assert Deadline.after(-1).remaining() == 0
+
+    def test_sub_never_outlives_parent(self):
+        parent = Deadline.after(10)
+
+        assert parent.sub(100).at == parent.at
+        assert parent.sub(5).remaining() <= 5
+        assert parent.sub(reserve=4).at == parent.at - 4
+
+    def test_cap_shrinks_timeout(self):
+        deadline = Deadline.after(5)
+
+        assert deadline.cap(30) <= 5
+        assert deadline.cap(1) == 1
+
+    def test_cap_after_expiry_raises(self):
+        with pytest.raises(DeadlineExceeded):
+            Deadline(time.time() - 1).cap(30)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
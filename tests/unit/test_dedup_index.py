@@ -0,0 +1,192 @@
+"""
+Tests for scrapers/utils/dedup_index.py
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+from datetime import datetime
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.dedup_index import BloomFilter, DedupIndex, url_key
+from graph.nodes.handoff_node import handoff_node
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """The sorted-set commands DedupIndex uses"""
+
+    def __init__(self):
+        self.zset = {}
+        self.pending = []
+
+    def pipeline(self):
+        self.pending = []
+        return self
+
+    def execute(self):
+        results, self.pending = [call() for call in self.pending], []
+        return results
+
+    def zadd(self, key, mapping):
+        self.zset.update(mapping)
+
+    def zscore(self, key, member):
+        self.pending.append(lambda: self.zset.get(member))
+
+    def zrange(self, key, start, end):
+        self.pending.append(lambda: list(self.zset))
+
+    def zremrangebyscore(self, key, low, high):
+        def remove():
+            expired = [member for member, score in self.zset.items() if score <= high]
+            for member in expired:
+                del self.zset[member]
+            return len(expired)
+        self.pending.append(remove)
+
+
+def make_index(clock=None, **config):
+    return DedupIndex(config={'ttl_days': 1, 'bloom_capacity': 1000, 'refresh_seconds': 60, **config},
+                      clock=clock or FakeClock())
+
+
+def doc(url, source="Port News"):
+    return {'url': url, 'source': source}
+
+
+class TestBloomFilter:
+    """Tests for BloomFilter"""
+
+    def test_no_false_negatives_and_few_false_positives(self):
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        for i in range(5000):
+            bloom.add(url_key(f"https://example.com/{i}"))
+
+        assert all(url_key(f"https://example.com/{i}") in bloom for i in range(5000))
+        false_positives = sum(url_key(f"https://other.example/{i}") in bloom for i in range(5000))
+        assert false_positives < 5000 * 0.03
+
+    def test_memory_footprint(self):
+        # ~1.2 bytes per item at 0.1%
+        assert 170_000 < BloomFilter(capacity=100_000, error_rate=0.001).memory_bytes < 190_000
+
+
+class TestDedupIndex:
+    """Tests for DedupIndex"""
+
+    def test_url_key_ignores_cosmetic_differences(self):
+        assert url_key("HTTPS://Example.com/news/1/#comments") == url_key("https://example.com/news/1")
+        assert url_key("https://example.com/news/1?page=2") != url_key("https://example.com/news/1")
+
+    @patch('scrapers.utils.dedup_index.get_shared_redis_client')
+    def test_published_urls_are_dropped_in_order(self, mock_redis):
+        mock_redis.return_value = FakeRedis()
+        index = make_index()
+        index.add(["https://example.com/b"])
+
+        docs = [doc("https://example.com/a"), doc("https://example.com/b/"), doc("https://example.com/c")]
+
+        assert index.filter_new(docs, stage="scrape") == [docs[0], docs[2]]
+
+    @patch('scrapers.utils.dedup_index.get_shared_redis_client')
+    def test_loads_urls_published_elsewhere_and_expires_them(self, mock_redis):
+        client = FakeRedis()
+        mock_redis.return_value = client
+        clock = FakeClock()
+        # Published by another worker
+        make_index(clock=clock).add(["https://example.com/a"])
+        index = make_index(clock=clock)
+
+        assert index.published(["https://example.com/a", "https://example.com/z"]) == [True, False]
+
+        clock.now += 86400 + 61  # Past the TTL and the refresh interval
+        assert index.published(["https://example.com/a"]) == [False]
+        assert client.zset == {}
+
+    @patch('scrapers.utils.dedup_index.get_shared_redis_client')
+    def test_bloom_negatives_skip_redis(self, mock_redis):
+        client = FakeRedis()
+        client.zscore = MagicMock()
+        mock_redis.return_value = client
+        index = make_index()
+
+        assert index.published(["https://example.com/new"]) == [False]
+        client.zscore.assert_not_called()
+
+    @patch('scrapers.utils.dedup_index.get_shared_redis_client', return_value=None)
+    def test_redis_down_counts_everything_as_new(self, mock_redis):
+        index = make_index()
+        docs = [doc("https://example.com/a")]
+
+        assert index.filter_new(docs, stage="handoff") == docs
+        assert index.add(["https://example.com/a"]) is False
+
+
+class TestHandoffDedup:
+    """handoff_node publishes only new signals and records them once published"""
+
+    @patch('graph.nodes.handoff_node.save_source_last_run_times', MagicMock(return_value=True))
+    @patch('graph.nodes.handoff_node.publish_batch', return_value=True)
+    @patch('graph.nodes.handoff_node.dedup_index')
+    def test_publishes_new_signals_only(self, mock_index, mock_publish):
+        signals = [doc("https://example.com/a"), doc("https://example.com/b")]
+        mock_index.filter_new.return_value = signals[1:]
+
+        handoff_node({"signals": signals})
+
+        batch = mock_publish.call_args.args[0]
+        assert batch["signals"] == signals[1:] and batch["signals_count"] == 1
+        assert list(mock_index.add.call_args.args[0]) == ["https://example.com/b"]
+
+    @patch('graph.nodes.handoff_node.save_source_last_run_times')
+    @patch('graph.nodes.handoff_node.publish_batch', return_value=False)
+    @patch('graph.nodes.handoff_node.dedup_index')
+    def test_failed_publish_is_not_recorded(self, mock_index, mock_publish, mock_save_runs):
+        mock_index.filter_new.side_effect = lambda signals, stage: signals
+
+        with patch('graph.nodes.handoff_node.high_water_marks') as mock_marks, \
+                patch('graph.nodes.handoff_node.feed_validator_cache') as mock_validators, \
+                patch('graph.nodes.handoff_node.feed_stats') as mock_feed_stats:
+            handoff_node({"signals": [doc("https://example.com/a")], "completed_sources": ["rss"],
+                          "pending_marks": [{'source': 'feed', 'entry_ids': ['a'], 'newest': None}],
+                          "pending_validators": [{'url': 'feed', 'validators': {'etag': '"v1"'}}],
+                          "pending_polls": [{'url': 'feed', 'published': [], 'polled_at': 1000.0}]})
+
+        mock_index.add.assert_not_called()
+        mock_marks.advance.assert_not_called()
+        mock_validators.save.assert_not_called()
+        mock_feed_stats.record_poll.assert_not_called()
+        mock_save_runs.assert_not_called()
+
+    @patch('graph.nodes.handoff_node.save_source_last_run_times')
+    @patch('graph.nodes.handoff_node.publish_batch', return_value=True)
+    @patch('graph.nodes.handoff_node.dedup_index')
+    def test_published_batch_records_run_state(self, mock_index, mock_publish, mock_save_runs):
+        mock_index.filter_new.side_effect = lambda signals, stage: signals
+        newest = datetime(2026, 3, 2)
+
+        with patch('graph.nodes.handoff_node.high_water_marks') as mock_marks, \
+                patch('graph.nodes.handoff_node.feed_validator_cache') as mock_validators, \
+                patch('graph.nodes.handoff_node.feed_stats') as mock_feed_stats:
+            handoff_node({"signals": [doc("https://example.com/a")], "completed_sources": ["rss"],
+                          "pending_marks": [{'source': 'feed', 'entry_ids': ['a'], 'newest': newest}],
+                          "pending_validators": [{'url': 'feed', 'validators': {'etag': '"v1"'}}],
+                          "pending_polls": [{'url': 'feed', 'published': [newest], 'polled_at': 1000.0}]})
+
+        mock_marks.advance.assert_called_once_with(source='feed', entry_ids=['a'], newest=newest)
+        mock_validators.save.assert_called_once_with(url='feed', validators={'etag': '"v1"'})
+        assert mock_save_runs.call_args.args[0] == ["rss"]
+        mock_feed_stats.record_poll.assert_called_once_with(url='feed', published=[newest], polled_at=1000.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,122 @@
+"""
+Tests for scrapers/utils/feed_parser.py
+"""
+import pytest
+from datetime import datetime
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.feed_parser import parse_feed, parse_feed_date
+
+FEEDS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "feeds")
+
+
+def load_feed(name: str) -> bytes:
+    with open(os.path.join(FEEDS_DIR, name), "rb") as f:
+        return f.read()
+
+
+class TestParseFeed:
+    """Tests for parse_feed"""
+
+    def test_wordpress_rss(self):
+        feed = parse_feed(load_feed("wordpress_rss.xml"))
+
+        assert not feed.fallback
+        assert feed.title == "Port Technology International"
+        assert len(feed.entries) == 40
+        entry = feed.entries[0]
+        assert entry['id'] == "https://www.porttechnology.org/?p=1000"
+        assert entry['title'] == "Automated cranes cut berth time at Rotterdam (0)"
+        assert entry['link'] == "https://www.porttechnology.org/news/article-0/"
+        assert entry['published'] == datetime(2026, 2, 6, 10, 0)
+        assert entry['content'].startswith("<p>The port authority said")
+        assert entry['summary'].startswith("<p>Automated cranes")
+
+    def test_atom(self):
+        feed = parse_feed(load_feed("atom_feed.xml"))
+
+        assert feed.title == "Maritime Tech Daily"
+        entry = feed.entries[0]
+        assert entry['id'] == "https://www.example-maritime.com/0/story"
+        assert entry['link'] == "https://www.example-maritime.com/0/story"
+        assert entry['published'] == datetime(2026, 2, 6, 10, 0)
+        assert "&amp; reliability" in entry['content']
+
+    def test_rss1_with_dublin_core_dates(self):
+        feed = parse_feed(load_feed("rdf_feed.xml"))
+
+        assert feed.title == "Shipping Innovation News"
+        assert len(feed.entries) == 25
+        assert feed.entries[1]['published'] == datetime(2026, 2, 5, 21, 0)
+        assert feed.entries[1]['content'] == ""
+
+    def test_stops_at_limit(self):
+        feed = parse_feed(load_feed("wordpress_rss.xml"), limit=5)
+
+        assert len(feed.entries) == 5
+
+    def test_stops_at_first_entry_past_cutoff(self):
+        # Entries are 9 hours apart, newest at 2026-02-06 10:00
+        feed = parse_feed(load_feed("wordpress_rss.xml"), cutoff=datetime(2026, 2, 5, 0, 0))
+
+        assert len(feed.entries) == 4
+        assert all(entry['published'] >= datetime(2026, 2, 5) for entry in feed.entries)
+
+    def test_skips_seen_ids_without_counting_them(self):
+        seen = {"https://www.porttechnology.org/?p=1000", "https://www.porttechnology.org/?p=1002"}
+
+        feed = parse_feed(load_feed("wordpress_rss.xml"), limit=3, skip_ids=seen)
+
+        assert [entry['id'] for entry in feed.entries] == [
+            "https://www.porttechnology.org/?p=1001",
+            "https://www.porttechnology.org/?p=1003",
+            "https://www.porttechnology.org/?p=1004",
+        ]
+        assert feed.skipped == 2
+
+    def test_malformed_feed_falls_back_to_feedparser(self):
+        feed = parse_feed(load_feed("malformed_rss.xml"), limit=3)
+
+        assert feed.fallback
+        assert feed.title == "Legacy Port News"
+        assert [entry['title'] for entry in feed.entries] == [
+            "Ports & terminals update 0", "Ports & terminals update 1", "Ports & terminals update 2"
+        ]
+        assert feed.entries[0]['published'] == datetime(2026, 2, 6, 10, 0)
+
+    def test_non_feed_xml_falls_back(self):
+        feed = parse_feed(b"<?xml version='1.0'?><html><body><p>Not a feed</p></body></html>")
+
+        assert feed.fallback
+        assert feed.entries == []
+
+    def test_empty_content(self):
+        feed = parse_feed(b"")
+
+        assert feed.title is None
+        assert feed.entries == []
+
+
+class TestParseFeedDate:
+    """Tests for parse_feed_date"""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("Wed, 05 Feb 2026 14:30:00 GMT", datetime(2026, 2, 5, 14, 30)),
+        ("Wed, 05 Feb 2026 16:30:00 +0200", datetime(2026, 2, 5, 14, 30)),
+        ("2026-02-05T14:30:00Z", datetime(2026, 2, 5, 14, 30)),
+        ("2026-02-05T09:30:00-05:00", datetime(2026, 2, 5, 14, 30)),
+        ("February 5, 2026 14:30", datetime(2026, 2, 5, 14, 30)),
+    ])
+    def test_formats(self, value, expected):
+        assert parse_feed_date(value) == expected
+
+    def test_unparseable(self):
+        assert parse_feed_date("") is None
+        assert parse_feed_date("sometime soon") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
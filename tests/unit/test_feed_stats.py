@@ -0,0 +1,143 @@
+"""
+Tests for scrapers/utils/feed_stats.py
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timedelta
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.feed_stats import FeedStats, FeedStatsStore, DUE_SLACK_SECONDS
+from graph.nodes.handoff_node import handoff_node
+
+FEED_URL = "https://www.porttechnology.org/feed/"
+START = datetime(2026, 3, 2, 12, 0)
+CONFIG = {'min_minutes': 60, 'max_minutes': 1440, 'target_items': 1, 'smoothing': 0.5, 'empty_backoff': 2}
+
+
+class Clock:
+    def __init__(self, at: datetime):
+        self.at = at
+
+    def __call__(self) -> float:
+        return (self.at - datetime(1970, 1, 1)).total_seconds()
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Store on the local fallback file (Redis unavailable), clock at START"""
+    with patch('scrapers.utils.feed_stats.get_shared_redis_client', return_value=None), \
+            patch('scrapers.utils.feed_stats.record_feed_poll'), \
+            patch('scrapers.utils.feed_stats.record_feed_polls_skipped'):
+        yield FeedStatsStore(config=CONFIG, local_path=str(tmp_path / "feed_stats.json"), clock=Clock(START))
+
+
+def hourly(count: int, hours: float, end: datetime = START):
+    """count entry dates, hours apart, the last at end"""
+    return [end - timedelta(hours=hours * i) for i in range(count)]
+
+
+class TestFeedStatsStore:
+    """Tests for FeedStatsStore"""
+
+    def test_new_feeds_are_due(self, store):
+        assert store.due([FEED_URL, "https://example.com/rss"]) == [FEED_URL, "https://example.com/rss"]
+
+    def test_learns_interval_from_entry_dates(self, store):
+        """Entries 3 hours apart schedule the next poll 3 hours out"""
+        stats = store.record_poll(FEED_URL, hourly(5, 3))
+
+        assert stats.mean_interval == pytest.approx(3 * 3600)
+        assert stats.next_poll - stats.last_poll == pytest.approx(3 * 3600)
+        assert stats.empty_streak == 0
+
+    def test_interval_within_bounds(self, store):
+        busy = store.record_poll(FEED_URL, hourly(10, 0.1))
+        quiet = store.record_poll("https://example.com/rss", hourly(3, 24 * 10))
+
+        assert busy.next_poll - busy.last_poll == 3600
+        assert quiet.next_poll - quiet.last_poll == 86400
+
+    def test_empty_polls_back_off(self, store):
+        store.record_poll(FEED_URL, hourly(5, 2))
+        store._clock.at += timedelta(hours=2)
+        stats = store.record_poll(FEED_URL, [])
+
+        assert stats.empty_streak == 1
+        assert stats.next_poll - stats.last_poll == pytest.approx(4 * 3600)
+
+    def test_only_newer_entries_count(self, store):
+        """Entries already seen (not newer than the newest known) change nothing"""
+        store.record_poll(FEED_URL, hourly(3, 1))
+        store._clock.at += timedelta(hours=1)
+        stats = store.record_poll(FEED_URL, hourly(3, 1, end=START + timedelta(hours=1)))
+
+        assert stats.actual_items == 1
+        assert stats.mean_interval == pytest.approx(3600)
+
+    def test_records_expected_and_actual_yield(self, store):
+        """A feed averaging 1 entry per hour, polled 4 hours later, was expected to have 4"""
+        store.record_poll(FEED_URL, hourly(5, 1))
+        store._clock.at += timedelta(hours=4)
+        with patch('scrapers.utils.feed_stats.record_feed_poll') as mock_record:
+            stats = store.record_poll(FEED_URL, [START + timedelta(hours=3)])
+
+        assert stats.expected_items == pytest.approx(4)
+        assert stats.actual_items == 1
+        url, expected, actual, _ = mock_record.call_args.args
+        assert (url, actual) == (FEED_URL, 1) and expected == pytest.approx(4)
+
+    def test_skips_feeds_not_due(self, store):
+        store.record_poll(FEED_URL, hourly(5, 3))
+        store._clock.at += timedelta(hours=1)
+        assert store.due([FEED_URL, "https://example.com/rss"]) == ["https://example.com/rss"]
+
+        store._clock.at += timedelta(hours=2, seconds=-DUE_SLACK_SECONDS)
+        assert store.due([FEED_URL]) == [FEED_URL]
+
+    def test_every_feed_due_when_disabled(self, store):
+        store.record_poll(FEED_URL, hourly(5, 3))
+        with patch('scrapers.utils.feed_stats.settings', MagicMock(ADAPTIVE_POLLING=False)):
+            assert store.due([FEED_URL]) == [FEED_URL]
+
+    def test_poll_dated_when_it_happened(self, store):
+        """A poll recorded later (at the handoff) is scheduled from when it was made"""
+        polled_at = store._clock()
+        store._clock.at += timedelta(minutes=40)
+        stats = store.record_poll(FEED_URL, hourly(5, 3), polled_at=polled_at)
+
+        assert stats.last_poll == polled_at
+        assert stats.next_poll == pytest.approx(polled_at + 3 * 3600)
+
+    @pytest.mark.parametrize("published, due", [(False, True), (True, False)])
+    def test_poll_recorded_only_when_batch_published(self, store, published, due):
+        """A lost batch leaves the feed due, so its entries are fetched again next run"""
+        poll = {'url': FEED_URL, 'published': hourly(5, 3), 'polled_at': store._clock()}
+        with patch('graph.nodes.handoff_node.feed_stats', store), \
+                patch('graph.nodes.handoff_node.publish_batch', return_value=published), \
+                patch('graph.nodes.handoff_node.dedup_index', MagicMock(filter_new=MagicMock(return_value=[]))), \
+                patch('graph.nodes.handoff_node.near_duplicate_index', MagicMock()), \
+                patch('graph.nodes.handoff_node.save_source_last_run_times', MagicMock(return_value=True)):
+            handoff_node({"signals": [], "pending_polls": [poll]})
+
+        store._clock.at += timedelta(hours=1)
+        assert (store.due([FEED_URL]) == [FEED_URL]) is due
+
+    @patch('scrapers.utils.feed_stats.get_shared_redis_client')
+    def test_round_trips_through_redis(self, mock_redis, tmp_path):
+        client = mock_redis.return_value
+        client.pipeline.return_value.execute.return_value = [{}]
+        store = FeedStatsStore(config=CONFIG, local_path=str(tmp_path / "feed_stats.json"), clock=Clock(START))
+        with patch('scrapers.utils.feed_stats.record_feed_poll'):
+            stats = store.record_poll(FEED_URL, hourly(3, 2))
+
+        saved = client.pipeline.return_value.hset.call_args.kwargs['mapping']
+        assert 'mean_interval' in saved and 'next_poll' in saved
+        assert FeedStatsStore._stats({name: str(value) for name, value in saved.items()}) == stats
+        assert not (tmp_path / "feed_stats.json").exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
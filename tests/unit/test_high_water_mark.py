@@ -0,0 +1,117 @@
+"""
+Tests for scrapers/utils/high_water_mark.py
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timedelta, timezone
+import redis
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils import high_water_mark
+from scrapers.utils.high_water_mark import HighWaterMark, HighWaterMarkStore, LATE_ENTRY_GRACE
+
+FEED_URL = "https://www.porttechnology.org/feed/"
+
+
+def redis_down(mock_redis):
+    mock_redis.return_value.pipeline.side_effect = redis.ConnectionError("down")
+    mock_redis.return_value.hget.side_effect = redis.ConnectionError("down")
+
+
+class TestHighWaterMark:
+    """Tests for HighWaterMark"""
+
+    def test_cutoff_is_later_of_window_and_mark(self):
+        newest = datetime(2026, 3, 10, 12, 0)
+        mark = HighWaterMark(newest=newest)
+
+        assert mark.cutoff(datetime(2026, 3, 1)) == newest - LATE_ENTRY_GRACE
+        assert mark.cutoff(datetime(2026, 3, 10)) == datetime(2026, 3, 10)
+        assert HighWaterMark().cutoff(datetime(2026, 3, 1)) == datetime(2026, 3, 1)
+
+    def test_cutoff_keeps_aware_window(self):
+        mark = HighWaterMark(newest=datetime(2026, 3, 10, 12, 0))
+
+        cutoff = mark.cutoff(datetime(2026, 3, 1, tzinfo=timezone.utc))
+
+        assert cutoff == datetime(2026, 3, 9, 12, 0, tzinfo=timezone.utc)
+
+    def test_is_new(self):
+        mark = HighWaterMark(seen=frozenset({"guid-1"}))
+
+        assert not mark.is_new("guid-1")
+        assert mark.is_new("guid-2")
+        assert mark.is_new(None)
+
+
+class TestHighWaterMarkStore:
+    """Tests for HighWaterMarkStore"""
+
+    @patch('scrapers.utils.high_water_mark.get_shared_redis_client')
+    def test_loads_from_redis(self, mock_redis, tmp_path):
+        pipe = mock_redis.return_value.pipeline.return_value
+        pipe.execute.return_value = ['2026-03-10T12:00:00', ['guid-1', 'guid-2']]
+        store = HighWaterMarkStore(local_path=str(tmp_path / "marks.json"))
+
+        mark = store.load(FEED_URL)
+
+        assert mark.newest == datetime(2026, 3, 10, 12, 0)
+        assert mark.seen == {'guid-1', 'guid-2'}
+
+    @patch('scrapers.utils.high_water_mark.get_shared_redis_client')
+    def test_advance_keeps_latest_date_and_trims_seen(self, mock_redis, tmp_path):
+        mock_redis.return_value.hget.return_value = '2026-03-10T12:00:00'
+        pipe = mock_redis.return_value.pipeline.return_value
+        store = HighWaterMarkStore(local_path=str(tmp_path / "marks.json"))
+
+        store.advance(FEED_URL, ['guid-3', None], datetime(2026, 3, 9))
+
+        pipe.hset.assert_not_called()  # Older than the stored mark
+        assert list(pipe.zadd.call_args.args[1]) == ['guid-3']
+        pipe.zremrangebyrank.assert_called_once_with(
+            f"scraper:hwm:{FEED_URL}:seen", 0, -high_water_mark.MAX_SEEN_IDS - 1
+        )
+
+    @patch('scrapers.utils.high_water_mark.report_redis_failure')
+    @patch('scrapers.utils.high_water_mark.get_shared_redis_client')
+    def test_falls_back_to_local_file(self, mock_redis, mock_report, tmp_path):
+        redis_down(mock_redis)
+        store = HighWaterMarkStore(local_path=str(tmp_path / "marks.json"))
+
+        store.advance(FEED_URL, ['guid-1'], datetime(2026, 3, 10, 14, 0, tzinfo=timezone(timedelta(hours=2))))
+        store.advance(FEED_URL, ['guid-2'], datetime(2026, 3, 1))
+
+        mark = store.load(FEED_URL)
+        assert mark.newest == datetime(2026, 3, 10, 12, 0)  # Stored as naive UTC
+        assert mark.seen == {'guid-1', 'guid-2'}
+        assert store.load("https://other.example/feed").seen == frozenset()
+
+    @patch('scrapers.utils.high_water_mark.report_redis_failure')
+    @patch('scrapers.utils.high_water_mark.get_shared_redis_client')
+    def test_local_seen_ids_are_capped(self, mock_redis, mock_report, tmp_path):
+        redis_down(mock_redis)
+        store = HighWaterMarkStore(local_path=str(tmp_path / "marks.json"))
+
+        with patch.object(high_water_mark, 'MAX_SEEN_IDS', 2), \
+                patch('scrapers.utils.high_water_mark.time.time', side_effect=[1.0, 2.0, 3.0]):
+            for guid in ('guid-1', 'guid-2', 'guid-3'):
+                store.advance(FEED_URL, [guid])
+
+        assert store.load(FEED_URL).seen == {'guid-2', 'guid-3'}
+
+    @patch('scrapers.utils.high_water_mark.get_shared_redis_client')
+    def test_disabled_incremental_scraping_loads_nothing(self, mock_redis, tmp_path):
+        store = HighWaterMarkStore(local_path=str(tmp_path / "marks.json"))
+
+        with patch('scrapers.utils.high_water_mark.settings', MagicMock(INCREMENTAL_SCRAPING=False)):
+            mark = store.load(FEED_URL)
+
+        assert mark == HighWaterMark()
+        mock_redis.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
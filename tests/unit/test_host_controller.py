@@ -0,0 +1,145 @@
+"""
+Tests for scrapers/utils/host_controller.py
+"""
+import pytest
+import asyncio
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.host_controller import (
+    HostConcurrencyController, HostBackoffError, parse_retry_after
+)
+from utils.deadline import Deadline, DeadlineExceeded
+
+CONFIG = {
+    'decrease_factor': 0.5,
+    'default': {'initial': 2, 'min': 1, 'max': 8},
+    'hosts': {'patents.google.com': {'initial': 1, 'max': 2}}
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def controller(clock):
+    return HostConcurrencyController(config=CONFIG, clock=clock)
+
+
+def run_requests(controller, clock, host, count, latency=0.1, status=200):
+    """Send count requests that keep the host's limit saturated"""
+    for _ in range(count):
+        slots = int(controller.limit(host))
+        for _ in range(slots):
+            assert controller.try_acquire(host) == 0
+        for _ in range(slots):
+            clock.now += latency
+            controller.release(host, status, latency=latency)
+
+
+class TestHostConcurrencyController:
+    """Tests for HostConcurrencyController"""
+
+    def test_initial_limits_from_config(self, controller):
+        assert controller.limit("export.arxiv.org") == 2
+        assert controller.limit("patents.google.com") == 1
+
+    def test_limit_blocks_extra_requests(self, controller):
+        assert controller.try_acquire("example.com") == 0
+        assert controller.try_acquire("example.com") == 0
+        assert controller.try_acquire("example.com") > 0
+
+    def test_healthy_host_grows_up_to_max(self, controller, clock):
+        run_requests(controller, clock, "example.com", count=50)
+
+        assert controller.limit("example.com") == 8
+
+    def test_unsaturated_host_does_not_grow(self, controller, clock):
+        for _ in range(20):
+            controller.try_acquire("example.com")
+            controller.release("example.com", 200, latency=0.1)
+
+        assert controller.limit("example.com") == 2
+
+    def test_throttle_halves_limit_and_honours_retry_after(self, controller, clock):
+        run_requests(controller, clock, "example.com", count=20)
+        before = controller.limit("example.com")
+
+        controller.try_acquire("example.com")
+        controller.release("example.com", 429, latency=0.1, retry_after="30")
+
+        assert controller.limit("example.com") == pytest.approx(before / 2)
+        assert controller.blocked_for("example.com") == pytest.approx(30)
+        assert controller.try_acquire("example.com") == pytest.approx(30)
+
+        clock.now += 31
+        assert controller.try_acquire("example.com") == 0
+
+    def test_limit_never_below_min(self, controller, clock):
+        for _ in range(5):
+            clock.now += 10
+            controller.try_acquire("patents.google.com")
+            controller.release("patents.google.com", 503)
+
+        assert controller.limit("patents.google.com") == 1
+
+    def test_rising_latency_cuts_limit(self, controller, clock):
+        run_requests(controller, clock, "example.com", count=10, latency=0.1)
+        before = controller.limit("example.com")
+
+        run_requests(controller, clock, "example.com", count=5, latency=2.0)
+
+        assert controller.limit("example.com") < before
+
+    def test_long_backoff_fails_fast(self, controller):
+        controller.try_acquire("patents.google.com")
+        controller.release("patents.google.com", 429, retry_after="120")
+
+        with pytest.raises(HostBackoffError):
+            controller.check_backoff("patents.google.com")
+
+    def test_acquire_gives_up_at_deadline(self, controller):
+        """Waiting for a slot never outlasts the run deadline"""
+        controller.try_acquire("patents.google.com")
+        started = time.monotonic()
+
+        with pytest.raises(DeadlineExceeded):
+            controller.acquire("patents.google.com", Deadline.after(0.2))
+        assert time.monotonic() - started < 1
+
+    def test_acquire_async_gives_up_at_deadline(self, controller):
+        controller.try_acquire("patents.google.com")
+
+        with pytest.raises(DeadlineExceeded):
+            asyncio.run(controller.acquire_async("patents.google.com", Deadline.after(0.2)))
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after"""
+
+    def test_seconds(self):
+        assert parse_retry_after("120") == 120
+
+    def test_http_date_in_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+    def test_invalid(self):
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
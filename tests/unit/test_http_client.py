@@ -0,0 +1,168 @@
+"""
+Tests for scrapers/utils/http_client.py
+"""
+import pytest
+import requests
+from unittest.mock import patch
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.http_client import HTTPClient, UnsupportedContentTypeError
+from scrapers.utils.host_controller import HostConcurrencyController, HostBackoffError
+from scrapers.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+# path -> (content type, body size)
+PAGES = {
+    '/small.html': ('text/html; charset=utf-8', 1000),
+    '/big.html': ('text/html', 500_000),
+    '/file.pdf': ('application/pdf', 500_000),
+    '/untyped': (None, 1000),
+}
+
+throttle_hits = {}
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.startswith('/throttled'):
+            return self._throttled()
+        content_type, size = PAGES[self.path]
+        self.send_response(200)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(size))
+        self.end_headers()
+        written = 0
+        try:
+            while written < size:
+                chunk = b"x" * min(65536, size - written)
+                self.wfile.write(chunk)
+                written += len(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _throttled(self):
+        """429 with Retry-After on the first hit of each path, 200 afterwards"""
+        hits = throttle_hits[self.path] = throttle_hits.get(self.path, 0) + 1
+        retry_after = self.path.rsplit('/', 1)[-1]
+        if hits == 1:
+            self.send_response(429)
+            self.send_header("Retry-After", retry_after)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+@pytest.fixture
+def client():
+    client = HTTPClient(max_retries=0)
+    client.body_limits = {'text/html': 100_000}
+    return client
+
+
+class TestGetLimited:
+    """Tests for HTTPClient.get_limited"""
+
+    def test_small_body_read_whole(self, client, local_server):
+        response = client.get_limited(f"{local_server}/small.html")
+
+        assert response.status_code == 200
+        assert response.content == b"x" * 1000
+        assert response.truncated is False
+
+    def test_big_body_truncated_at_cap(self, client, local_server):
+        response = client.get_limited(f"{local_server}/big.html")
+
+        assert len(response.content) == 100_000
+        assert response.truncated is True
+
+    def test_unsupported_type_rejected(self, client, local_server):
+        with pytest.raises(UnsupportedContentTypeError):
+            client.get_limited(f"{local_server}/file.pdf")
+
+    def test_missing_content_type_treated_as_html(self, client, local_server):
+        response = client.get_limited(f"{local_server}/untyped")
+
+        assert response.content == b"x" * 1000
+
+
+class TestThrottling:
+    """Tests for Retry-After handling through the host controller"""
+
+    @pytest.fixture
+    def controller(self):
+        controller = HostConcurrencyController(config={})
+        with patch('scrapers.utils.http_client.host_controller', controller):
+            yield controller
+
+    def test_retries_after_short_retry_after(self, controller, local_server):
+        client = HTTPClient(max_retries=1)
+
+        response = client.get(f"{local_server}/throttled/a/0")
+
+        assert response.status_code == 200
+        assert throttle_hits['/throttled/a/0'] == 2
+
+    def test_long_retry_after_fails_fast(self, controller, local_server):
+        client = HTTPClient(max_retries=1)
+
+        with pytest.raises(Exception):
+            client.get(f"{local_server}/throttled/b/120")
+        assert throttle_hits['/throttled/b/120'] == 1
+
+        with pytest.raises(HostBackoffError):
+            client.get(f"{local_server}/throttled/b/120")
+
+    def test_unexpected_error_returns_its_slot(self, controller, local_server):
+        """Errors outside requests' own exceptions must not leak the host's slot"""
+        client = HTTPClient(max_retries=0)
+        host = local_server.split('//')[1]
+
+        with patch.object(client.session.__class__, 'get', side_effect=ValueError("bad")):
+            with pytest.raises(ValueError):
+                client.get(f"{local_server}/page")
+
+        assert controller._hosts[host].in_flight == 0
+
+
+class TestCircuitBreaking:
+    """Tests for skipping hosts with an open circuit"""
+
+    def test_dead_host_skipped_after_threshold(self):
+        breaker = CircuitBreaker(config={'failure_threshold': 2})
+        client = HTTPClient(max_retries=0)
+        # Nothing listens on port 9 locally, so connections are refused
+        url = "http://127.0.0.1:9/feed"
+
+        with patch('scrapers.utils.circuit_breaker.get_shared_redis_client', return_value=None), \
+                patch('scrapers.utils.http_client.circuit_breaker', breaker):
+            for _ in range(2):
+                with pytest.raises(requests.ConnectionError):
+                    client.get(url)
+            with pytest.raises(CircuitOpenError):
+                client.get(url)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
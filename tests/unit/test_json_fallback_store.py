@@ -0,0 +1,46 @@
+"""
+Tests for scrapers/utils/json_fallback_store.py
+"""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.json_fallback_store import JsonFallbackStore
+
+
+class TestJsonFallbackStore:
+    """Tests for JsonFallbackStore"""
+
+    def test_missing_file_reads_empty(self, tmp_path):
+        store = JsonFallbackStore(str(tmp_path / "store.json"), "test entries")
+
+        assert store.read() == {}
+        assert store.get("a") == {}
+
+    def test_update_keeps_other_entries(self, tmp_path):
+        store = JsonFallbackStore(str(tmp_path / "cache" / "store.json"), "test entries")
+
+        assert store.set("a", {'count': 1})
+        assert store.set("b", {'count': 1})
+        assert store.update("a", lambda stored: {'count': stored['count'] + 1})
+
+        assert store.read() == {'a': {'count': 2}, 'b': {'count': 1}}
+        assert not any(name.endswith(".tmp") for name in os.listdir(tmp_path / "cache"))
+
+    def test_unreadable_file_reads_empty(self, tmp_path):
+        path = tmp_path / "store.json"
+        path.write_text("{not json")
+
+        assert JsonFallbackStore(str(path), "test entries").read() == {}
+
+    def test_failed_write_returns_false(self, tmp_path):
+        (tmp_path / "taken").write_text("")  # A file where the directory should be
+        store = JsonFallbackStore(str(tmp_path / "taken" / "store.json"), "test entries")
+
+        assert store.set("a", {}) is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,51 @@
+"""
+Tests for scrapers/utils/keyword_matcher.py
+"""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.keyword_matcher import KeywordMatcher, keyword_matcher
+
+KEYWORDS = ["smart port", "port automation", "automation", "AGV", "TOS", "port 4.0",
+            "shore-to-ship power", "smart-ports", "Smart Port"]
+
+
+class TestKeywordMatcher:
+    """Tests for KeywordMatcher"""
+
+    def test_finds_overlapping_keywords_in_order(self):
+        matcher = KeywordMatcher(KEYWORDS)
+
+        found = matcher.find("The smart port automation roadmap: Port 4.0 and shore to ship power.")
+
+        assert found == ["smart port", "port automation", "automation", "port 4.0", "shore-to-ship power"]
+
+    def test_whole_words_plurals_and_case(self):
+        matcher = KeywordMatcher(KEYWORDS)
+
+        assert matcher.find("Fleet of AGVs at SMART PORTS") == ["AGV", "smart port"]
+        assert matcher.find("Photos of the tossed cargo") == []
+        assert matcher.find("") == []
+
+    def test_duplicate_spellings_are_one_keyword(self):
+        # "smart-ports" and "Smart Port" normalize to the same words as "smart port"
+        assert len(KeywordMatcher(KEYWORDS)) == 7
+
+    def test_score_weights_title_matches(self):
+        matcher = KeywordMatcher(KEYWORDS)
+
+        score, matched = matcher.score("AGV trial", "AGV fleet and port automation", title_weight=2)
+
+        assert score == 2 + 2  # AGV in the title; port automation + automation in the summary
+        assert matched == ["AGV", "port automation", "automation"]
+
+    def test_matcher_is_built_once_per_keyword_list(self):
+        assert keyword_matcher(tuple(KEYWORDS)) is keyword_matcher(tuple(KEYWORDS))
+        assert keyword_matcher(tuple(KEYWORDS)) is not keyword_matcher(tuple(KEYWORDS[:2]))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,134 @@
+"""
+Tests for scrapers/utils/keyword_rotation.py
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.keyword_rotation import KeywordRotation
+
+HOUR = 3600
+KEYWORDS = ["IoT", "RFID", "Blockchain", "smart port", "AGV", "port automation"]
+CATEGORIES = {"iot": "iot", "rfid": "iot", "blockchain": "blockchain",
+              "smart port": "port_operations", "agv": "port_operations", "port automation": "port_operations"}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def rotation(tmp_path):
+    """Rotation on the local fallback file (Redis unavailable), runs every 5 hours"""
+    with patch('scrapers.utils.keyword_rotation.get_shared_redis_client', return_value=None), \
+            patch('scrapers.utils.keyword_rotation.get_keyword_categories', return_value=CATEGORIES), \
+            patch('scrapers.utils.keyword_rotation.get_source_interval_config', return_value={'patents': 300}), \
+            patch('scrapers.utils.keyword_rotation.record_keyword_rotation'):
+        yield KeywordRotation(config={'cycle_hours': 15, 'batch_size': {'patents': 2}},
+                              local_path=str(tmp_path / "rotation.json"), clock=Clock())
+
+
+def run(rotation: KeywordRotation, keywords=KEYWORDS):
+    """One patents run: pick a batch, search it, advance the clock by the run interval"""
+    batch = rotation.next_batch("patents", keywords)
+    rotation.mark_searched("patents", batch)
+    rotation._clock.now += 5 * HOUR
+    return batch
+
+
+class TestKeywordRotation:
+    """Tests for KeywordRotation"""
+
+    def test_first_cycle_follows_config_order(self, rotation):
+        assert [run(rotation) for _ in range(3)] == [KEYWORDS[0:2], KEYWORDS[2:4], KEYWORDS[4:6]]
+
+    def test_every_keyword_searched_once_per_cycle(self, rotation):
+        """6 keywords, 2 per run, a run every 5h: each keyword within every 15h"""
+        last_seen = {}
+        for index in range(30):
+            for keyword in run(rotation):
+                if keyword in last_seen:
+                    assert index - last_seen[keyword] <= 3
+                last_seen[keyword] = index
+        assert set(last_seen) == set(KEYWORDS)
+
+    def test_deterministic(self, tmp_path, rotation):
+        batches = [run(rotation) for _ in range(6)]
+        with patch('scrapers.utils.keyword_rotation.get_shared_redis_client', return_value=None), \
+                patch('scrapers.utils.keyword_rotation.get_source_interval_config', return_value={'patents': 300}):
+            other = KeywordRotation(config={'cycle_hours': 15, 'batch_size': {'patents': 2}},
+                                    local_path=str(tmp_path / "other.json"), clock=Clock())
+            other._categories = CATEGORIES
+            assert [run(other) for _ in range(6)] == batches
+
+    def test_unsearched_keywords_keep_priority(self, rotation):
+        """Keywords picked but not searched (rate limited) come first next run"""
+        batch = rotation.next_batch("patents", KEYWORDS)
+        rotation.mark_searched("patents", batch[:1])
+        rotation._clock.now += 5 * HOUR
+
+        assert rotation.next_batch("patents", KEYWORDS)[0] == batch[1]
+
+    def test_weighted_categories_searched_more_often(self, rotation):
+        """With a long cycle, weighted keywords come back before the others"""
+        rotation.cycle_seconds = 1000 * HOUR
+        rotation.category_weights = {'port_operations': 3}
+        counts = {keyword: 0 for keyword in KEYWORDS}
+        for _ in range(30):
+            for keyword in run(rotation):
+                counts[keyword] += 1
+
+        assert min(counts[k] for k in ["smart port", "AGV", "port automation"]) > max(
+            counts[k] for k in ["IoT", "RFID", "Blockchain"])
+        assert min(counts.values()) >= 1
+
+    def test_weights_keep_every_keyword_within_cycle(self, rotation):
+        """Weighted keywords only get the slots the cycle does not need"""
+        keywords = ["IoT", "RFID", "smart port"]
+        rotation.batch_sizes = {'patents': 1}
+        rotation.category_weights = {'port_operations': 10}
+        now = rotation._clock.now
+        last_seen = {"smart port": now - 6 * HOUR, "RFID": now - 4.5 * HOUR, "IoT": now - 4 * HOUR}
+        for keyword, searched_at in last_seen.items():
+            rotation._clock.now = searched_at
+            rotation.mark_searched("patents", [keyword])
+        rotation._clock.now = now
+
+        for _ in range(12):
+            [keyword] = rotation.next_batch("patents", keywords)
+            assert rotation._clock.now - last_seen[keyword] <= 15 * HOUR, keyword
+            last_seen[keyword] = rotation._clock.now
+            rotation.mark_searched("patents", [keyword])
+            rotation._clock.now += 5 * HOUR
+        assert all(rotation._clock.now - 5 * HOUR - last <= 15 * HOUR for last in last_seen.values())
+
+    def test_report_last_searched(self, rotation):
+        run(rotation)
+        report = {row['keyword']: row for row in rotation.report("patents", KEYWORDS)}
+
+        assert report["IoT"]['last_searched'].startswith("1970-01-12")
+        assert report["IoT"]['overdue'] is False
+        assert report["AGV"]['last_searched'] is None and report["AGV"]['overdue'] is True
+        assert report["AGV"]['category'] == "port_operations"
+        assert rotation.report("patents", KEYWORDS)[0]['last_searched'] is None
+
+    @patch('scrapers.utils.keyword_rotation.get_shared_redis_client')
+    def test_state_in_redis(self, mock_redis, rotation):
+        client = mock_redis.return_value
+        client.hgetall.return_value = {"IoT": str(rotation._clock.now), "RFID": str(rotation._clock.now)}
+
+        assert rotation.next_batch("patents", KEYWORDS) == ["Blockchain", "smart port"]
+        rotation.mark_searched("patents", ["Blockchain"])
+        client.pipeline.return_value.hset.assert_called_once_with(
+            "scraper:keyword_rotation:patents", mapping={"Blockchain": rotation._clock.now})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
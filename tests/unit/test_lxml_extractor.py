@@ -0,0 +1,67 @@
+"""
+Tests for scrapers/utils/lxml_extractor.py
+Outputs must match the BeautifulSoup (html.parser) path
+"""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.lxml_extractor import LxmlExtractor
+from scrapers.utils.soup_helper import SoupHelper
+
+PAGES = [
+    b"<html><head><style>p{}</style></head><body><nav>Menu</nav><article><h1>Title</h1>"
+    b"<p>First <b>bold</b> text &amp; more.</p><script>track()</script><p>Second</p></article></body></html>",
+    b"<html><body><main><p>Main content</p><!-- comment --><aside>Aside</aside></main></body></html>",
+    b"<html><body><p>One <i>two</i></p><div><p>Three</p></div></body></html>",
+    "<html><body><p>Café – 港口</p></body></html>".encode('utf-8'),
+]
+
+
+class TestLxmlExtractor:
+    """Tests for LxmlExtractor"""
+
+    @pytest.mark.parametrize("page", PAGES)
+    def test_page_text_matches_bs4(self, page):
+        assert LxmlExtractor.extract_page_text(page) == SoupHelper.extract_page_text(page, 'html.parser')
+
+    @pytest.mark.parametrize("page", PAGES)
+    def test_article_content_matches_bs4(self, page):
+        tree = LxmlExtractor.create_soup(page)
+        soup = SoupHelper.create_soup(page, 'html.parser')
+
+        assert LxmlExtractor.find_article_content(tree) == SoupHelper.find_article_content(soup)
+
+    def test_scripts_stripped_on_parse(self):
+        tree = LxmlExtractor.create_soup(PAGES[0])
+
+        assert "track()" not in LxmlExtractor.extract_page_text(PAGES[0])
+        assert not tree.xpath('//script')
+
+    def test_content_div_and_ads(self):
+        page = (b"<html><body><div class='Post-Content x'><p>Body text</p></div>"
+                b"<div id='top-ad'>Ad</div></body></html>")
+        tree = LxmlExtractor.remove_ads_and_widgets(LxmlExtractor.create_soup(page))
+
+        assert LxmlExtractor.find_article_content(tree) == "Body text"
+        assert not tree.xpath("//div[@id='top-ad']")
+
+    def test_metadata(self):
+        page = (b"<html><head><title>Smart ports | News</title>"
+                b"<meta name='description' content='Desc'><meta property='author' content='Jane'>"
+                b"</head><body></body></html>")
+        tree = LxmlExtractor.create_soup(page)
+
+        assert LxmlExtractor.find_title(tree) == "Smart ports"
+        assert LxmlExtractor.find_meta_content(tree, 'description') == "Desc"
+        assert LxmlExtractor.find_author(tree) == "Jane"
+
+    def test_empty_document(self):
+        assert LxmlExtractor.create_soup(b"") is None
+        assert LxmlExtractor.extract_page_text(b"") == ""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
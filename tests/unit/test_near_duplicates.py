@@ -0,0 +1,143 @@
+"""
+Tests for scrapers/utils/near_duplicates.py and graph/nodes/near_duplicate_node.py
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.near_duplicates import NearDuplicateIndex, MinHashLSH, minhash, similarity
+from graph.nodes.near_duplicate_node import near_duplicate_node
+from graph.nodes.handoff_node import handoff_node
+from tests.unit.test_dedup_index import FakeClock, FakeRedis
+
+WORDS = ("port terminal crane container vessel berth automation digital twin yard gate "
+         "quay logistics shipping carrier emissions hydrogen shore power tug pilot draft "
+         "cargo throughput sensor network robotics lashing reefer customs rail barge").split()
+
+
+def article(seed, length=150):
+    rng = random.Random(seed)
+    return ' '.join(rng.choice(WORDS) for _ in range(length))
+
+
+def edited(text, edits=2):
+    """A republished copy: a couple of words changed"""
+    words = text.split()
+    for i in range(edits):
+        words[10 + i * 40] = "Rotterdam"
+    return ' '.join(words)
+
+
+def doc(url, text, source="Port Technology"):
+    return {'url': url, 'source': source, 'title': "Title", 'text': text, 'published_date': "2026-03-10"}
+
+
+def make_index(clock=None, **config):
+    return NearDuplicateIndex(config={'ttl_days': 1, 'refresh_seconds': 60, **config}, clock=clock or FakeClock())
+
+
+class TestMinHash:
+    """Tests for minhash and MinHashLSH"""
+
+    def test_similarity_estimates(self):
+        text = article(1)
+
+        assert minhash(text) == minhash(text.upper() + "!")
+        assert similarity(minhash(text), minhash(edited(text))) >= 0.8
+        assert similarity(minhash(text), minhash(article(2))) < 0.2
+
+    def test_short_texts_get_no_signature(self):
+        assert minhash(article(1, length=39)) is None
+        assert len(minhash(article(1, length=40))) == 256
+        assert minhash(None) is None
+
+    def test_lsh_returns_only_similar_items(self):
+        index = MinHashLSH(min_similarity=0.7)
+        text = article(1)
+        index.add(minhash(text), 'original')
+        for seed in range(2, 200):
+            index.add(minhash(article(seed)), seed)
+
+        matches = index.query(minhash(edited(text)))
+
+        assert [item for item, _ in matches] == ['original']
+        assert len(index) == 199
+
+
+class TestNearDuplicateIndex:
+    """Tests for NearDuplicateIndex"""
+
+    @patch('scrapers.utils.near_duplicates.get_shared_redis_client', return_value=None)
+    def test_collapses_batch_copies_into_longest(self, mock_redis):
+        text = article(1)
+        docs = [
+            doc("https://porttechnology.org/a", text),
+            doc("https://other.example/x", article(2)),
+            doc("https://maritime-executive.com/b", edited(text) + " Read more.", source="Maritime Executive"),
+            doc("https://supplychaindive.com/c", edited(text, edits=1), source="Supply Chain Dive"),
+        ]
+
+        kept = make_index().collapse(docs)
+
+        assert [d['url'] for d in kept] == ["https://maritime-executive.com/b", "https://other.example/x"]
+        assert kept[0]['alternate_urls'] == ["https://porttechnology.org/a", "https://supplychaindive.com/c"]
+        assert 'alternate_urls' not in kept[1]
+
+    @patch('scrapers.utils.near_duplicates.get_shared_redis_client', return_value=None)
+    def test_short_texts_are_kept(self, mock_redis):
+        docs = [doc("https://example.com/a", "Short note."), doc("https://example.com/b", "Short note.")]
+
+        assert make_index().collapse(docs) == docs
+
+    @patch('scrapers.utils.near_duplicates.get_shared_redis_client')
+    def test_copies_of_published_documents_are_dropped(self, mock_redis):
+        client = FakeRedis()
+        mock_redis.return_value = client
+        clock = FakeClock()
+        text = article(1)
+        # Published by an earlier run
+        assert make_index(clock=clock).add([doc("https://porttechnology.org/a", text)])
+        index = make_index(clock=clock)
+
+        kept = index.collapse([
+            doc("https://porttechnology.org/a", text),  # Republish retry, not a copy
+            doc("https://maritime-executive.com/b", edited(text)),
+        ])
+        assert [d['url'] for d in kept] == ["https://porttechnology.org/a"]
+
+        clock.now += 86400 + 61  # Past the TTL and the refresh interval
+        assert len(index.collapse([doc("https://maritime-executive.com/b", edited(text))])) == 1
+        assert client.zset == {}
+
+
+class TestNearDuplicateNode:
+    """near_duplicate_node replaces valid_documents with the representatives"""
+
+    @patch('graph.nodes.near_duplicate_node.near_duplicate_index')
+    def test_replaces_valid_documents(self, mock_index):
+        mock_index.collapse.return_value = ["kept"]
+
+        result = near_duplicate_node({"valid_documents": ["kept", "copy"]})
+
+        assert result == {"valid_documents": ["kept"]}
+
+    @patch('graph.nodes.handoff_node.save_source_last_run_times', MagicMock(return_value=True))
+    @patch('graph.nodes.handoff_node.publish_batch', return_value=True)
+    @patch('graph.nodes.handoff_node.dedup_index')
+    @patch('graph.nodes.handoff_node.near_duplicate_index')
+    def test_handoff_records_representatives_and_alternates(self, mock_near, mock_dedup, mock_publish):
+        signal = {**doc("https://example.com/a", article(1)), 'alternate_urls': ["https://example.com/b"]}
+        mock_dedup.filter_new.side_effect = lambda signals, stage: signals
+
+        handoff_node({"signals": [signal]})
+
+        assert list(mock_dedup.add.call_args.args[0]) == ["https://example.com/a", "https://example.com/b"]
+        mock_near.add.assert_called_once_with([signal])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
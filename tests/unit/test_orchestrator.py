@@ -9,70 +9,142 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from graph.nodes.orchestrator_node import orchestrator_node
-from graph.state import GraphState
+from graph.nodes.orchestrator_node import orchestrator_node, get_due_sources
+from graph.nodes.handoff_node import handoff_node
+from graph.state import GraphState, SCRAPER_SOURCES
 
+INTERVALS = {'default': 300, 'rss': 60, 'tech_news': 60, 'academic': 720}
 
+
+@pytest.fixture
+def intervals():
+    with patch('graph.nodes.orchestrator_node.get_source_interval_config', return_value=INTERVALS):
+        yield
+
+
+def ago(**kwargs):
+    return datetime.utcnow() - timedelta(**kwargs)
+
+
+@pytest.mark.usefixtures("intervals")
 class TestOrchestratorNode:
     """Tests for orchestrator_node function"""
-    
+
+    @patch('graph.nodes.orchestrator_node.get_source_last_run_times', return_value={})
     @patch('graph.nodes.orchestrator_node.get_last_scrape_time')
-    def test_proceed_when_no_last_scrape(self, mock_get_last_scrape):
-        """Should proceed if never scraped before"""
+    def test_proceed_when_no_last_scrape(self, mock_get_last_scrape, mock_last_runs):
+        """Should proceed with every source if never scraped before"""
         mock_get_last_scrape.return_value = None
-        
+
         state = GraphState(
             sources=["https://example.com/feed"],
             keywords=["IoT", "smart port"]
         )
-        
+
         result = orchestrator_node(state)
-        
+
         assert result["action"] == "proceed"
+        assert result["due_sources"] == list(SCRAPER_SOURCES)
         assert result["sources"] == ["https://example.com/feed"]
         assert result["keywords"] == ["IoT", "smart port"]
-    
-    @patch('graph.nodes.orchestrator_node.get_last_scrape_time')
-    @patch('graph.nodes.orchestrator_node.SCRAPE_INTERVAL_MINUTES', 300)
-    def test_skip_when_recently_scraped(self, mock_get_last_scrape):
-        """Should skip if scraped within interval"""
-        # Last scrape was 1 hour ago (within 5 hour interval)
-        mock_get_last_scrape.return_value = datetime.utcnow() - timedelta(hours=1)
-        
+
+    @patch('graph.nodes.orchestrator_node.get_source_last_run_times')
+    @patch('graph.nodes.orchestrator_node.get_last_scrape_time', return_value=None)
+    def test_skip_when_no_source_due(self, mock_get_last_scrape, mock_last_runs):
+        """Should skip if every source ran within its interval"""
+        mock_last_runs.return_value = {source: ago(minutes=30) for source in SCRAPER_SOURCES}
+
         state = GraphState(
             sources=["https://example.com/feed"],
             keywords=["IoT"]
         )
-        
+
         result = orchestrator_node(state)
-        
+
         assert result["action"] == "skip"
-    
+
+    @patch('graph.nodes.orchestrator_node.get_source_last_run_times')
+    @patch('graph.nodes.orchestrator_node.get_last_scrape_time', return_value=None)
+    def test_emits_only_due_sources(self, mock_get_last_scrape, mock_last_runs):
+        """Fast feeds are due hourly while patents and arXiv wait for their own intervals"""
+        mock_last_runs.return_value = {
+            "patents": ago(hours=2),
+            "rss": ago(hours=2),
+            "tech_news": ago(minutes=20),
+            "academic": ago(hours=13),
+        }
+
+        result = orchestrator_node(GraphState())
+
+        assert result["action"] == "proceed"
+        assert result["due_sources"] == ["rss", "academic"]
+
+    @patch('graph.nodes.orchestrator_node.get_source_last_run_times', return_value={})
+    @patch('graph.nodes.orchestrator_node.get_last_scrape_time')
+    def test_no_source_runs_fall_back_to_global_time(self, mock_get_last_scrape, mock_last_runs):
+        """Right after the switch from the global schedule, the global time stands in"""
+        mock_get_last_scrape.return_value = ago(hours=1, minutes=1)
+
+        result = orchestrator_node(GraphState())
+
+        # patents (5h) and academic (12h) are not due yet, rss and tech_news (1h) are
+        assert result["due_sources"] == ["rss", "tech_news"]
+
+    @patch('graph.nodes.orchestrator_node.get_source_last_run_times')
+    @patch('graph.nodes.orchestrator_node.get_last_scrape_time')
+    def test_source_without_run_is_due(self, mock_get_last_scrape, mock_last_runs):
+        """Once sources have runs of their own, a source without one never waits on the global time"""
+        mock_get_last_scrape.return_value = ago(minutes=10)
+        mock_last_runs.return_value = {"patents": ago(minutes=10), "rss": ago(minutes=10),
+                                       "academic": ago(minutes=10)}
+
+        assert orchestrator_node(GraphState())["due_sources"] == ["tech_news"]
+
+    @patch('graph.nodes.handoff_node.publish_batch', return_value=True)
+    @patch('graph.nodes.handoff_node.dedup_index', MagicMock(filter_new=MagicMock(return_value=[])))
+    @patch('graph.nodes.handoff_node.near_duplicate_index', MagicMock())
+    @patch('graph.nodes.orchestrator_node.get_last_scrape_time', return_value=None)
+    def test_source_missing_deadline_is_due_next_hourly_run(self, mock_get_last_scrape, mock_publish):
+        """A source dropped at the deadline is not recorded as run, so the next hourly run retries it"""
+        last_runs = {}
+
+        def save(sources, timestamp):
+            last_runs.update({source: timestamp for source in sources})
+            return True
+
+        with patch('graph.nodes.handoff_node.save_source_last_run_times', side_effect=save), \
+                patch('graph.nodes.orchestrator_node.get_source_last_run_times', side_effect=lambda: dict(last_runs)):
+            first = get_due_sources(datetime.utcnow())
+            # tech_news missed the scraping deadline
+            handoff_node({"signals": [], "due_sources": first, "completed_sources": ["patents", "rss", "academic"]})
+
+            due = get_due_sources(datetime.utcnow() + timedelta(hours=1, minutes=1))
+
+        assert first == list(SCRAPER_SOURCES)
+        assert due == ["rss", "tech_news"]
+
+    @patch('graph.nodes.orchestrator_node.get_source_interval_config', return_value={})
+    @patch('graph.nodes.orchestrator_node.get_source_last_run_times', return_value={})
     @patch('graph.nodes.orchestrator_node.get_last_scrape_time')
     @patch('graph.nodes.orchestrator_node.SCRAPE_INTERVAL_MINUTES', 300)
-    def test_proceed_when_interval_passed(self, mock_get_last_scrape):
-        """Should proceed if interval has passed"""
-        # Last scrape was 6 hours ago (beyond 5 hour interval)
-        mock_get_last_scrape.return_value = datetime.utcnow() - timedelta(hours=6)
-        
-        state = GraphState(
-            sources=["https://example.com/feed"],
-            keywords=["IoT"]
-        )
-        
-        result = orchestrator_node(state)
-        
-        assert result["action"] == "proceed"
-    
+    def test_default_interval_from_settings(self, mock_get_last_scrape, mock_last_runs, mock_intervals):
+        """Without configured intervals every source uses SCRAPE_INTERVAL_MINUTES"""
+        mock_get_last_scrape.return_value = ago(hours=1)
+        assert orchestrator_node(GraphState())["action"] == "skip"
+
+        mock_get_last_scrape.return_value = ago(hours=6)
+        assert orchestrator_node(GraphState())["due_sources"] == list(SCRAPER_SOURCES)
+
+    @patch('graph.nodes.orchestrator_node.get_source_last_run_times', return_value={})
     @patch('graph.nodes.orchestrator_node.get_last_scrape_time')
-    def test_uses_default_empty_lists(self, mock_get_last_scrape):
+    def test_uses_default_empty_lists(self, mock_get_last_scrape, mock_last_runs):
         """Should use empty lists for sources/keywords if not in state"""
         mock_get_last_scrape.return_value = None
-        
+
         state = GraphState()  # Empty state
-        
+
         result = orchestrator_node(state)
-        
+
         assert result["action"] == "proceed"
         assert result["sources"] == []
         assert result["keywords"] == []
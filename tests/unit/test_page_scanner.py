@@ -0,0 +1,77 @@
+"""
+Tests for scrapers/utils/page_scanner.py
+Both backends must produce the same result
+"""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.page_scanner import scan_page
+from scrapers.utils.lxml_extractor import LxmlExtractor
+from scrapers.utils.soup_helper import SoupHelper
+
+PAGES = [
+    b"<html><head><title>Smart ports - News</title><meta name='description' content='Desc'>"
+    b"<meta property='author' content='Jane'></head><body><nav>Menu</nav><article><h1>Title</h1>"
+    b"<p>First <b>bold</b> text &amp; more.</p><script>track()</script><p>Second</p></article></body></html>",
+    b"<html><body><main><p>Main content</p><!-- comment --><aside>Aside</aside>"
+    b"<div class='widget'>Widget</div></main></body></html>",
+    b"<html><body><p>One <i>two</i></p><div id='ad-top'><p>Buy now</p></div></body></html>",
+    "<html><body><h1>Café</h1><span class='Author'>Ana – 港口</span></body></html>".encode('utf-8'),
+]
+
+
+def scan(page, backend):
+    if backend == 'lxml':
+        return scan_page(LxmlExtractor.create_soup(page))
+    return scan_page(SoupHelper.create_soup(page, 'html.parser'))
+
+
+class TestScanPage:
+    """Tests for scan_page"""
+
+    @pytest.mark.parametrize("page", PAGES)
+    def test_backends_match(self, page):
+        assert scan(page, 'lxml') == scan(page, 'bs4')
+
+    @pytest.mark.parametrize("backend", ['lxml', 'bs4'])
+    def test_metadata(self, backend):
+        result = scan(PAGES[0], backend)
+
+        assert result['title'] == "Smart ports"
+        assert result['description'] == "Desc"
+        assert result['author'] == "Jane"
+        assert result['content'] == "Title\n\nFirst\n\nbold\n\ntext & more.\n\nSecond"
+
+    @pytest.mark.parametrize("backend", ['lxml', 'bs4'])
+    def test_boilerplate_and_ads_skipped(self, backend):
+        assert scan(PAGES[1], backend)['content'] == "Main content"
+        # Paragraph fallback leaves out the ad container
+        assert scan(PAGES[2], backend)['content'] == "Onetwo"
+
+    @pytest.mark.parametrize("backend", ['lxml', 'bs4'])
+    def test_densest_block_wins(self, backend):
+        links = "".join(f"<a href='/{i}'>Related story {i}</a>" for i in range(20))
+        page = (f"<html><body><article>{links}</article>"
+                f"<div class='entry-content'><p>{'Ports automate cranes. ' * 10}</p>"
+                f"<a href='/more'>More</a></div></body></html>").encode('utf-8')
+
+        assert scan(page, backend)['content'].startswith("Ports automate cranes.")
+
+    @pytest.mark.parametrize("backend", ['lxml', 'bs4'])
+    def test_title_and_author_fallbacks(self, backend):
+        result = scan(PAGES[3], backend)
+
+        assert result['title'] == "Café"
+        assert result['author'] == "Ana – 港口"
+        assert result['description'] is None
+        assert result['content'] is None
+
+    def test_unparsed_page(self):
+        assert scan_page(None) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,70 @@
+"""
+Tests for scrapers/utils/parse_pool.py
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+import os
+import pickle
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.parse_pool import ParsePool
+from utils.deadline import Deadline, DeadlineExceeded
+from scrapers.tools.patent_scraper import PatentScraperTool
+from scrapers.tools.lens_scraper import LensScraperTool
+from scrapers.tools.academic_scraper import AcademicScraperTool
+
+
+class TestParsePool:
+    """Tests for ParsePool"""
+
+    def test_zero_workers_runs_inline(self):
+        pool = ParsePool(workers=0)
+
+        assert pool.run(os.getpid) == os.getpid()
+        assert pool._executor is None
+
+    def test_runs_in_worker_process(self):
+        pool = ParsePool(workers=1)
+        try:
+            assert pool.run(os.getpid) != os.getpid()
+            # Exceptions raised by the task reach the caller
+            with pytest.raises(ValueError):
+                pool.run(int, "not a number")
+        finally:
+            pool.shutdown()
+
+    def test_stops_waiting_at_deadline(self):
+        """A stuck parse does not hold the scraper past its deadline"""
+        pool = ParsePool(workers=1)
+        try:
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceeded):
+                pool.run(time.sleep, 3, deadline=Deadline.after(0.5))
+            assert time.monotonic() - started < 2
+        finally:
+            pool.shutdown()
+
+    def test_falls_back_inline_when_processes_cannot_start(self):
+        pool = ParsePool(workers=2)
+        executor = MagicMock()
+        executor.submit.side_effect = AssertionError("daemonic processes are not allowed to have children")
+
+        with patch('scrapers.utils.parse_pool.ProcessPoolExecutor', return_value=executor):
+            assert pool.run(os.getpid) == os.getpid()
+            assert pool.run(os.getpid) == os.getpid()
+
+        executor.submit.assert_called_once()
+        assert pool._executor is None
+
+    def test_scraper_parse_tasks_are_picklable(self):
+        """Scraper parse entry points must not drag the scraper (HTTP clients) along"""
+        for task in (PatentScraperTool._parse_search_page, LensScraperTool._parse_results,
+                     AcademicScraperTool._parse_response):
+            assert pickle.loads(pickle.dumps(task)) == task
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -139,6 +139,28 @@ class TestQualityFilterNode:
         titles = [doc["title"] for doc in result["valid_documents"]]
         assert "Valid Document" in titles
         assert "Another Valid Document" in titles
+    
+    def test_filters_out_same_document_under_other_url(self):
+        """Tracking parameters, www. and arXiv versions do not make a new document"""
+        doc = {
+            "source": "Test Source",
+            "title": "Valid Article Title",
+            "text": "This is a valid article text that is long enough to pass the quality filter validation.",
+            "published_date": "2026-02-06"
+        }
+        state = GraphState(
+            raw_documents=[
+                {**doc, "url": "https://example.com/article1"},
+                {**doc, "url": "http://www.example.com/article1/?utm_source=rss"},
+                {**doc, "url": "http://arxiv.org/abs/2401.01234v1"},
+                {**doc, "url": "https://arxiv.org/abs/2401.01234v2"}
+            ]
+        )
+        
+        result = quality_filter_node(state)
+        
+        urls = [d["url"] for d in result["valid_documents"]]
+        assert urls == ["https://example.com/article1", "http://arxiv.org/abs/2401.01234v1"]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,77 @@
+"""
+Tests for scrapers/utils/rate_limiter.py
+"""
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.rate_limiter import TokenBucketRateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@patch('scrapers.utils.rate_limiter.get_shared_redis_client', return_value=None)
+class TestTokenBucketRateLimiter:
+    """Tests for the in-process fallback of TokenBucketRateLimiter"""
+
+    def test_idle_host_does_not_wait(self, mock_redis):
+        """The first request to an idle host should go out immediately"""
+        limiter = TokenBucketRateLimiter(clock=FakeClock())
+
+        assert limiter.reserve("example.com", rate=1.0) == 0.0
+
+    def test_back_to_back_requests_queue(self, mock_redis):
+        """Concurrent reservations should get increasing waits"""
+        limiter = TokenBucketRateLimiter(clock=FakeClock())
+
+        waits = [limiter.reserve("example.com", rate=0.5) for _ in range(3)]
+
+        assert waits == [0.0, 2.0, 4.0]
+
+    def test_bucket_refills_over_time(self, mock_redis):
+        """After rate_limit_delay seconds the host is free again"""
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(clock=clock)
+
+        limiter.reserve("example.com", rate=1.0)
+        clock.now += 1.0
+
+        assert limiter.reserve("example.com", rate=1.0) == 0.0
+
+    def test_hosts_have_separate_buckets(self, mock_redis):
+        """Different hosts should not share tokens"""
+        limiter = TokenBucketRateLimiter(clock=FakeClock())
+
+        limiter.reserve("a.example.com", rate=1.0)
+
+        assert limiter.reserve("b.example.com", rate=1.0) == 0.0
+
+    def test_burst_capacity(self, mock_redis):
+        """capacity allows that many requests without waiting"""
+        limiter = TokenBucketRateLimiter(capacity=3, clock=FakeClock())
+
+        waits = [limiter.reserve("example.com", rate=1.0) for _ in range(4)]
+
+        assert waits == [0.0, 0.0, 0.0, 1.0]
+
+    def test_wait_past_max_wait_takes_no_token(self, mock_redis):
+        """A caller that cannot wait long enough leaves the bucket as it was"""
+        limiter = TokenBucketRateLimiter(clock=FakeClock())
+
+        limiter.reserve("example.com", rate=0.5)
+        assert limiter.reserve("example.com", rate=0.5, max_wait=1.0) == 2.0
+
+        assert limiter.reserve("example.com", rate=0.5) == 2.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,77 @@
+"""
+Tests for scrapers/utils/response_cache.py
+"""
+import pytest
+from unittest.mock import patch
+import os
+import time
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.response_cache import ResponseCache
+
+URL = "https://www.porttechnology.org/news/ai-crane-rotterdam"
+BODY = b"<html><body><article>" + b"<p>Automated cranes.</p>" * 200 + b"</article></body></html>"
+
+
+class TestResponseCache:
+    """Tests for ResponseCache"""
+
+    def test_roundtrip(self, tmp_path):
+        """A stored body comes back identical and counts as a hit"""
+        cache = ResponseCache(cache_dir=str(tmp_path), max_bytes=10 ** 6, default_ttl=3600)
+
+        cache.put(URL, BODY, {'Content-Type': 'text/html', 'Set-Cookie': 'x=1'})
+
+        assert cache.get(URL) == BODY
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['bytes_saved'] == len(BODY)
+
+    def test_miss_for_unknown_url(self, tmp_path):
+        cache = ResponseCache(cache_dir=str(tmp_path), max_bytes=10 ** 6, default_ttl=3600)
+
+        assert cache.get(URL) is None
+        assert cache.stats()['misses'] == 1
+
+    def test_fragment_does_not_change_key(self, tmp_path):
+        cache = ResponseCache(cache_dir=str(tmp_path), max_bytes=10 ** 6, default_ttl=3600)
+
+        cache.put(URL, BODY)
+
+        assert cache.get(URL + "#comments") == BODY
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = ResponseCache(cache_dir=str(tmp_path), max_bytes=10 ** 6, default_ttl=3600)
+        cache.put(URL, BODY, ttl=60)
+
+        with patch('scrapers.utils.response_cache.time.time', return_value=time.time() + 120):
+            assert cache.get(URL) is None
+
+    def test_body_is_stored_compressed(self, tmp_path):
+        cache = ResponseCache(cache_dir=str(tmp_path), max_bytes=10 ** 6, default_ttl=3600)
+
+        cache.put(URL, BODY)
+
+        stored = sum(os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(tmp_path) for f in files)
+        assert stored < len(BODY) / 4
+
+    def test_lru_eviction(self, tmp_path):
+        """Least recently used entries are evicted once over the size cap"""
+        cache = ResponseCache(cache_dir=str(tmp_path), max_bytes=3000, default_ttl=3600)
+        urls = [f"{URL}-{i}" for i in range(3)]
+        bodies = [os.urandom(1000) for _ in urls]  # Incompressible
+
+        cache.put(urls[0], bodies[0])
+        cache.put(urls[1], bodies[1])
+        cache.get(urls[0])  # urls[1] is now least recently used
+        cache.put(urls[2], bodies[2])
+
+        assert cache.stats()['evictions'] == 1
+        assert cache.get(urls[1]) is None
+        assert cache.get(urls[0]) == bodies[0]
+        assert cache.get(urls[2]) == bodies[2]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,148 @@
+"""
+Tests for scrapers/tools/rss_scraper.py
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.tools.rss_scraper import RSSScraperTool
+from scrapers.utils.high_water_mark import HighWaterMark
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+FEED_URL = "https://www.porttechnology.org/feed/"
+
+
+def load_fixture_feed() -> bytes:
+    with open(os.path.join(FIXTURES_DIR, "sample_rss_feed.xml"), "rb") as f:
+        return f.read()
+
+
+def make_scraper() -> RSSScraperTool:
+    scraper = RSSScraperTool()
+    scraper.rate_limit_delay = 0
+    scraper.http_client = MagicMock()
+    scraper.feed_validators = MagicMock()
+    scraper.feed_validators.request_headers.return_value = {}
+    scraper._fetch_full_text = MagicMock(return_value="")
+    scraper.high_water_marks = MagicMock()
+    scraper.high_water_marks.load.return_value = HighWaterMark()
+    scraper.dedup_index = MagicMock()
+    scraper.dedup_index.filter_new.side_effect = lambda documents, stage: documents
+    scraper.feed_stats = MagicMock()
+    scraper.feed_stats.due.side_effect = lambda urls: list(urls)
+    return scraper
+
+
+class TestRSSScraperTool:
+    """Tests for RSSScraperTool"""
+
+    def test_parses_fixture_feed(self):
+        """Should extract every entry of the fixture feed"""
+        scraper = make_scraper()
+        response = MagicMock(status_code=200, content=load_fixture_feed(), headers={'ETag': '"v1"'})
+        scraper.http_client.get.return_value = response
+
+        docs = scraper.scrape(feed_urls=[FEED_URL], days_back=3650)
+
+        assert len(docs) == 3
+        assert docs[0]['source'] == "Port Technology International"
+        assert scraper.pending_validators == [{'url': FEED_URL, 'validators': {'etag': '"v1"'}}]
+
+    def test_skips_entries_seen_in_earlier_runs(self):
+        """Seen entries never reach extraction or full-text fetching; new ones are queued as delivered"""
+        scraper = make_scraper()
+        scraper.http_client.get.return_value = MagicMock(status_code=200, content=load_fixture_feed(), headers={})
+        first = scraper.scrape(feed_urls=[FEED_URL], days_back=3650)
+        mark = scraper.pending_marks[-1]
+        assert mark['source'] == FEED_URL and len(mark['entry_ids']) == 3
+
+        scraper.high_water_marks.load.return_value = HighWaterMark(newest=mark['newest'],
+                                                                   seen=frozenset(mark['entry_ids'][1:]))
+        scraper._fetch_full_text.reset_mock()
+        docs = scraper.scrape(feed_urls=[FEED_URL], days_back=3650)
+
+        assert [doc['url'] for doc in docs] == [first[0]['url']]
+        assert scraper.pending_marks[-1]['entry_ids'] == mark['entry_ids'][:1]
+        assert scraper._fetch_full_text.call_count <= 1
+        scraper.high_water_marks.advance.assert_not_called()  # Left to the handoff
+
+    @patch('scrapers.tools.rss_scraper.parse_feed_text')
+    def test_not_modified_skips_parse(self, mock_parse):
+        """A 304 response should yield no entries and never reach the parser"""
+        scraper = make_scraper()
+        scraper.feed_validators.request_headers.return_value = {'If-None-Match': '"v1"'}
+        scraper.http_client.get.return_value = MagicMock(status_code=304, content=b"")
+
+        docs = scraper.scrape(feed_urls=[FEED_URL], days_back=7)
+
+        assert docs == []
+        mock_parse.assert_not_called()
+        assert scraper.pending_validators == []
+        _, kwargs = scraper.http_client.get.call_args
+        assert kwargs['headers'] == {'If-None-Match': '"v1"'}
+        assert [(poll['url'], poll['published']) for poll in scraper.pending_polls] == [(FEED_URL, [])]
+
+    def test_polls_only_due_feeds_and_records_entry_dates(self):
+        """Feeds not due are never fetched; polled feeds report their entries' dates"""
+        scraper = make_scraper()
+        scraper.feed_stats.due.side_effect = lambda urls: [FEED_URL]
+        scraper.http_client.get.return_value = MagicMock(status_code=200, content=load_fixture_feed(), headers={})
+
+        scraper.scrape(feed_urls=["https://quiet.example.com/feed", FEED_URL], days_back=3650)
+
+        assert [call.args[0] for call in scraper.http_client.get.call_args_list] == [FEED_URL]
+        [poll] = scraper.pending_polls
+        assert poll['url'] == FEED_URL and len(poll['published']) == 3 and all(poll['published'])
+        scraper.feed_stats.record_poll.assert_not_called()  # Left to the handoff
+
+    def test_short_snippets_fetched_concurrently_in_order(self):
+        """Full-text fetches overlap and each text lands on its own article"""
+        scraper = make_scraper()
+        barrier = threading.Barrier(3, timeout=5)  # Only passes if 3 fetches are in flight together
+
+        def fetch(url):
+            barrier.wait()
+            return f"Full text of {url} " * 20 if url != "https://b.example/2" else ""
+
+        scraper._fetch_full_text = MagicMock(side_effect=fetch)
+        articles = [
+            {'url': "https://a.example/1", 'title': "First story", 'text': "Short"},
+            {'url': "https://b.example/2", 'title': "Second story", 'text': ""},
+            {'url': "https://a.example/3", 'title': "Third story", 'text': "Short"},
+            {'url': "https://a.example/4", 'title': "Fourth story", 'text': "Long " * 100},
+        ]
+
+        scraper._enrich_full_text(articles)
+
+        assert articles[0]['text'].startswith("Full text of https://a.example/1")
+        assert articles[1]['text'] == ""  # Failed fetch keeps the snippet
+        assert articles[2]['text'].startswith("Full text of https://a.example/3")
+        assert articles[3]['text'] == ("Long " * 100)[:5000]
+        assert scraper._fetch_full_text.call_count == 3
+
+    def test_low_relevance_entries_are_not_fetched(self):
+        """Entries matching no keyword keep their snippet; matched keywords are attached"""
+        scraper = make_scraper()
+        scraper._relevance_keywords = ("smart port", "IoT", "hydrogen shipping")
+        feed = (b"<rss><channel><title>Maritime News</title>"
+                b"<item><title>Smart Port goes live</title><link>https://example.com/1</link>"
+                b"<description>IoT sensors now cover every berth of the container terminal.</description>"
+                b"<guid>1</guid></item>"
+                b"<item><title>Quarterly results</title><link>https://example.com/2</link>"
+                b"<description>Revenue was flat compared with the same quarter last year.</description>"
+                b"<guid>2</guid></item>"
+                b"</channel></rss>")
+        scraper.http_client.get.return_value = MagicMock(status_code=200, content=feed, headers={})
+
+        docs = scraper.scrape(feed_urls=[FEED_URL], days_back=3650)
+
+        assert [doc['matched_keywords'] for doc in docs] == [["smart port", "IoT"], []]
+        scraper._fetch_full_text.assert_called_once_with("https://example.com/1")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
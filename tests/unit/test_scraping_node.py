@@ -0,0 +1,164 @@
+"""
+Tests for graph/nodes/scraping_node.py deadline handling, source and keyword selection
+"""
+import pytest
+import time
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from graph.nodes import scraping_node as node_module
+from utils.deadline import Deadline
+from config.loader import get_tech_news_config
+
+
+def make_scraper(docs, delay=0.0, marks=(), failed=False):
+    """Fake scraper class whose run() returns docs (and queues marks) after delay seconds"""
+    seen_deadlines = []
+    seen_kwargs = []
+
+    class FakeScraper:
+        def run(self, deadline=None, **kwargs):
+            seen_deadlines.append(deadline)
+            seen_kwargs.append(kwargs)
+            self.searched_keywords = list(kwargs.get('keywords', []))
+            time.sleep(delay)
+            self.pending_marks = list(marks)
+            self.pending_validators = []
+            self.pending_polls = []
+            self.failed = failed
+            return list(docs)
+
+    FakeScraper.seen_deadlines = seen_deadlines
+    FakeScraper.seen_kwargs = seen_kwargs
+    return FakeScraper
+
+
+def doc(source):
+    return {'url': f'https://example.com/{source}', 'source': source, 'title': 't',
+            'text': 'x', 'published_date': '2024-01-01'}
+
+
+@pytest.fixture
+def patched_node():
+    deadline_config = {'reserve_seconds': 0, 'scrapers': {'academic': 0.5}}
+    with patch.object(node_module, 'get_deadline_config', return_value=deadline_config), \
+            patch.object(node_module, 'get_scraping_config',
+                         return_value={'keywords': ['ai'], 'tech_news': {'topics': ['ai']}}), \
+            patch.object(node_module, 's3_client', MagicMock()), \
+            patch.object(node_module, 'circuit_breaker', MagicMock(end_run=MagicMock(return_value=[]))), \
+            patch.object(node_module, 'keyword_rotation', MagicMock(next_batch=MagicMock(return_value=['ai']))), \
+            patch.object(node_module.settings, 'ASYNC_SCRAPING', False):
+        yield
+
+
+class TestScrapingNodeDeadline:
+    """Tests for deadline handling in scraping_node"""
+
+    def test_slow_scraper_does_not_block_run(self, patched_node):
+        slow = make_scraper([doc('slow')], delay=3)
+        with patch.object(node_module, 'PatentScraperTool', make_scraper([doc('patent')])), \
+                patch.object(node_module, 'RSSScraperTool', make_scraper([doc('rss')])), \
+                patch.object(node_module, 'TechNewsScraperTool', slow), \
+                patch.object(node_module, 'AcademicScraperTool', make_scraper([doc('academic')])), \
+                patch.object(node_module, 'record_deadline_miss') as mock_miss:
+            start = time.time()
+            result = node_module.scraping_node({'deadline_at': time.time() + 1})
+            elapsed = time.time() - start
+
+        assert elapsed < 2
+        assert sorted(d['source'] for d in result['raw_documents']) == ['academic', 'patent', 'rss']
+        mock_miss.assert_called_once_with("Tech News")
+
+    def test_marks_kept_only_for_finished_scrapers(self, patched_node):
+        """A scraper abandoned at the deadline hands over no high-water marks"""
+        rss_mark = {'source': 'https://example.com/feed', 'entry_ids': ['1'], 'newest': None}
+        tech_mark = {'source': 'https://example.com/tech', 'entry_ids': ['2'], 'newest': None}
+        with patch.object(node_module, 'RSSScraperTool', make_scraper([doc('rss')], marks=[rss_mark])), \
+                patch.object(node_module, 'TechNewsScraperTool',
+                             make_scraper([doc('tech')], delay=3, marks=[tech_mark])), \
+                patch.object(node_module, 'record_deadline_miss'):
+            result = node_module.scraping_node({'deadline_at': time.time() + 1,
+                                                'due_sources': ['rss', 'tech_news']})
+
+        assert result['pending_marks'] == [rss_mark]
+        assert result['completed_sources'] == ['rss']
+
+    def test_failed_scrapers_are_not_completed(self, patched_node):
+        with patch.object(node_module, 'RSSScraperTool', make_scraper([], failed=True)), \
+                patch.object(node_module, 'AcademicScraperTool', make_scraper([])):
+            result = node_module.scraping_node({'deadline_at': time.time() + 60,
+                                                'due_sources': ['rss', 'academic']})
+
+        assert result['completed_sources'] == ['academic']
+
+    def test_scrapers_get_sub_deadlines(self, patched_node):
+        academic = make_scraper([])
+        rss = make_scraper([])
+        with patch.object(node_module, 'PatentScraperTool', make_scraper([doc('patent')])), \
+                patch.object(node_module, 'RSSScraperTool', rss), \
+                patch.object(node_module, 'TechNewsScraperTool', make_scraper([])), \
+                patch.object(node_module, 'AcademicScraperTool', academic):
+            run_deadline = time.time() + 60
+            node_module.scraping_node({'deadline_at': run_deadline})
+
+        assert isinstance(academic.seen_deadlines[0], Deadline)
+        assert academic.seen_deadlines[0].remaining() <= 0.5
+        assert rss.seen_deadlines[0].at < run_deadline
+
+    def test_runs_only_due_sources(self, patched_node):
+        patents = make_scraper([doc('patent')])
+        academic = make_scraper([doc('academic')])
+        with patch.object(node_module, 'PatentScraperTool', patents), \
+                patch.object(node_module, 'RSSScraperTool', make_scraper([doc('rss')])), \
+                patch.object(node_module, 'TechNewsScraperTool', make_scraper([doc('tech')])), \
+                patch.object(node_module, 'AcademicScraperTool', academic):
+            result = node_module.scraping_node({'deadline_at': time.time() + 60,
+                                                'due_sources': ['rss', 'tech_news']})
+
+        assert sorted(d['source'] for d in result['raw_documents']) == ['rss', 'tech']
+        assert patents.seen_deadlines == [] and academic.seen_deadlines == []
+
+    def test_patents_search_the_rotation_batch(self, patched_node):
+        rotation = node_module.keyword_rotation
+        rotation.next_batch.return_value = ['IoT', 'AGV']
+        with patch.object(node_module, 'PatentScraperTool', make_scraper([doc('patent')])):
+            node_module.scraping_node({'deadline_at': time.time() + 60, 'due_sources': ['patents'],
+                                       'keywords': ['IoT', 'AGV', 'RFID']})
+
+        rotation.next_batch.assert_called_once_with("patents", ['IoT', 'AGV', 'RFID'])
+        rotation.mark_searched.assert_called_once_with("patents", ['IoT', 'AGV'])
+
+    @pytest.mark.parametrize("failed, searched", [(False, True), (True, False)])
+    def test_tech_topics_marked_only_when_scrape_finished(self, patched_node, failed, searched):
+        rotation = node_module.keyword_rotation
+        rotation.next_batch.return_value = ['IoT']
+        with patch.object(node_module, 'get_scraping_config', return_value={'keywords': ['IoT']}), \
+                patch.object(node_module, 'TechNewsScraperTool', make_scraper([doc('tech')], failed=failed)):
+            node_module.scraping_node({'deadline_at': time.time() + 60, 'due_sources': ['tech_news']})
+
+        assert rotation.mark_searched.called is searched
+
+    def test_tech_news_without_search_topics_uses_rotation(self, patched_node):
+        """sources.yaml with no search_topics: the loader returns empty topics, filled by the rotation"""
+        rotation = node_module.keyword_rotation
+        rotation.next_batch.return_value = ['IoT', 'AGV']
+        with patch('config.loader.load_yaml', return_value={'tech_news': {'techcrunch': {'enabled': True}}}):
+            tech_config = get_tech_news_config()
+        tech = make_scraper([doc('tech')])
+        with patch.object(node_module, 'get_scraping_config',
+                          return_value={'keywords': ['IoT', 'AGV', 'RFID'], 'tech_news': tech_config}), \
+                patch.object(node_module, 'TechNewsScraperTool', tech):
+            node_module.scraping_node({'deadline_at': time.time() + 60, 'due_sources': ['tech_news']})
+
+        assert tech_config['topics'] == []
+        rotation.next_batch.assert_called_once_with("tech_news", ['IoT', 'AGV', 'RFID'])
+        assert tech.seen_kwargs[0]['topics'] == ['IoT', 'AGV']
+        assert tech.seen_kwargs[0]['sources'] == ['techcrunch']
+        rotation.mark_searched.assert_called_once_with("tech_news", ['IoT', 'AGV'])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,93 @@
+"""
+Tests for scrapers/utils/session_registry.py
+"""
+import pytest
+from unittest.mock import patch
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.session_registry import SessionRegistry
+from scrapers.utils import session_registry as registry_module
+
+POOL_CONFIG = {
+    'pool_connections': 5,
+    'pool_maxsize': 4,
+    'hosts': {'patents.google.com': 1}
+}
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = SessionRegistry()
+    # Counting pools report to the module singleton
+    monkeypatch.setattr(registry_module, 'session_registry', registry)
+    with patch('scrapers.utils.session_registry.get_connection_pool_config', return_value=POOL_CONFIG):
+        yield registry
+    registry.close_all()
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+class TestSessionRegistry:
+    """Tests for SessionRegistry"""
+
+    def test_same_thread_gets_same_session(self, registry):
+        assert registry.get_session() is registry.get_session()
+
+    def test_threads_share_adapters(self, registry):
+        """Each thread gets its own Session, backed by the same pools"""
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(registry.get_session()))
+        thread.start()
+        thread.join()
+
+        main_session = registry.get_session()
+        assert sessions[0] is not main_session
+        assert sessions[0].get_adapter("https://example.com") is main_session.get_adapter("https://example.com")
+
+    def test_per_host_pool_size(self, registry):
+        """Configured hosts get their own adapter with the overridden pool size"""
+        session = registry.get_session()
+
+        host_adapter = session.get_adapter("https://patents.google.com/?q=iot")
+        default_adapter = session.get_adapter("https://example.com/")
+
+        assert host_adapter is not default_adapter
+        assert host_adapter._pool_maxsize == 1
+        assert default_adapter._pool_maxsize == 4
+
+    def test_connections_reused_across_requests(self, registry, local_server):
+        """Keep-alive should avoid opening a new connection per request"""
+        session = registry.get_session()
+
+        for _ in range(3):
+            assert session.get(f"{local_server}/feed").status_code == 200
+
+        assert registry.new_connection_count('http') == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,75 @@
+"""
+Tests for scrapers/utils/single_flight.py
+"""
+import pytest
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight"""
+
+    def test_concurrent_calls_share_one_fetch(self):
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            time.sleep(0.2)
+            return "body"
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(flight.do, "https://example.com/a", fetch)
+            started.wait()
+            followers = [executor.submit(flight.do, "https://example.com/a", fetch) for _ in range(4)]
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert results == ["body"] * 5
+        assert len(calls) == 1
+        assert flight.stats()['duplicates_avoided'] == 4
+
+    def test_error_shared_with_waiters(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def fetch():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, "key", fetch)
+            started.wait()
+            follower = executor.submit(flight.do, "key", fetch)
+            for future in (leader, follower):
+                with pytest.raises(ValueError):
+                    future.result()
+
+    def test_sequential_calls_fetch_again(self):
+        flight = SingleFlight()
+        calls = []
+
+        for _ in range(2):
+            flight.do("key", lambda: calls.append(1))
+
+        assert len(calls) == 2
+        assert flight.stats()['duplicates_avoided'] == 0
+
+    def test_different_keys_not_coalesced(self):
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,100 @@
+"""
+Tests for scrapers/tools/tech_news_scraper.py
+"""
+import pytest
+import asyncio
+from unittest.mock import MagicMock
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.tools.tech_news_scraper import TechNewsScraperTool
+from scrapers.utils.high_water_mark import HighWaterMark
+from utils.deadline import Deadline
+
+TECHCRUNCH = TechNewsScraperTool.TECH_FEEDS['techcrunch']
+FEED = (b"<rss><channel><title>TechCrunch</title>"
+        b"<item><title>Smart port goes live</title><link>https://techcrunch.com/1</link>"
+        b"<description>IoT sensors now cover every berth of the container terminal.</description>"
+        b"<pubDate>Mon, 02 Mar 2026 10:00:00 GMT</pubDate><guid>1</guid></item>"
+        b"<item><title>Quarterly results</title><link>https://techcrunch.com/2</link>"
+        b"<description>Revenue was flat compared with the same quarter last year.</description>"
+        b"<pubDate>Mon, 02 Mar 2026 08:00:00 GMT</pubDate><guid>2</guid></item>"
+        b"</channel></rss>")
+
+
+def make_scraper() -> TechNewsScraperTool:
+    scraper = TechNewsScraperTool()
+    scraper.rate_limit_delay = 0
+    scraper.http_client = MagicMock()
+    scraper.feed_validators = MagicMock()
+    scraper.feed_validators.request_headers.return_value = {}
+    scraper._fetch_full_text = MagicMock(return_value="")
+    scraper._relevance_keywords = ()
+    scraper.high_water_marks = MagicMock()
+    scraper.high_water_marks.load.return_value = HighWaterMark()
+    scraper.dedup_index = MagicMock()
+    scraper.dedup_index.filter_new.side_effect = lambda documents, stage: documents
+    scraper.feed_stats = MagicMock()
+    scraper.feed_stats.due.side_effect = lambda urls: list(urls)
+    return scraper
+
+
+class TestTechNewsScraperTool:
+    """Tests for TechNewsScraperTool"""
+
+    def test_polls_only_due_feeds(self):
+        """Feeds not due are never fetched; every new entry counts towards the publish rate"""
+        scraper = make_scraper()
+        scraper.feed_stats.due.side_effect = lambda urls: [TECHCRUNCH]
+        scraper.http_client.get.return_value = MagicMock(status_code=200, content=FEED, headers={})
+
+        docs = scraper.scrape(topics=["smart port"], sources=['techcrunch', 'venturebeat'], days_back=3650)
+
+        assert [call.args[0] for call in scraper.http_client.get.call_args_list] == [TECHCRUNCH]
+        assert [doc['url'] for doc in docs] == ["https://techcrunch.com/1"]
+        [poll] = scraper.pending_polls
+        assert poll['url'] == TECHCRUNCH and len(poll['published']) == 2 and all(poll['published'])
+        scraper.feed_stats.record_poll.assert_not_called()  # Left to the handoff
+
+    def test_marks_kept_apart_from_rss_scraper(self):
+        """Marks use their own key, so the RSS scraper reading the same feed does not skip entries here"""
+        scraper = make_scraper()
+        scraper.http_client.get.return_value = MagicMock(status_code=200, content=FEED, headers={})
+
+        scraper.scrape(topics=["smart port"], sources=['techcrunch'], days_back=3650)
+
+        scraper.high_water_marks.load.assert_called_once_with(f"tech_news:{TECHCRUNCH}")
+        [mark] = scraper.pending_marks
+        assert mark['source'] == f"tech_news:{TECHCRUNCH}" and list(mark['entry_ids']) == ["1"]
+
+    def test_parsing_is_bounded_by_run_deadline(self):
+        scraper = make_scraper()
+        scraper.parse_pool = MagicMock()
+        scraper.parse_pool.run.side_effect = lambda fn, *args, deadline=None: fn(*args)
+        scraper.http_client.get.return_value = MagicMock(status_code=200, content=FEED, headers={})
+        deadline = Deadline.after(60)
+
+        scraper.run(deadline=deadline, topics=["smart port"], sources=['techcrunch'], days_back=3650)
+
+        assert scraper.parse_pool.run.call_args.kwargs['deadline'] is deadline
+
+    def test_not_modified_queues_empty_poll(self):
+        scraper = make_scraper()
+        scraper.http_client.get.return_value = MagicMock(status_code=304, content=b"")
+
+        assert scraper.scrape(sources=['techcrunch'], days_back=7) == []
+        assert [(poll['url'], poll['published']) for poll in scraper.pending_polls] == [(TECHCRUNCH, [])]
+
+    def test_async_polls_only_due_feeds(self):
+        scraper = make_scraper()
+        scraper.feed_stats.due.side_effect = lambda urls: []
+        scraper.async_http_client = MagicMock()
+
+        assert asyncio.run(scraper.ascrape(sources=['techcrunch', 'venturebeat'])) == []
+        scraper.async_http_client.get.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
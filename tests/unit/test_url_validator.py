@@ -0,0 +1,83 @@
+"""
+Tests for scrapers/utils/url_validator.py
+"""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scrapers.utils.url_validator import canonical_url, normalize_url
+
+
+class TestNormalizeUrl:
+    """Tests for normalize_url"""
+
+    @pytest.mark.parametrize("url", [
+        "https://example.com/news/1",
+        "https://example.com:443/news/1#comments",
+        "https://example.com/news/1?utm_source=rss&utm_medium=feed",
+        "https://example.com/news/1?fbclid=abc&gclid=def",
+        "  https://example.com/news/1  ",
+    ])
+    def test_cosmetic_variants_match(self, url):
+        assert normalize_url(url) == "https://example.com/news/1"
+
+    def test_meaningful_parts_are_kept(self):
+        assert normalize_url("https://example.com/News?id=2&page=") == "https://example.com/News?id=2&page="
+        assert normalize_url("https://example.com:8443/a") == "https://example.com:8443/a"
+        assert normalize_url("http://example.com:80/a") == "http://example.com/a"
+
+    @pytest.mark.parametrize("url", [
+        "http://example.com/news/1",
+        "https://www.example.com/news/1",
+        "https://example.com/news/1/",
+        "https://example.com//news/1",
+    ])
+    def test_scheme_host_and_path_are_kept_for_fetching(self, url):
+        """Sites may serve these differently, so they must not share a fetch or cache key"""
+        assert normalize_url(url) == url
+
+    def test_query_order_is_ignored(self):
+        assert normalize_url("https://example.com/?b=2&a=1") == normalize_url("https://example.com/?a=1&b=2")
+
+    @pytest.mark.parametrize("value", ["", None, "not a url", "mailto:news@example.com", "http://[::1"])
+    def test_non_urls_are_returned_unchanged(self, value):
+        assert normalize_url(value) == (value or '').strip()
+
+    def test_arxiv_versions_stay_distinct_for_fetching(self):
+        assert normalize_url("https://arxiv.org/abs/2401.01234v1") != normalize_url("https://arxiv.org/abs/2401.01234v2")
+
+
+class TestCanonicalUrl:
+    """Tests for canonical_url per-source rules"""
+
+    @pytest.mark.parametrize("url,expected", [
+        ("http://arxiv.org/abs/2401.01234v2", "https://arxiv.org/abs/2401.01234"),
+        ("https://export.arxiv.org/abs/2401.01234", "https://arxiv.org/abs/2401.01234"),
+        ("https://arxiv.org/pdf/2401.01234v1.pdf", "https://arxiv.org/abs/2401.01234"),
+        ("http://arxiv.org/abs/cs/0112017v1", "https://arxiv.org/abs/cs/0112017"),
+        ("http://arxiv.org/abs/math.GT/0309136v3", "https://arxiv.org/abs/math.GT/0309136"),
+        ("https://patents.google.com/patent/US1234567B2/en", "https://patents.google.com/patent/US1234567B2"),
+        ("https://patents.google.com/patent/us1234567b2/", "https://patents.google.com/patent/US1234567B2"),
+    ])
+    def test_source_rules(self, url, expected):
+        assert canonical_url(url) == expected
+
+    @pytest.mark.parametrize("url", [
+        "http://example.com/news/1",
+        "HTTPS://WWW.Example.COM/news/1/",
+        "https://example.com:443//news/1#comments",
+        "  https://example.com./news/1?utm_source=rss  ",
+    ])
+    def test_spellings_of_a_document_match(self, url):
+        assert canonical_url(url) == "https://example.com/news/1"
+
+    def test_other_urls_are_only_normalized(self):
+        url = "https://export.arxiv.org/api/query?search_query=all:port&utm_source=x"
+        assert canonical_url(url) == normalize_url(url)
+        assert canonical_url("https://www.lens.org/lens/patent/123/") == "https://lens.org/lens/patent/123"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,65 @@
+"""
+Deadline budgets for scraping runs
+A Deadline is an absolute wall-clock time, so it can travel through the
+graph state and be split into per-scraper sub-deadlines
+"""
+import time
+from typing import Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when work is started after its deadline has passed"""
+
+
+class Deadline:
+    """
+    Absolute deadline (epoch seconds)
+
+    Usage:
+        deadline = Deadline.after(3300)
+        scraper_deadline = deadline.sub(900)
+        timeout = scraper_deadline.cap(30)
+    """
+
+    def __init__(self, at: float):
+        self.at = at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Deadline seconds from now"""
+        return cls(time.time() + seconds)
+
+    def remaining(self) -> float:
+        """Seconds left (0 once expired)"""
+        return max(0.0, self.at - time.time())
+
+    def expired(self) -> bool:
+        return time.time() >= self.at
+
+    def sub(self, seconds: Optional[float] = None, reserve: float = 0) -> "Deadline":
+        """
+        Child deadline that never outlives this one
+
+        Args:
+            seconds: Budget of the child from now (None = rest of this deadline)
+            reserve: Seconds of this deadline to keep back for later work
+        """
+        at = self.at - reserve
+        if seconds is not None:
+            at = min(at, time.time() + seconds)
+        return Deadline(at)
+
+    def cap(self, timeout: Optional[float]) -> float:
+        """
+        Shrink a timeout so it ends by the deadline
+
+        Raises:
+            DeadlineExceeded: If the deadline has already passed
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded("Deadline exceeded")
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.1f}s)"